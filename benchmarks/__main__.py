@@ -0,0 +1,55 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+"""
+Run the offline benchmarks and write their results to a JSON file.
+"""
+import argparse
+import sys
+from itertools import chain
+from typing import List, Optional
+
+from . import bench_gates, bench_results, bench_submission
+from ._harness import compare, run, write
+
+SUITES = {
+    "submission": bench_submission,
+    "results": bench_results,
+    "gates": bench_gates,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--output", "-o", default="benchmarks.json", help="JSON file to write results to")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES), help="Suite to run (default: all)")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum duration of each sample, in seconds")
+    parser.add_argument("--quick", action="store_true", help="Run a small set of parameters, e.g. as a smoke test")
+    args = parser.parse_args(argv)
+
+    suites = [SUITES[name] for name in args.suite or sorted(SUITES)]
+    cases = chain.from_iterable(suite.cases(args.quick) for suite in suites)
+    results = run(cases, repeat=args.repeat, min_time=args.min_time, progress=lambda line: print(line, file=sys.stderr))
+    write(args.output, results)
+
+    if args.baseline is not None:
+        for line in compare(args.baseline, results):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
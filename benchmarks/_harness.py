@@ -0,0 +1,124 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+if sys.version_info < (3, 8):
+    from importlib_metadata import PackageNotFoundError, version
+else:
+    from importlib.metadata import PackageNotFoundError, version
+
+
+class Case(NamedTuple):
+    """A single benchmark: a function to time, named by what it measures and the parameters it was set up with."""
+
+    name: str
+    params: Dict[str, Any]
+    fn: Callable[[], Any]
+
+
+def measure(case: Case, *, repeat: int, min_time: float) -> Dict[str, Any]:
+    """
+    Time a case. The number of calls per sample is chosen so that each sample takes at least ``min_time`` seconds,
+    and timings are reported per call, in seconds.
+    """
+    timer = timeit.Timer(case.fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    samples = [elapsed / number] + [t / number for t in timer.repeat(repeat=repeat - 1, number=number)]
+    return {
+        "name": case.name,
+        "params": case.params,
+        "number": number,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+    }
+
+
+def run(
+    cases: Iterable[Case], *, repeat: int, min_time: float, progress: Optional[Callable[[str], None]] = None
+) -> List[Dict[str, Any]]:
+    results = []
+    for case in cases:
+        result = measure(case, repeat=repeat, min_time=min_time)
+        if progress is not None:
+            progress(f"{key(result)}: {result['median'] * 1e3:.3f} ms")
+        results.append(result)
+    return results
+
+
+def key(result: Dict[str, Any]) -> str:
+    """Identifies a benchmark across runs, e.g. for comparing results between commits."""
+    params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+    return f"{result['name']}[{params}]"
+
+
+def metadata() -> Dict[str, Any]:
+    versions = {}
+    for package in ["qiskit-rigetti", "qiskit-terra", "pyquil", "numpy"]:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": versions,
+    }
+
+
+def write(path: str, results: List[Dict[str, Any]]) -> None:
+    with open(path, "w") as f:
+        json.dump({"metadata": metadata(), "results": results}, f, indent=2)
+        f.write("\n")
+
+
+def compare(baseline_path: str, results: List[Dict[str, Any]]) -> List[str]:
+    """
+    Lines comparing the median time of each benchmark to that in a baseline results file, as new/old ratios.
+    """
+    with open(baseline_path) as f:
+        baseline = {key(result): result for result in json.load(f)["results"]}
+
+    lines = []
+    for result in results:
+        old = baseline.get(key(result))
+        if old is not None:
+            lines.append(f"{key(result)}: {result['median'] / old['median']:.2f}x")
+    return lines
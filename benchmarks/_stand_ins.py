@@ -0,0 +1,92 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+import networkx as nx
+import numpy as np
+from pyquil import Program
+from pyquil.external.rpcq import CompilerISA
+from pyquil.quantum_processor import NxQuantumProcessor
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+from qiskit_rigetti import RigettiQCSBackend, RigettiQCSJob, RigettiQCSProvider
+
+
+class StandInCompiler:
+    """Compiler which returns programs unchanged, so that timings exclude quilc."""
+
+    def quil_to_native_quil(self, program: Program, *, protoquil: Any = None) -> Program:
+        return program
+
+    def native_quil_to_executable(self, program: Program) -> Program:
+        return program
+
+
+class StandInQAM:
+    """
+    QAM whose response to executing a program is the program itself, and whose results are random readout data with
+    the program's shape. Readout data is generated once per shape, so that timings exclude it.
+    """
+
+    def __init__(self) -> None:
+        self._rng = np.random.default_rng(seed=0)
+        self._readouts: Dict[Tuple[int, int], "np.ndarray[Any, Any]"] = {}
+
+    def execute(self, executable: Program) -> Program:
+        return executable
+
+    def get_result(self, response: Program) -> SimpleNamespace:
+        shape = (response.num_shots, response.declarations["ro"].memory_size)
+        if shape not in self._readouts:
+            self._readouts[shape] = self._rng.integers(0, 2, size=shape, dtype=np.int8)
+        return SimpleNamespace(readout_data={"ro": self._readouts[shape]})
+
+
+class StandInQuantumComputer:
+    """Quantum computer made of the stand-in compiler and QAM, with a fully connected ISA."""
+
+    def __init__(self, num_qubits: int) -> None:
+        self.num_qubits = num_qubits
+        self.compiler = StandInCompiler()
+        self.qam = StandInQAM()
+
+    def to_compiler_isa(self) -> CompilerISA:
+        return NxQuantumProcessor(nx.complete_graph(self.num_qubits)).to_compiler_isa()
+
+
+def make_backend(num_qubits: int) -> RigettiQCSBackend:
+    """A simulator backend which runs against a :class:`StandInQuantumComputer`."""
+    backend = RigettiQCSProvider().get_simulator(num_qubits=num_qubits)
+    # NOTE: Set before first use, so the backend never calls get_qc
+    backend._qc = StandInQuantumComputer(num_qubits)
+    return backend
+
+
+def make_job(backend: RigettiQCSBackend, circuits: List[QuantumCircuit], **options: Any) -> RigettiQCSJob:
+    return backend.run(circuits, **{"shots": 1000, **options})
+
+
+def make_circuit(width: int, depth: int, *, readout: str = "ro") -> QuantumCircuit:
+    """A circuit of ``depth`` layers of single-qubit rotations and entangling gates, measuring every qubit."""
+    circuit = QuantumCircuit(QuantumRegister(width, "q"), ClassicalRegister(width, readout))
+    for layer in range(depth):
+        for q in range(width):
+            circuit.rx(0.1 * (layer + 1), q)
+        for q in range(layer % 2, width - 1, 2):
+            circuit.cz(q, q + 1)
+    circuit.measure(range(width), range(width))
+    return circuit
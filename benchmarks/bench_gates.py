@@ -0,0 +1,57 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+"""Benchmarks for constructing Quil gates and circuits of them."""
+from typing import Iterator
+
+import numpy as np
+
+from qiskit_rigetti import QuilCircuit
+from qiskit_rigetti.gates import CanonicalGate, CPhase00Gate, PSwapGate, XYGate
+
+from ._harness import Case
+
+
+def cases(quick: bool) -> Iterator[Case]:
+    counts = [100] if quick else [1000, 10000]
+    rng = np.random.default_rng(seed=0)
+
+    for count in counts:
+        angles = rng.uniform(0, 2 * np.pi, size=count).tolist()
+        params = {"count": count}
+        for gate_class in [XYGate, PSwapGate, CPhase00Gate]:
+            yield Case(f"gates.{gate_class.__name__}", params, lambda g=gate_class, a=angles: [g(theta) for theta in a])
+        yield Case("gates.CanonicalGate", params, lambda a=angles: [CanonicalGate(t, t, t) for t in a])
+        yield Case("gates.XYGate.to_matrix", params, lambda a=angles: [XYGate(t).to_matrix() for t in a])
+        yield Case(
+            "gates.XYGate.to_matrix.repeated_angle", params, lambda a=angles: [XYGate(0.5).to_matrix() for _ in a]
+        )
+
+        num_qubits = count + 1
+        pairs = np.array([(q, q + 1) for q in range(count)])
+
+        def append(a=angles, p=pairs.tolist(), n=num_qubits):
+            circuit = QuilCircuit(n)
+            for theta, (q1, q2) in zip(a, p):
+                circuit.xy(theta, q1, q2)
+            return circuit
+
+        def layer(a=angles, p=pairs, n=num_qubits):
+            circuit = QuilCircuit(n)
+            circuit.xy_layer(a, p)
+            return circuit
+
+        yield Case("quil_circuit.xy", params, append)
+        yield Case("quil_circuit.xy_layer", params, layer)
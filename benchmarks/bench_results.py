@@ -0,0 +1,66 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+"""Benchmarks for converting readout to results."""
+from typing import Iterator
+
+import numpy as np
+from pyquil import Program
+
+from qiskit_rigetti._qcs_job import _Execution
+from qiskit_rigetti._readout import to_binary_strs
+
+from ._harness import Case
+from ._stand_ins import make_backend, make_circuit, make_job
+
+
+def cases(quick: bool) -> Iterator[Case]:
+    widths = [4] if quick else [4, 16, 64]
+    shot_counts = [100] if quick else [1000, 10000, 100000]
+    batch_sizes = [2] if quick else [10, 100, 1000]
+    rng = np.random.default_rng(seed=0)
+
+    for width in widths:
+        for shots in shot_counts:
+            states = rng.integers(0, 2, size=(shots, width), dtype=np.int8)
+            params = {"width": width, "shots": shots}
+            yield Case("readout.to_binary_strs", params, lambda s=states: to_binary_strs(s))
+
+    for width in widths:
+        backend = make_backend(width)
+        for shots in shot_counts:
+            job = make_job(backend, [make_circuit(width, 1)], shots=shots)
+            job.result()
+            response = Program(f"DECLARE ro BIT[{width}]").wrap_in_numshots_loop(shots)
+            params = {"width": width, "shots": shots}
+            # NOTE: A new execution each time, as each retrieves its readout once
+            yield Case(
+                "job.get_experiment_result",
+                params,
+                lambda j=job, r=response, s=shots: j._get_experiment_result(0, _Execution([r], s)),
+            )
+
+    for batch_size in batch_sizes:
+        width = widths[0]
+        backend = make_backend(width)
+        job = make_job(backend, [make_circuit(width, 1) for _ in range(batch_size)], shots=100)
+        job.result()
+        params = {"width": width, "batch_size": batch_size, "shots": 100}
+
+        def result(j=job):
+            j._result = None
+            return j.result()
+
+        yield Case("job.result", params, result)
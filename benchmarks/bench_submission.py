@@ -0,0 +1,55 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+"""Benchmarks for preparing, translating and submitting circuits, excluding the compiler."""
+from typing import Iterator
+
+from qiskit_rigetti._qcs_backend import _PreparedCircuits, _prepare_circuit
+
+from ._harness import Case
+from ._stand_ins import make_backend, make_circuit, make_job
+
+
+def cases(quick: bool) -> Iterator[Case]:
+    widths = [4] if quick else [4, 16, 64]
+    depths = [4] if quick else [10, 100]
+    batch_sizes = [2] if quick else [1, 10, 100]
+
+    for width in widths:
+        for depth in depths:
+            for readout in ["ro", "c"]:
+                circuit = make_circuit(width, depth, readout=readout)
+                params = {"width": width, "depth": depth, "readout": readout}
+                yield Case("backend.prepare_circuit", params, lambda c=circuit: _prepare_circuit(c))
+
+                prepared_circuits = _PreparedCircuits()
+                prepared_circuits.prepare(circuit)
+                yield Case("backend.prepare_circuit.memoized", params, lambda c=circuit: prepared_circuits.prepare(c))
+
+    for width in widths:
+        backend = make_backend(width)
+        # NOTE: A job with no circuits submits nothing itself, but can start circuits on demand
+        job = make_job(backend, [])
+        for depth in depths:
+            circuit = make_circuit(width, depth)
+            params = {"width": width, "depth": depth, "shots": 1000}
+            yield Case("job.start_circuit", params, lambda c=circuit: job._start_circuit(c))
+
+    for batch_size in batch_sizes:
+        width = widths[0]
+        backend = make_backend(width)
+        circuits = [make_circuit(width, depths[0]) for _ in range(batch_size)]
+        params = {"width": width, "depth": depths[0], "batch_size": batch_size, "shots": 1000}
+        yield Case("backend.run", params, lambda c=circuits: make_job(backend, c).result())
@@ -19,6 +19,9 @@ from ._quil_circuit import QuilCircuit
 from ._qcs_backend import RigettiQCSBackend
 from ._qcs_job import RigettiQCSJob
 from ._qcs_provider import RigettiQCSProvider
+from ._executable_cache import ExecutableCache, DiskExecutableCache
+from ._device_catalog import DeviceCatalog
+from ._native_quil import NativeQuilChecker
 
 if sys.version_info < (3, 8):
     from importlib_metadata import version  # pragma: nocover
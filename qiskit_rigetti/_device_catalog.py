@@ -0,0 +1,180 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import hashlib
+import json
+import os
+import tempfile
+import time
+import warnings
+from contextlib import ExitStack
+from threading import Lock, Thread
+from typing import Any, Dict, Optional, Tuple, cast
+
+import httpx
+from qcs_api_client.client import build_sync_client, QCSClientConfiguration
+
+DEVICES_URL = "https://forest-server.qcs.rigetti.com/devices"
+
+
+class DeviceCatalog:
+    """
+    TTL cache of the quantum processors available through QCS, which may be shared by several
+    :class:`RigettiQCSProvider` instances. The catalog makes its requests with the client configuration (and so the
+    credentials) it was created with, so it should only be shared by providers with the same configuration.
+
+    Once the catalog is older than its TTL, the stale catalog continues to be returned while it is refreshed in the
+    background; only a lookup with no catalog at all (in memory or on disk) waits for a request to complete.
+    """
+
+    _shared: Dict[str, "DeviceCatalog"] = {}
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        *,
+        client_configuration: Optional[QCSClientConfiguration] = None,
+        ttl: float = 300.0,
+        path: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            client_configuration: QCS client configuration. If one is not provided, a default will be loaded.
+            ttl: Time after which the catalog is refreshed, in seconds.
+            path: Path of a JSON file in which to persist the catalog, so that new processes can start from it. Missing
+                parent directories are created.
+        """
+        self._client_configuration = client_configuration or QCSClientConfiguration.load()
+        self._ttl = ttl
+        self._path = path
+        self._lock = Lock()
+        self._entry: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._refreshing = False
+        self._client_stack = ExitStack()
+        self._client: Optional[httpx.Client] = None
+
+        if path is not None:
+            self._entry = self._load()
+
+    @classmethod
+    def shared(cls, client_configuration: QCSClientConfiguration) -> "DeviceCatalog":
+        """
+        Get the catalog shared by every provider in this process with the same QCS profile settings and credentials,
+        creating it with default settings on first use. Providers with different credentials never share a catalog.
+        """
+        with cls._shared_lock:
+            key = _shared_key(client_configuration)
+            if key not in cls._shared:
+                cls._shared[key] = cls(client_configuration=client_configuration)
+            return cls._shared[key]
+
+    def get(self) -> Dict[str, Any]:
+        """
+        Get the available quantum processors, keyed by name. Triggers a background refresh if the catalog is stale.
+        """
+        with self._lock:
+            entry = self._entry
+            stale = entry is None or time.time() - entry[0] >= self._ttl
+            refresh_in_background = stale and entry is not None and not self._refreshing
+            if refresh_in_background:
+                self._refreshing = True
+
+        if entry is None:
+            return self.refresh()
+        if refresh_in_background:
+            Thread(target=self._refresh_in_background, name="device-catalog-refresh", daemon=True).start()
+        return entry[1]
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Fetch the available quantum processors now, replacing the cached (and persisted) catalog.
+        """
+        response = self._get_client().get(DEVICES_URL)
+        response.raise_for_status()
+        devices = cast(Dict[str, Any], response.json()["devices"])
+        entry = (time.time(), devices)
+
+        with self._lock:
+            self._entry = entry
+        if self._path is not None:
+            self._save(entry)
+        return devices
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            warnings.warn(f"Failed to refresh the device catalog; continuing to use the stale one: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _get_client(self) -> httpx.Client:
+        # NOTE: One client (and so one connection pool) is kept for the lifetime of the catalog
+        with self._lock:
+            if self._client is None:
+                self._client = self._client_stack.enter_context(
+                    build_sync_client(configuration=self._client_configuration)
+                )
+            return self._client
+
+    def _load(self) -> Optional[Tuple[float, Dict[str, Any]]]:
+        assert self._path is not None
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+            return float(data["fetched_at"]), cast(Dict[str, Any], data["devices"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save(self, entry: Tuple[float, Dict[str, Any]]) -> None:
+        assert self._path is not None
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        # NOTE: Each save writes a file of its own, so that concurrent saves (from other threads or processes) never
+        # write to the same temporary file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, prefix=f"{os.path.basename(self._path)}.", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump({"fetched_at": entry[0], "devices": entry[1]}, f)
+        try:
+            # NOTE: Replacing the file atomically means concurrent readers never see a partial catalog
+            os.replace(tmp_path, self._path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+
+    def close(self) -> None:
+        """
+        Close the catalog's HTTP client. A new one is created if the catalog is used again.
+        """
+        with self._lock:
+            self._client_stack.close()
+            self._client = None
+
+
+def _shared_key(client_configuration: QCSClientConfiguration) -> str:
+    """
+    Key identifying the QCS profile settings and credentials of a client configuration, hashed so that the catalogs
+    shared between providers are not keyed by secrets.
+    """
+    profile = client_configuration.profile
+    credentials = client_configuration.secrets.credentials.get(profile.credentials_name)
+    identity = {
+        "profile": json.loads(profile.json()),
+        "refresh_token": credentials.refresh_token if credentials is not None else None,
+    }
+    return hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
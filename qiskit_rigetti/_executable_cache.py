@@ -0,0 +1,291 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Iterator, Optional, Tuple
+
+import pyquil
+from pyquil.api import QuantumComputer
+
+
+class ExecutableCache:
+    """
+    In-memory, content-addressed LRU cache of compilation results, shared by the jobs of a :class:`RigettiQCSBackend`.
+
+    Entries are evicted least-recently-used first once either the entry limit or the size limit is exceeded.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, max_size: int = 64 * 1024 * 1024) -> None:
+        """
+        Args:
+            max_entries: Maximum number of entries to hold.
+            max_size: Maximum total size of entries to hold, in bytes of program text.
+        """
+        self._max_entries = max_entries
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """
+        Build a cache key from the given parts (e.g. program text, backend name, shot count).
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get the value for a key, marking it as most recently used, or ``None`` if it is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, size: int) -> None:
+        """
+        Store a value, evicting least recently used entries as needed. Values larger than the size limit are not
+        stored.
+        """
+        if size > self._max_size:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+
+            self._entries[key] = (value, size)
+            self._size += size
+
+            while len(self._entries) > self._max_entries or self._size > self._max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries. Counters are left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that found a cached value."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that did not find a cached value."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries evicted to satisfy the entry or size limit."""
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        """Total size of cached entries, in bytes of program text."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskExecutableCache:
+    """
+    SQLite-backed cache of compilation results which persists across processes, and may be shared by several processes
+    at once.
+
+    Each entry records a fingerprint of the environment it was compiled in (device ISA, pyQuil and quilc versions). An
+    entry whose fingerprint does not match the current one is dropped rather than returned. Entries are evicted
+    least-recently-used first once the size limit is exceeded.
+
+    Warning:
+        Entries are stored with :mod:`pickle`, so only point this at a file that is not writable by untrusted users.
+    """
+
+    def __init__(self, path: str, *, max_size: int = 512 * 1024 * 1024, timeout: float = 30.0) -> None:
+        """
+        Args:
+            path: Path of the SQLite database file. Missing parent directories are created.
+            max_size: Maximum total size of entries to hold, in bytes of serialized data.
+            timeout: Time to wait for another process to release the database, in seconds.
+        """
+        self._path = path
+        self._max_size = max_size
+        self._timeout = timeout
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # NOTE: connections are not shared between threads, so open one per operation
+        conn = sqlite3.connect(self._path, timeout=self._timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str, fingerprint: str) -> Optional[Any]:
+        """
+        Get the value for a key if it was stored with the given fingerprint, or ``None`` otherwise.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT fingerprint, value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[0] == fingerprint:
+                conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            elif row is not None:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+        with self._lock:
+            if row is None or row[0] != fingerprint:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return pickle.loads(row[1])
+
+    def put(self, key: str, fingerprint: str, value: Any) -> None:
+        """
+        Store a value, evicting least recently used entries as needed. Values larger than the size limit are not
+        stored.
+        """
+        data = pickle.dumps(value)
+        if len(data) > self._max_size:
+            return
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, fingerprint, value, size, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, fingerprint, data, len(data), time.time()),
+            )
+
+            (total_size,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            if total_size <= self._max_size:
+                return
+
+            evicted = []
+            for evicted_key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+                if total_size <= self._max_size:
+                    break
+                evicted.append((evicted_key,))
+                total_size -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+        with self._lock:
+            self._evictions += len(evicted)
+
+    def clear(self) -> None:
+        """
+        Remove all entries. Counters are left untouched.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups in this process that found a cached value."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups in this process that did not find a cached value."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of entries evicted by this process to satisfy the size limit."""
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        """Total size of cached entries, in bytes of serialized data."""
+        with self._connect() as conn:
+            (size,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return int(size)
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(count)
+
+
+class CompilerFingerprint:
+    """
+    Fingerprint of everything besides the program that determines compilation output on a quantum computer: the device
+    ISA and the pyQuil and quilc versions, as recorded with :class:`DiskExecutableCache` entries.
+
+    It is computed the first time it is needed, which costs a round trip to the compiler, and then kept; share one per
+    quantum computer so that jobs do not each pay for it.
+    """
+
+    def __init__(self, qc: QuantumComputer) -> None:
+        """
+        Args:
+            qc: Quantum computer whose compilation environment to fingerprint.
+        """
+        self._qc = qc
+        self._value: Optional[str] = None
+        self._lock = Lock()
+
+    def get(self) -> str:
+        """
+        Get the fingerprint, computing it on first use.
+        """
+        with self._lock:
+            if self._value is None:
+                isa = self._qc.quantum_processor.to_compiler_isa().json(sort_keys=True)
+                versions = json.dumps(
+                    {"pyquil": pyquil.__version__, **self._qc.compiler.get_version_info()},
+                    sort_keys=True,
+                )
+                self._value = ExecutableCache.key(isa, versions)
+            return self._value
@@ -0,0 +1,84 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+from typing import List, Sequence, Tuple
+
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+
+def can_multiplex(circuit: QuantumCircuit) -> bool:
+    """
+    Whether or not a circuit can share a program with others, which requires all of its classical bits to be in its
+    "ro" register.
+    """
+    return len(circuit.cregs) == 1 and circuit.cregs[0].name == "ro" and circuit.cregs[0].size == circuit.num_clbits
+
+
+def pack_circuits(circuits: Sequence[QuantumCircuit], max_qubits: int) -> List[List[int]]:
+    """
+    Group circuits into packs whose qubits sum to at most ``max_qubits``, first-fit in order. Circuits which cannot be
+    multiplexed, or which are too large to share a program, are packed on their own.
+
+    Returns:
+        The indices of the circuits in each pack.
+    """
+    packs: List[List[int]] = []
+    free_qubits: List[int] = []
+    for idx, circuit in enumerate(circuits):
+        if can_multiplex(circuit):
+            for pack_idx, free in enumerate(free_qubits):
+                if circuit.num_qubits <= free:
+                    packs[pack_idx].append(idx)
+                    free_qubits[pack_idx] -= circuit.num_qubits
+                    break
+            else:
+                packs.append([idx])
+                free_qubits.append(max(max_qubits - circuit.num_qubits, 0))
+        else:
+            packs.append([idx])
+            free_qubits.append(0)
+    return packs
+
+
+def combine_circuits(circuits: Sequence[QuantumCircuit]) -> Tuple[QuantumCircuit, List[slice]]:
+    """
+    Combine circuits onto disjoint qubits of one circuit, whose "ro" register is the concatenation of theirs.
+
+    Returns:
+        The combined circuit, and the slice of its "ro" register holding each circuit's readout.
+    """
+    num_qubits = sum(circuit.num_qubits for circuit in circuits)
+    num_clbits = sum(circuit.num_clbits for circuit in circuits)
+    combined = QuantumCircuit(
+        QuantumRegister(num_qubits, "q"),
+        ClassicalRegister(num_clbits, "ro"),
+        name="+".join(str(circuit.name) for circuit in circuits),
+    )
+
+    readout_slices = []
+    qubit_offset = 0
+    clbit_offset = 0
+    for circuit in circuits:
+        combined.compose(
+            circuit,
+            qubits=range(qubit_offset, qubit_offset + circuit.num_qubits),
+            clbits=range(clbit_offset, clbit_offset + circuit.num_clbits),
+            inplace=True,
+        )
+        readout_slices.append(slice(clbit_offset, clbit_offset + circuit.num_clbits))
+        qubit_offset += circuit.num_qubits
+        clbit_offset += circuit.num_clbits
+
+    return combined, readout_slices
@@ -0,0 +1,208 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+from threading import Lock
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pyquil import Program
+from pyquil.api import QuantumComputer
+from pyquil.external.rpcq import CompilerISA, GateInfo
+from pyquil.quilatom import Qubit
+from pyquil.quilbase import (
+    AbstractInstruction,
+    ArithmeticBinaryOp,
+    ClassicalComparison,
+    ClassicalConvert,
+    ClassicalExchange,
+    ClassicalLoad,
+    ClassicalMove,
+    ClassicalStore,
+    Declare,
+    Gate,
+    Halt,
+    Jump,
+    JumpConditional,
+    JumpTarget,
+    LogicalBinaryOp,
+    Measurement,
+    Nop,
+    Pragma,
+    Reset,
+    ResetQubit,
+    UnaryClassicalInstruction,
+    Wait,
+)
+
+# Instructions which do not act on qubits, and so are native on any quantum processor
+_ALWAYS_NATIVE = (
+    ArithmeticBinaryOp,
+    ClassicalComparison,
+    ClassicalConvert,
+    ClassicalExchange,
+    ClassicalLoad,
+    ClassicalMove,
+    ClassicalStore,
+    Declare,
+    Halt,
+    Jump,
+    JumpConditional,
+    JumpTarget,
+    LogicalBinaryOp,
+    Nop,
+    Pragma,
+    Reset,
+    UnaryClassicalInstruction,
+    Wait,
+)
+
+# Gate parameters, each either a fixed angle or None for any value
+_Parameters = Tuple[Optional[float], ...]
+
+
+class _NativeGates:
+    def __init__(self, isa: CompilerISA) -> None:
+        self.qubits: FrozenSet[int] = frozenset(int(q) for q, qubit in isa.qubits.items() if not qubit.dead)
+        self.measurable: FrozenSet[int] = frozenset(
+            int(q)
+            for q, qubit in isa.qubits.items()
+            if not qubit.dead and any(g.operator == "MEASURE" for g in qubit.gates)
+        )
+
+        self.gates: Dict[Tuple[int, ...], Dict[str, List[_Parameters]]] = {}
+        for q, qubit in isa.qubits.items():
+            if not qubit.dead:
+                self.gates[(int(q),)] = _gate_table(qubit.gates)
+        for edge in isa.edges.values():
+            if not edge.dead:
+                self.gates[tuple(sorted(edge.ids))] = _gate_table(edge.gates)
+
+
+def _gate_table(gates: Sequence[Any]) -> Dict[str, List[_Parameters]]:
+    table: Dict[str, List[_Parameters]] = {}
+    for gate in gates:
+        if isinstance(gate, GateInfo) and gate.operator is not None:
+            parameters = tuple(p if isinstance(p, (int, float)) else None for p in gate.parameters)
+            table.setdefault(gate.operator, []).append(parameters)
+    return table
+
+
+class NativeQuilChecker:
+    """
+    Checks locally whether a program is already native Quil for a quantum computer, i.e. whether each of its gates is
+    in the ISA for the qubit or edge it acts on, so that recompilation can be skipped.
+
+    The check is conservative: programs with anything it does not recognize (e.g. gate definitions, modifiers or
+    Quil-T) are reported as not native. The ISA is read from the quantum computer on first use and kept.
+    """
+
+    def __init__(self, qc: QuantumComputer) -> None:
+        """
+        Args:
+            qc: Quantum computer whose ISA to check against.
+        """
+        self._qc = qc
+        self._native_gates: Optional[_NativeGates] = None
+        self._lock = Lock()
+        self._checks = 0
+        self._native = 0
+        self._compilation_checks = 0
+        self._skipped_compilations = 0
+
+    def _get_native_gates(self) -> _NativeGates:
+        with self._lock:
+            if self._native_gates is None:
+                self._native_gates = _NativeGates(self._qc.to_compiler_isa())
+            return self._native_gates
+
+    def _is_native(self, program: Program) -> bool:
+        native_gates = self._get_native_gates()
+        return len(program.defined_gates) == 0 and all(
+            _is_native_instruction(instruction, native_gates) for instruction in program.instructions
+        )
+
+    def is_native(self, program: Program) -> bool:
+        """
+        Whether or not the program is native Quil for the quantum computer, so that recompiling it can be skipped.
+        Counted by :attr:`checks` and :attr:`native`.
+        """
+        native = self._is_native(program)
+        with self._lock:
+            self._checks += 1
+            if native:
+                self._native += 1
+        return native
+
+    def can_skip_compilation(self, program: Program) -> bool:
+        """
+        Whether or not the program is native Quil for the quantum computer, so that compiling it can be skipped
+        altogether. Counted by :attr:`compilation_checks` and :attr:`skipped_compilations`, separately from
+        :func:`is_native`.
+        """
+        native = self._is_native(program)
+        with self._lock:
+            self._compilation_checks += 1
+            if native:
+                self._skipped_compilations += 1
+        return native
+
+    @property
+    def checks(self) -> int:
+        """Number of programs checked before recompilation."""
+        return self._checks
+
+    @property
+    def native(self) -> int:
+        """Number of programs found to be native, whose recompilation was skipped."""
+        return self._native
+
+    @property
+    def compilation_checks(self) -> int:
+        """Number of programs checked before compilation."""
+        return self._compilation_checks
+
+    @property
+    def skipped_compilations(self) -> int:
+        """Number of programs found to be native before compilation, which were not sent to the compiler."""
+        return self._skipped_compilations
+
+
+def _is_native_instruction(instruction: AbstractInstruction, native_gates: _NativeGates) -> bool:
+    if isinstance(instruction, _ALWAYS_NATIVE):
+        return True
+    if isinstance(instruction, ResetQubit):
+        return isinstance(instruction.qubit, Qubit) and instruction.qubit.index in native_gates.qubits
+    if isinstance(instruction, Measurement):
+        return isinstance(instruction.qubit, Qubit) and instruction.qubit.index in native_gates.measurable
+    if isinstance(instruction, Gate):
+        return _is_native_gate(instruction, native_gates)
+    return False
+
+
+def _is_native_gate(gate: Gate, native_gates: _NativeGates) -> bool:
+    if gate.modifiers or not all(isinstance(q, Qubit) for q in gate.qubits):
+        return False
+
+    qubits = tuple(sorted(q.index for q in gate.qubits))
+    if len(set(qubits)) != len(qubits):
+        return False
+
+    for parameters in native_gates.gates.get(qubits, {}).get(gate.name, []):
+        if len(parameters) == len(gate.params) and all(
+            expected is None or (isinstance(actual, (int, float)) and bool(np.isclose(actual, expected)))
+            for expected, actual in zip(parameters, gate.params)
+        ):
+            return True
+    return False
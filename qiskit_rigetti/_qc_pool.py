@@ -0,0 +1,111 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import time
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from pyquil import get_qc
+from pyquil.api import QuantumComputer, EngagementManager
+from qcs_api_client.client import QCSClientConfiguration
+
+_Key = Tuple[str, float, float]
+
+
+class _PoolEntry:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.qc: Optional[QuantumComputer] = None
+        self.refs = 0
+        self.idle_since = time.monotonic()
+
+
+class QuantumComputerPool:
+    """
+    Reference-counted pool of :class:`QuantumComputer` objects, so that backends for the same target share compiler
+    and QAM clients rather than each calling ``get_qc``.
+
+    Quantum computers are keyed by name (which includes whether or not a QVM is noisy) and timeouts. One which has had
+    no references for longer than the idle timeout is evicted the next time the pool is used.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_configuration: QCSClientConfiguration,
+        engagement_manager: EngagementManager,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        """
+        Args:
+            client_configuration: QCS client configuration.
+            engagement_manager: QPU engagement manager.
+            idle_timeout: Time after which a quantum computer with no references is evicted, in seconds.
+        """
+        self._client_configuration = client_configuration
+        self._engagement_manager = engagement_manager
+        self._idle_timeout = idle_timeout
+        self._entries: Dict[_Key, _PoolEntry] = {}
+        self._lock = Lock()
+
+    def acquire(self, name: str, *, compiler_timeout: float, execution_timeout: float) -> QuantumComputer:
+        """
+        Get a reference to the quantum computer with the given name and timeouts, creating it if it is not pooled.
+        Each call must be matched by a call to :func:`release` with the same arguments.
+        """
+        key = (name, compiler_timeout, execution_timeout)
+        with self._lock:
+            self._evict_idle()
+            entry = self._entries.setdefault(key, _PoolEntry())
+            entry.refs += 1
+
+        try:
+            # NOTE: Only creation of this key waits on get_qc, not the whole pool
+            with entry.lock:
+                if entry.qc is None:
+                    entry.qc = get_qc(
+                        name,
+                        compiler_timeout=compiler_timeout,
+                        execution_timeout=execution_timeout,
+                        client_configuration=self._client_configuration,
+                        engagement_manager=self._engagement_manager,
+                    )
+                return entry.qc
+        except Exception:
+            self.release(name, compiler_timeout=compiler_timeout, execution_timeout=execution_timeout)
+            raise
+
+    def release(self, name: str, *, compiler_timeout: float, execution_timeout: float) -> None:
+        """
+        Release a reference acquired with :func:`acquire`.
+        """
+        with self._lock:
+            entry = self._entries.get((name, compiler_timeout, execution_timeout))
+            if entry is None or entry.refs == 0:
+                return
+            entry.refs -= 1
+            if entry.refs == 0:
+                entry.idle_since = time.monotonic()
+            self._evict_idle()
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        idle = [k for k, e in self._entries.items() if e.refs == 0 and now - e.idle_since >= self._idle_timeout]
+        for key in idle:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
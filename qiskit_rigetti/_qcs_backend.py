@@ -13,7 +13,10 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
-from typing import Optional, Any, Union, List
+import weakref
+from functools import partial
+from threading import Lock
+from typing import Optional, Any, Union, List, Dict, Tuple
 from uuid import uuid4
 
 from pyquil import get_qc
@@ -23,69 +26,170 @@ from qiskit import QuantumCircuit, ClassicalRegister
 from qiskit.circuit import Measure
 from qiskit.providers import BackendV1, Options, Provider
 from qiskit.providers.models import QasmBackendConfiguration
+from qiskit.transpiler import Target
 
-from ._qcs_job import RigettiQCSJob
+from ._executable_cache import CompilerFingerprint, DiskExecutableCache, ExecutableCache
+from ._native_quil import NativeQuilChecker
+from ._qc_pool import QuantumComputerPool
+from ._qcs_job import RigettiQCSJob, check_qasm_hooks, compiles_via_qasm, run_blocking
+from ._quil_translator import is_translatable
+from ._target import physical_qubits, target_from_isa
+from .hooks.pre_compilation import as_program_hooks, supports_qasm
 
+# Values of the "compile" run option
+_COMPILE_MODES = ("always", "auto", "skip")
 
-def _prepare_readouts(circuit: QuantumCircuit) -> None:
+
+def _readout_register(circuit: QuantumCircuit) -> ClassicalRegister:
     """
-    Errors if measuring into more than one readout. If only measuring one, ensures its name is 'ro'. Mutates the input
-    circuit.
+    The register the circuit measures into. Errors if measuring into more than one register, or into none.
     """
+    measured = {
+        clbit
+        for instruction in circuit.data
+        if isinstance(instruction.operation, Measure)
+        for clbit in instruction.clbits
+    }
 
-    # cache register locations for each bit in circuit
-    bit_info = {bit: {"reg": reg, "idx": i} for reg in circuit.cregs for i, bit in enumerate(reg)}
-
-    # NOTE: each measure is a tuple of the form (measure, qubits, classical bits)
-    measures = [d for d in circuit.data if isinstance(d[0], Measure)]
-    readout_names = list({bit_info[clbit]["reg"].name for m in measures for clbit in m[2]})
-    num_readouts = len(readout_names)
+    # NOTE: A bit in more than one register is attributed to the last of them
+    registers = {bit: reg for reg in circuit.cregs for bit in reg if bit in measured}
+    readouts = {reg.name: reg for reg in registers.values()}
 
-    if num_readouts == 0:
+    if len(readouts) == 0:
         raise RuntimeError("Circuit has no measurements")
 
-    if num_readouts > 1:
-        readout_names.sort()
+    if len(readouts) > 1:
         raise RuntimeError(
-            f"Multiple readout registers are unsupported on QCSBackend; found {', '.join(readout_names)}"
+            f"Multiple readout registers are unsupported on QCSBackend; found {', '.join(sorted(readouts))}"
         )
 
-    orig_readout_name = readout_names[0]
-    if orig_readout_name == "ro":
-        return
+    return next(iter(readouts.values()))
+
+
+def _rename_readout(circuit: QuantumCircuit, readout: ClassicalRegister) -> QuantumCircuit:
+    """
+    Returns a copy of the circuit whose readout register is named 'ro', with its instructions referring to the renamed
+    register's bits.
+    """
+    ro = ClassicalRegister(size=readout.size, name="ro")
+    bits = dict(zip(readout, ro))
+
+    renamed = QuantumCircuit(
+        list(circuit.qubits),
+        [bits.get(bit, bit) for bit in circuit.clbits],
+        *circuit.qregs,
+        *(ro if reg == readout else reg for reg in circuit.cregs),
+        name=circuit.name,
+        global_phase=circuit.global_phase,
+        metadata=circuit.metadata,
+    )
+    renamed.calibrations = circuit.calibrations
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        condition = getattr(operation, "condition", None)
+        if condition is not None and (condition[0] == readout or condition[0] in bits):
+            operation = operation.copy()
+            operation.condition = (ro if condition[0] == readout else bits[condition[0]], condition[1])
+        renamed._append(
+            instruction.replace(operation=operation, clbits=tuple(bits.get(bit, bit) for bit in instruction.clbits))
+        )
 
-    for i, reg in enumerate(circuit.cregs):
-        if reg.name != orig_readout_name:
-            continue
+    return renamed
 
-        # rename register to "ro"
-        ro_reg = ClassicalRegister(size=reg.size, name="ro")
-        circuit.cregs[i] = ro_reg
 
-        # fix classical bit references in circuit
-        for i, clbit in enumerate(circuit.clbits):
-            orig_reg = bit_info[clbit]["reg"]
-            if orig_reg.name == orig_readout_name:
-                idx = bit_info[clbit]["idx"]
-                circuit.clbits[i] = ro_reg[idx]
+def _can_compile_parametric(circuits: List[QuantumCircuit], options: Dict[str, Any]) -> bool:
+    """
+    Whether or not the circuits can be compiled once and executed per parameter binding. This requires translating the
+    circuits directly to Quil, so it is unavailable when compiling by way of OpenQASM (e.g. with string pre-compilation
+    hooks).
+    """
+    return not compiles_via_qasm(options) and all(is_translatable(circuit) for circuit in circuits)
+
+
+def _bind_parameters(circuit: QuantumCircuit, binding_idx: int, binding: Dict[Any, Any]) -> QuantumCircuit:
+    """
+    Returns a copy of the circuit with a parameter binding applied, named like the experiments of circuits which are
+    compiled once and executed per binding: "{name}-{binding index}".
+    """
+    bound = circuit.bind_parameters(binding)
+    bound.name = f"{circuit.name}-{binding_idx}"
+    return bound
+
 
-        # fix classical bit references in measures
-        for m in measures:
-            for i, clbit in enumerate(m[2]):
-                orig_reg = bit_info[clbit]["reg"]
-                if orig_reg.name == orig_readout_name:
-                    idx = bit_info[clbit]["idx"]
-                    m[2][i] = ro_reg[idx]
-        break
+def _check_hooks(circuits: List[QuantumCircuit], options: Dict[str, Any]) -> None:
+    """
+    Check up front that circuits which are to be compiled by way of OpenQASM have no pre-compilation hooks that only
+    support Quil programs, rather than failing them once the job is running.
+    """
+    hooks = as_program_hooks(options.get("before_compile", []))
+    if all(supports_qasm(hook) for hook in hooks):
+        return
+    for circuit in circuits:
+        if compiles_via_qasm(options) or not is_translatable(circuit):
+            check_qasm_hooks(circuit, hooks)
 
 
 def _prepare_circuit(circuit: QuantumCircuit) -> QuantumCircuit:
     """
-    Returns a prepared copy of the circuit for execution on the QCS Backend.
+    Returns the circuit prepared for execution on the QCS Backend: the circuit itself if it already measures into a
+    register named 'ro', or otherwise a copy whose readout register is renamed to 'ro'.
     """
-    circuit = circuit.copy()
-    _prepare_readouts(circuit)
-    return circuit
+    readout = _readout_register(circuit)
+    if readout.name == "ro":
+        return circuit
+    return _rename_readout(circuit, readout)
+
+
+def _fingerprint(circuit: QuantumCircuit) -> Tuple[Any, ...]:
+    """
+    Cheap fingerprint of a circuit, which changes when it is renamed, when instructions are added or removed, or when
+    classical registers are added.
+    """
+    last_operation = id(circuit.data[-1].operation) if len(circuit.data) > 0 else None
+    return circuit.name, len(circuit.data), last_operation, tuple((reg.name, reg.size) for reg in circuit.cregs)
+
+
+class _PreparedCircuits:
+    """
+    Memo of :func:`_prepare_circuit` for circuits whose readout register is renamed, so that resubmitting them does not
+    copy them again. Entries are keyed by circuit identity, checked against the circuit's :func:`_fingerprint`, and
+    evicted when the circuit is garbage collected. Circuits which already measure into 'ro' are not memoized, since
+    checking them is as cheap as fingerprinting them.
+
+    The fingerprint does not cover every instruction, so instructions replaced in place (e.g. ``circuit.data[0] = ...``)
+    are not noticed; submit a copy of a circuit edited that way.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, Tuple[Tuple[Any, ...], QuantumCircuit]] = {}
+        self._lock = Lock()
+
+    def prepare(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        key = id(circuit)
+        fingerprint = _fingerprint(circuit)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            return entry[1]
+
+        prepared = _prepare_circuit(circuit)
+        with self._lock:
+            if prepared is circuit:
+                self._entries.pop(key, None)
+                return prepared
+            if key not in self._entries:
+                weakref.finalize(circuit, self._evict, key)
+            self._entries[key] = (fingerprint, prepared)
+        return prepared
+
+    def _evict(self, key: int) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
 
 
 class RigettiQCSBackend(BackendV1):
@@ -102,6 +206,9 @@ class RigettiQCSBackend(BackendV1):
         engagement_manager: EngagementManager,
         backend_configuration: QasmBackendConfiguration,
         provider: Optional[Provider],
+        executable_cache: Optional[ExecutableCache] = None,
+        disk_cache: Optional[DiskExecutableCache] = None,
+        qc_pool: Optional[QuantumComputerPool] = None,
         **fields: Any,
     ) -> None:
         """
@@ -112,6 +219,11 @@ class RigettiQCSBackend(BackendV1):
             engagement_manager: QPU engagement manager.
             backend_configuration: Backend configuration.
             provider: Parent provider.
+            executable_cache: Cache of compiled executables shared by this backend's jobs. If one is not provided, a
+                default one will be created.
+            disk_cache: Persistent cache of compiled executables, consulted after ``executable_cache``.
+            qc_pool: Pool from which to get this backend's quantum computer, shared with other backends. If one is not
+                provided, this backend creates its own.
             fields: Keyword arguments for the values to use to override the default options.
         """
         super().__init__(backend_configuration, provider, **fields)
@@ -120,6 +232,105 @@ class RigettiQCSBackend(BackendV1):
         self._client_configuration = client_configuration
         self._engagement_manager = engagement_manager
         self._qc: Optional[QuantumComputer] = None
+        self._executable_cache = executable_cache or ExecutableCache()
+        self._disk_cache = disk_cache
+        self._qc_pool = qc_pool
+        self._native_checker: Optional[NativeQuilChecker] = None
+        self._compiler_fingerprint: Optional[CompilerFingerprint] = None
+        self._target: Optional[Target] = None
+        self._physical_qubits: Optional[List[int]] = None
+        self._prepared_circuits = _PreparedCircuits()
+        self._lock = Lock()
+
+    def _get_qc(self) -> QuantumComputer:
+        name = self.configuration().backend_name
+        if self._qc_pool is None:
+            return get_qc(
+                name,
+                compiler_timeout=self._compiler_timeout,
+                execution_timeout=self._execution_timeout,
+                client_configuration=self._client_configuration,
+                engagement_manager=self._engagement_manager,
+            )
+
+        timeouts = {"compiler_timeout": self._compiler_timeout, "execution_timeout": self._execution_timeout}
+        qc = self._qc_pool.acquire(name, **timeouts)
+        # Hold the pooled quantum computer for as long as this backend exists
+        weakref.finalize(self, self._qc_pool.release, name, **timeouts)
+        return qc
+
+    def _ensure_qc(self) -> QuantumComputer:
+        with self._lock:
+            if self._qc is None:
+                self._qc = self._get_qc()
+                self._native_checker = NativeQuilChecker(self._qc)
+                self._compiler_fingerprint = CompilerFingerprint(self._qc)
+            return self._qc
+
+    def _get_physical_qubits(self) -> List[int]:
+        """
+        Device qubit IDs of the target's qubits, in order (see :func:`physical_qubits`). These are derived from the ISA
+        rather than from a built :attr:`target`, so that circuits transpiled against another backend for the same
+        device (e.g. in another process) are placed on the same qubits.
+        """
+        qc = self._ensure_qc()
+        with self._lock:
+            if self._physical_qubits is None:
+                self._physical_qubits = physical_qubits(qc.to_compiler_isa())
+            return self._physical_qubits
+
+    @property
+    def target(self) -> Target:
+        """
+        Transpiler target built from the device ISA, with its connectivity, native gates and gate properties. It is
+        built the first time it is accessed and then kept.
+
+        The target's qubits are the device's usable qubits, numbered in order of their IDs. Circuits translated directly
+        to Quil have their qubits placed on the corresponding device qubits, whether or not the target was built by this
+        backend.
+
+        Qiskit's ``transpile(circuits, backend)`` (and so ``execute``) uses this target, and building it also updates
+        this backend's :func:`configuration` with the device's basis gates and coupling map. To keep the transpiler's
+        qubit placement rather than letting the compiler choose its own, run with
+        :func:`qiskit_rigetti.hooks.pre_compilation.set_rewiring` ``("NAIVE")``.
+        """
+        qc = self._ensure_qc()
+        with self._lock:
+            if self._target is None:
+                isa = qc.to_compiler_isa()
+                target = target_from_isa(isa, description=self._configuration.backend_name)
+                self._configuration.n_qubits = target.num_qubits
+                self._configuration.basis_gates = [name for name in target.operation_names if name != "measure"]
+                coupling_map = target.build_coupling_map()
+                self._configuration.coupling_map = (
+                    [list(edge) for edge in coupling_map.get_edges()] if coupling_map is not None else []
+                )
+                self._target = target
+            return self._target
+
+    @property
+    def executable_cache(self) -> ExecutableCache:
+        """
+        Cache of compiled executables shared by this backend's jobs.
+        """
+        return self._executable_cache
+
+    @property
+    def disk_cache(self) -> Optional[DiskExecutableCache]:
+        """
+        Persistent cache of compiled executables, if one was configured.
+        """
+        return self._disk_cache
+
+    @property
+    def native_quil_checker(self) -> Optional[NativeQuilChecker]:
+        """
+        Checker used by this backend's jobs to skip recompiling programs which pre-execution hooks left native, and to
+        skip compiling native circuits with the "compile" option. Its :attr:`NativeQuilChecker.native` counter reports
+        how many recompilations were skipped, and :attr:`NativeQuilChecker.skipped_compilations` how many compilations.
+        ``None`` until the backend first runs.
+        """
+        return self._native_checker
 
     @classmethod
     def _default_options(cls) -> Options:
@@ -133,9 +344,37 @@ class RigettiQCSBackend(BackendV1):
         """
         Run the quantum circuit(s) using this backend.
 
+        Circuits are not copied unless their readout register must be renamed to "ro", so they should not be modified
+        while the job is running. Preparing a circuit for execution is remembered, so resubmitting it is cheap.
+
         Args:
             run_input: Either a single :class:`QuantumCircuit` to run or a list of them to run in parallel.
-            **options: Execution options to forward to :class:`RigettiQCSJob`.
+            **options: Execution options to forward to :class:`RigettiQCSJob`. Shot counts above the configuration's
+                ``max_shots`` are run as equally sized chunks sharing one executable, whose readouts are merged into
+                one result per experiment. In addition to ``shots``, supports:
+
+                - ``max_workers``: Maximum number of the job's circuits to compile and submit concurrently. Circuits of
+                  all jobs share one bounded pool of threads, so by default each job is only limited by that pool.
+                - ``memory``: Whether or not to return per-shot memory alongside counts. Set to ``False`` for large shot
+                  counts when only counts are needed. Defaults to ``True``.
+                - ``use_qasm``: Whether or not to pass circuits to the compiler as OpenQASM, rather than translating
+                  them directly to Quil. OpenQASM is always used when ``before_compile`` includes string hooks, and
+                  for circuits which cannot be translated. Defaults to ``False``.
+                - ``use_cache``: Whether or not to use :attr:`executable_cache` and :attr:`disk_cache` for this run.
+                  Defaults to ``True``.
+                - ``multiplex``: Whether or not to pack small circuits onto disjoint qubits of shared programs, each of
+                  which is compiled and executed once and its readout split back into one result per circuit. If an
+                  integer, the maximum number of qubits per program; if ``True``, the number of live qubits on the
+                  device. Only circuits whose classical bits are all in the readout register are packed. Defaults to
+                  ``False``.
+                - ``compile``: How circuits are compiled to native Quil. ``"always"`` sends every circuit to the
+                  compiler. ``"auto"`` skips the compiler for circuits which are already native Quil for the device
+                  (e.g. circuits transpiled to :attr:`target`), checked locally with :attr:`native_quil_checker`.
+                  ``"skip"`` does the same, but fails any circuit which is not native rather than compiling it. Only
+                  circuits translated directly to Quil can skip the compiler. Defaults to ``"always"``.
+                - ``parameter_binds``: List of parameter bindings. When possible, each circuit is compiled once and
+                  executed once per binding; otherwise a bound copy of each circuit is compiled per binding. Either
+                  way, each experiment is named after its circuit and the index of its binding (e.g. "circuit-0").
 
         Returns:
             RigettiQCSJob: The job that has been started. Wait for it by calling :func:`RigettiQCSJob.result`
@@ -143,26 +382,51 @@ class RigettiQCSBackend(BackendV1):
         if not isinstance(run_input, list):
             run_input = [run_input]
 
-        bindings = options.get("parameter_binds") or []
-        if len(bindings) > 0:
-            run_input = [circuit.bind_parameters(binding) for circuit in run_input for binding in bindings]
+        if options.get("compile", "always") not in _COMPILE_MODES:
+            raise ValueError(f"compile must be one of {', '.join(map(repr, _COMPILE_MODES))}")
 
-        run_input = [_prepare_circuit(circuit) for circuit in run_input]
+        bindings = options.get("parameter_binds") or []
+        if len(bindings) > 0 and not _can_compile_parametric(run_input, options):
+            run_input = [
+                _bind_parameters(circuit, binding_idx, binding)
+                for circuit in run_input
+                for binding_idx, binding in enumerate(bindings)
+            ]
+            options = {**options, "parameter_binds": None}
 
-        if self._qc is None:
-            self._qc = get_qc(
-                self.configuration().backend_name,
-                compiler_timeout=self._compiler_timeout,
-                execution_timeout=self._execution_timeout,
-                client_configuration=self._client_configuration,
-                engagement_manager=self._engagement_manager,
-            )
+        run_input = [self._prepared_circuits.prepare(circuit) for circuit in run_input]
+        _check_hooks(run_input, options)
 
+        qc = self._ensure_qc()
+        use_cache = options.get("use_cache", True)
         return RigettiQCSJob(
             job_id=str(uuid4()),
             circuits=run_input,
             options=options,
-            qc=self._qc,
+            qc=qc,
             backend=self,
             configuration=self.configuration(),
+            executable_cache=self._executable_cache if use_cache else None,
+            disk_cache=self._disk_cache if use_cache else None,
+            compiler_fingerprint=self._compiler_fingerprint,
+            native_checker=self._native_checker,
+            physical_qubits=self._get_physical_qubits(),
         )
+
+    async def run_async(
+        self,
+        run_input: Union[QuantumCircuit, List[QuantumCircuit]],
+        **options: Any,
+    ) -> RigettiQCSJob:
+        """
+        Run the quantum circuit(s) using this backend without blocking the event loop. Blocking setup runs on a bounded
+        pool of threads shared by all jobs, so many jobs may be in flight on one event loop.
+
+        Args:
+            run_input: Either a single :class:`QuantumCircuit` to run or a list of them to run in parallel.
+            **options: Execution options, as for :func:`run`.
+
+        Returns:
+            RigettiQCSJob: The job that has been started. Wait for it with ``await job.result_async()``
+        """
+        return await run_blocking(partial(self.run, run_input, **options))
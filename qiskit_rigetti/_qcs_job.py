@@ -13,29 +13,156 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+import asyncio
 import warnings
-from collections import Counter
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union, Iterator, cast
+from threading import Event, Lock
+from typing import Optional, Dict, Any, Deque, List, Sequence, Union, Iterator, Callable, Tuple, TypeVar, cast
 
 import numpy as np
 from dateutil.tz import tzutc
 from pyquil import Program
-from pyquil.api import QuantumComputer
+from pyquil.api import QAM, QuantumComputer, QuantumExecutable
 from pyquil.api._qpu import QPUExecuteResponse
 from pyquil.api._qvm import QVMExecuteResponse
 from pyquil.quilbase import RawInstr
 from qiskit import QuantumCircuit
 from qiskit.providers import JobStatus, JobV1, Backend
+from qiskit.providers.jobstatus import JOB_FINAL_STATES
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.qobj import QobjExperimentHeader
 from qiskit.result import Result
 from qiskit.result.models import ExperimentResult, ExperimentResultData
 
-from .hooks.pre_compilation import PreCompilationHook
+from ._executable_cache import CompilerFingerprint, DiskExecutableCache, ExecutableCache
+from ._quil_translator import PARAMETER_REGION, bind_expressions, circuit_to_quil
+from ._multiplexer import combine_circuits, pack_circuits
+from ._native_quil import NativeQuilChecker
+from ._readout import LazyExperimentResult, LazyMemory, PackedReadout
+from .hooks.pre_compilation import ProgramHook, QasmHookAdapter, as_program_hooks, supports_qasm
 from .hooks.pre_execution import PreExecutionHook
 
 Response = Union[QVMExecuteResponse, QPUExecuteResponse]
+T = TypeVar("T")
+
+_ASYNC_MAX_WORKERS = 32
+"""Number of threads shared by all jobs to compile and submit circuits, and by all ``*_async`` methods."""
+
+_RETRIEVAL_MAX_WORKERS = 32
+"""Number of threads shared by all jobs to retrieve experiment results."""
+
+_async_executor: Optional[ThreadPoolExecutor] = None
+_retrieval_executor: Optional[ThreadPoolExecutor] = None
+_executors_lock = Lock()
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    """
+    Get the bounded executor shared by all jobs and ``*_async`` methods, creating it on first use.
+
+    pyQuil's compiler and QAM clients are blocking, so compiling and submitting circuits (or awaiting them) means
+    running them on a thread; sharing a bounded pool means that jobs in flight are not limited by (or charged) threads
+    of their own.
+    """
+    global _async_executor
+    with _executors_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(max_workers=_ASYNC_MAX_WORKERS, thread_name_prefix="qiskit-rigetti")
+        return _async_executor
+
+
+def _get_retrieval_executor() -> ThreadPoolExecutor:
+    """
+    Get the bounded executor shared by all jobs to retrieve experiment results, creating it on first use.
+
+    Retrieval waits on the QAM for as long as an experiment runs, so it is kept apart from the async executor, where
+    it would hold back the setup of new jobs.
+    """
+    global _retrieval_executor
+    with _executors_lock:
+        if _retrieval_executor is None:
+            _retrieval_executor = ThreadPoolExecutor(
+                max_workers=_RETRIEVAL_MAX_WORKERS, thread_name_prefix="qiskit-rigetti-retrieval"
+            )
+        return _retrieval_executor
+
+
+async def run_blocking(fn: Callable[[], T]) -> T:
+    """
+    Await a blocking call by running it on the shared async executor.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_get_async_executor(), fn)
+
+
+class _JobCancelled(Exception):
+    """
+    Raised in place of starting work for a job which has been cancelled.
+    """
+
+
+class _Execution:
+    """
+    Responses for the shot chunks of one execution of a program. Its readout is retrieved and merged once, even if the
+    program is shared by several multiplexed experiments.
+    """
+
+    def __init__(self, responses: List[Response], num_shots: int) -> None:
+        self.responses = responses
+        self._num_shots = num_shots
+        self._lock = Lock()
+        self._readout: Optional[PackedReadout] = None
+
+    def get_readout(self, qam: QAM[Response]) -> PackedReadout:
+        with self._lock:
+            if self._readout is None:
+                # NOTE: Each chunk is packed as soon as it is retrieved, so chunks are never all held unpacked at once
+                chunks = [
+                    PackedReadout(np.array(qam.get_result(response).readout_data["ro"])) for response in self.responses
+                ]
+                # Chunks are equally sized, so the last may have run a few more shots than were requested
+                self._readout = PackedReadout.concatenate(chunks, num_shots=self._num_shots)
+            return self._readout
+
+
+def compiles_via_qasm(options: Dict[str, Any]) -> bool:
+    """
+    Whether or not circuits run with the given options are compiled by way of OpenQASM, rather than translated directly
+    to Quil. This is the case if requested, or if any pre-compilation hooks are string hooks.
+    """
+    hooks = as_program_hooks(options.get("before_compile", []))
+    return bool(options.get("use_qasm")) or any(isinstance(hook, QasmHookAdapter) for hook in hooks)
+
+
+def check_qasm_hooks(circuit: QuantumCircuit, hooks: Sequence[ProgramHook]) -> None:
+    """
+    Check that a circuit which is to be compiled by way of OpenQASM has no pre-compilation hooks that only support Quil
+    programs.
+
+    Raises:
+        ValueError: If any of the hooks does not implement :func:`ProgramHook.apply_qasm`.
+    """
+    unsupported = [type(hook).__name__ for hook in hooks if not supports_qasm(hook)]
+    if unsupported:
+        raise ValueError(
+            f"circuit {circuit.name} must be compiled by way of OpenQASM (it cannot be translated to Quil, or OpenQASM "
+            f"was requested), but pre-compilation hooks {', '.join(unsupported)} only support Quil programs"
+        )
+
+
+def _job_status(experiment_statuses: List[JobStatus]) -> JobStatus:
+    """
+    Overall status of a job with the given experiment statuses.
+    """
+    if all(status in JOB_FINAL_STATES for status in experiment_statuses):
+        for status in (JobStatus.CANCELLED, JobStatus.ERROR):
+            if status in experiment_statuses:
+                return status
+        return JobStatus.DONE
+    if any(status != JobStatus.QUEUED for status in experiment_statuses):
+        return JobStatus.RUNNING
+    return JobStatus.QUEUED
 
 
 class RigettiQCSJob(JobV1):
@@ -52,15 +179,29 @@ class RigettiQCSJob(JobV1):
         qc: QuantumComputer,
         backend: Backend,
         configuration: QasmBackendConfiguration,
+        executable_cache: Optional[ExecutableCache] = None,
+        disk_cache: Optional[DiskExecutableCache] = None,
+        compiler_fingerprint: Optional[CompilerFingerprint] = None,
+        native_checker: Optional[NativeQuilChecker] = None,
+        physical_qubits: Optional[Sequence[int]] = None,
     ) -> None:
         """
         Args:
             job_id: Unique identifier for this job
-            circuits: List of circuits to execute
+            circuits: List of circuits to execute. If the "parameter_binds" option is given, each circuit is
+                compiled once and executed once per binding.
             options: Execution options (e.g. "shots")
             qc: Quantum computer to run against
             backend: :class:`RigettiQCSBackend` that created this job
             configuration: Configuration from parent backend
+            executable_cache: Cache to consult before compiling. If not provided, every circuit is compiled.
+            disk_cache: Persistent cache to consult before compiling, after ``executable_cache``.
+            compiler_fingerprint: Fingerprint of ``qc``'s compilation environment, checked against ``disk_cache``
+                entries. If not provided, one is created for ``qc``; it is only computed once the disk cache is used.
+            native_checker: Checker used to skip recompiling programs which pre-execution hooks left native. If not
+                provided, one is created for ``qc``.
+            physical_qubits: Quil qubit for each qubit of the backend's transpiler target, onto which circuits
+                translated directly to Quil are placed. If not provided, circuit qubit indices are used as is.
         """
         super().__init__(backend, job_id)
 
@@ -69,8 +210,22 @@ class RigettiQCSJob(JobV1):
         self._options = options
         self._qc = qc
         self._configuration = configuration
+        self._executable_cache = executable_cache
+        self._disk_cache = disk_cache
+        self._native_checker = native_checker or NativeQuilChecker(qc)
+        self._physical_qubits = physical_qubits
+        self._compiler_fingerprint = compiler_fingerprint or CompilerFingerprint(qc)
+        self._before_compile = as_program_hooks(options.get("before_compile", []))
         self._result: Optional[Result] = None
-        self._responses: List[Response] = []
+        self._lock = Lock()
+        self._experiment_statuses: List[JobStatus] = []
+        self._experiment_futures: List["Future[ExperimentResult]"] = []
+        self._submissions: List["Future[None]"] = []
+        self._pending_packs: Deque[int] = deque()
+        self._readouts: Dict[int, PackedReadout] = {}
+        self._packs: List[List[int]] = []
+        self._readout_slices: Dict[int, slice] = {}
+        self._cancelled = Event()
 
         self._start()
 
@@ -82,32 +237,286 @@ class RigettiQCSJob(JobV1):
         raise NotImplementedError("'submit' is not implemented as this class uses the asynchronous pattern")
 
     def _start(self) -> None:
-        self._responses = [self._start_circuit(circuit) for circuit in self._circuits]
-        self._status = JobStatus.RUNNING
+        """
+        Start compiling and submitting circuits in the background. Each experiment's result is fetched as soon as it
+        has been submitted (see :func:`_hand_off`).
+        """
+        num_experiments = len(self._circuits) * self._experiments_per_circuit()
+        self._experiment_statuses = [JobStatus.QUEUED] * num_experiments
+        self._experiment_futures = [Future() for _ in range(num_experiments)]
+        self._status = _job_status(self._experiment_statuses)
+
+        self._packs = self._pack_circuits()
+        self._submissions = [Future() for _ in self._packs]
+        self._pending_packs = deque(range(len(self._packs)))
+        # NOTE: Packs run on the executor shared by all jobs; "max_workers" further limits how many of this job's run
+        # at once, by starting the next pack only as each one finishes
+        max_workers: int = self._options.get("max_workers") or len(self._packs)
+        for _ in range(min(max_workers, len(self._packs))):
+            self._start_next_pack()
+
+    def _start_next_pack(self) -> None:
+        with self._lock:
+            if not self._pending_packs:
+                return
+            pack_idx = self._pending_packs.popleft()
+        _get_async_executor().submit(self._run_pack, pack_idx)
+
+    def _run_pack(self, pack_idx: int) -> None:
+        try:
+            if self._cancelled.is_set():
+                self._cancel_pack(pack_idx)
+            else:
+                self._submit_pack(self._packs[pack_idx])
+                self._submissions[pack_idx].set_result(None)
+        finally:
+            self._start_next_pack()
+
+    def _cancel_pack(self, pack_idx: int) -> None:
+        """
+        Resolve every experiment of a pack which has not started as cancelled.
+        """
+        for circuit_idx in self._packs[pack_idx]:
+            first_experiment = self._first_experiment(circuit_idx)
+            for experiment_idx in range(first_experiment, first_experiment + self._experiments_per_circuit()):
+                self._hand_off(experiment_idx, _JobCancelled())
+        self._submissions[pack_idx].set_result(None)
+
+    def _experiments_per_circuit(self) -> int:
+        return len(self._options.get("parameter_binds") or []) or 1
+
+    def _first_experiment(self, circuit_idx: int) -> int:
+        return circuit_idx * self._experiments_per_circuit()
+
+    def _pack_circuits(self) -> List[List[int]]:
+        """
+        Group the indices of circuits which are to share a program. Without the "multiplex" option, each circuit has a
+        program of its own.
+        """
+        multiplex: Union[bool, int] = self._options.get("multiplex", False)
+        if not multiplex:
+            return [[circuit_idx] for circuit_idx in range(len(self._circuits))]
+
+        if multiplex is True:
+            max_qubits = sum(1 for qubit in self._qc.to_compiler_isa().qubits.values() if not qubit.dead)
+        else:
+            max_qubits = multiplex
+        return pack_circuits(self._circuits, max_qubits)
+
+    def _submit_pack(self, pack: List[int]) -> None:
+        """
+        Compile and execute the circuits of a pack as one program, handing off each execution for every experiment it
+        covers as soon as it is submitted, followed by the error (if any) that prevented the rest
+        from being submitted.
+        """
+        num_submitted = 0
+        try:
+            if len(pack) == 1:
+                circuit = self._circuits[pack[0]]
+            else:
+                circuit, readout_slices = combine_circuits([self._circuits[circuit_idx] for circuit_idx in pack])
+                self._readout_slices.update(zip(pack, readout_slices))
+
+            if self._options.get("parameter_binds"):
+                responses = self._start_parametric_circuit(circuit)
+            else:
+                responses = iter([self._start_circuit(circuit)])
+
+            for chunk_responses in responses:
+                execution = _Execution(chunk_responses, self._options["shots"])
+                for circuit_idx in pack:
+                    experiment_idx = self._first_experiment(circuit_idx) + num_submitted
+                    self._set_experiment_status(experiment_idx, JobStatus.RUNNING)
+                    self._hand_off(experiment_idx, execution)
+                num_submitted += 1
+        except Exception as e:
+            for circuit_idx in pack:
+                for offset in range(num_submitted, self._experiments_per_circuit()):
+                    self._hand_off(self._first_experiment(circuit_idx) + offset, e)
+
+    def _hand_off(self, experiment_idx: int, execution: Union[_Execution, Exception]) -> None:
+        """
+        Resolve an experiment with the execution submitted for it, or the error that prevented its submission. Results
+        are fetched on the retrieval executor shared by all jobs, so a slow experiment does not hold back the ones
+        submitted after it, and jobs in flight do not each hold threads of their own.
+        """
+        if isinstance(execution, Exception):
+            self._retrieve_result(experiment_idx, execution)
+        else:
+            _get_retrieval_executor().submit(self._retrieve_result, experiment_idx, execution)
+
+    def _retrieve_result(self, experiment_idx: int, execution: Union[_Execution, Exception]) -> None:
+        future = self._experiment_futures[experiment_idx]
+        try:
+            if isinstance(execution, Exception):
+                raise execution
+            experiment_result = self._get_experiment_result(experiment_idx, execution)
+        except _JobCancelled:
+            self._set_experiment_status(experiment_idx, JobStatus.CANCELLED)
+            future.cancel()
+            # NOTE: Waiters are only woken for cancelled futures once notified
+            future.set_running_or_notify_cancel()
+        except Exception as e:
+            self._set_experiment_status(experiment_idx, JobStatus.ERROR)
+            future.set_exception(e)
+        else:
+            self._set_experiment_status(experiment_idx, JobStatus.DONE)
+            future.set_result(experiment_result)
+
+    def _set_experiment_status(self, experiment_idx: int, status: JobStatus) -> None:
+        with self._lock:
+            self._experiment_statuses[experiment_idx] = status
+            self._status = _job_status(self._experiment_statuses)
+
+    def _start_circuit(self, circuit: QuantumCircuit) -> List[Response]:
+        if compiles_via_qasm(self._options):
+            executable = self._compile_qasm(circuit)
+        else:
+            try:
+                program, _ = circuit_to_quil(circuit, qubit_ids=self._qubit_ids(circuit))
+            except ValueError:
+                executable = self._compile_qasm(circuit)
+            else:
+                for hook in self._before_compile:
+                    hook.apply(program)
+                executable = self._compile(program)
+
+        return self._execute(executable)
+
+    def _execute(self, executable: QuantumExecutable) -> List[Response]:
+        """
+        Execute an executable once per shot chunk (see :func:`_shot_chunks`). Every chunk is submitted before any
+        result is retrieved, so chunks run back to back.
+        """
+        num_chunks, _ = self._shot_chunks()
+        responses = []
+        for _ in range(num_chunks):
+            self._check_cancelled()
+            # typing: QuantumComputer's inner QAM is generic, so we set the expected type here
+            responses.append(cast(Response, self._qc.qam.execute(executable)))
+        return responses
+
+    def _shot_chunks(self) -> Tuple[int, int]:
+        """
+        Number of chunks to split the requested shots into so that none exceeds the backend's ``max_shots``, and the
+        number of shots per chunk. Chunks are equally sized so that they share one executable.
+        """
+        shots: int = self._options["shots"]
+        max_shots: int = self._configuration.max_shots or shots
+        num_chunks = max(-(-shots // max_shots), 1)
+        return num_chunks, -(-shots // num_chunks)
 
-    def _start_circuit(self, circuit: QuantumCircuit) -> Response:
-        shots = self._options["shots"]
+    def _qubit_ids(self, circuit: QuantumCircuit) -> Optional[Sequence[int]]:
+        if self._physical_qubits is None or circuit.num_qubits > len(self._physical_qubits):
+            return None
+        return self._physical_qubits
+
+    def _compile_qasm(self, circuit: QuantumCircuit) -> QuantumExecutable:
+        """
+        Compile a circuit by way of OpenQASM, which supports string pre-compilation hooks and any instruction quilc can
+        parse.
+        """
+        check_qasm_hooks(circuit, self._before_compile)
         qasm = circuit.qasm()
         qasm = self._handle_barriers(qasm, circuit.num_qubits)
 
-        before_compile: List[PreCompilationHook] = self._options.get("before_compile", [])
-        for fn in before_compile:
-            qasm = fn(qasm)
+        for hook in self._before_compile:
+            qasm = hook.apply_qasm(qasm)
+
+        return self._compile(Program(RawInstr(qasm)), source=qasm)
+
+    def _start_parametric_circuit(self, circuit: QuantumCircuit) -> Iterator[List[Response]]:
+        """
+        Compile an unbound circuit once, then execute it once per parameter binding by writing the bound values into
+        the executable's memory. Each binding's responses are yielded as soon as it is submitted.
+        """
+        if compiles_via_qasm(self._options):
+            raise RuntimeError("String pre-compilation hooks are unsupported when compiling parametric circuits")
+
+        program, expressions = circuit_to_quil(circuit, qubit_ids=self._qubit_ids(circuit))
+        for hook in self._before_compile:
+            hook.apply(program)
+        executable = self._compile(program)
 
-        program = Program(RawInstr(qasm)).wrap_in_numshots_loop(shots)
-        program = self._qc.compiler.quil_to_native_quil(program)
+        for binding in self._options["parameter_binds"]:
+            bound_executable = executable.copy()
+            for offset, value in enumerate(bind_expressions(expressions, binding)):
+                bound_executable.write_memory(region_name=PARAMETER_REGION, value=value, offset=offset)
+            yield self._execute(bound_executable)
+
+    def _compile(self, program: Program, *, source: Optional[str] = None) -> QuantumExecutable:
+        """
+        Compile a program to an executable, consulting the executable cache (if any) at each step.
+
+        Native Quil is cached by the source text the program was built from (``source``, or the program's own Quil),
+        and executables are cached by the native Quil as transformed by pre-execution hooks. With the "compile" option
+        set to "auto" or "skip", a program which is already native Quil is not sent to the compiler at all.
+        """
+        _, shots = self._shot_chunks()
+        compile_mode: str = self._options.get("compile", "always")
+
+        self._check_cancelled()
+        native_program: Program
+        if compile_mode != "always" and self._native_checker.can_skip_compilation(program):
+            native_program = program.wrap_in_numshots_loop(shots)
+        elif compile_mode == "skip":
+            raise ValueError(
+                f"circuit is not native Quil for {self._configuration.backend_name} and compile='skip' was requested"
+            )
+        else:
+            native_program = self._cached(
+                lambda: ("native_quil", shots, program.out() if source is None else source),
+                lambda: self._qc.compiler.quil_to_native_quil(program.wrap_in_numshots_loop(shots)),
+            )
 
         before_execute: List[PreExecutionHook] = self._options.get("before_execute", [])
         for fn in before_execute:
-            program = fn(program)
+            native_program = fn(native_program)
 
-        if self._options.get("ensure_native_quil") and len(before_execute) > 0:
-            program = self._qc.compiler.quil_to_native_quil(program)
+        ensure_native_quil = bool(self._options.get("ensure_native_quil") and len(before_execute) > 0)
 
-        executable = self._qc.compiler.native_quil_to_executable(program)
+        def to_executable() -> QuantumExecutable:
+            self._check_cancelled()
+            nq_program = native_program
+            if ensure_native_quil and not self._native_checker.is_native(nq_program):
+                nq_program = self._qc.compiler.quil_to_native_quil(nq_program)
+            return self._qc.compiler.native_quil_to_executable(nq_program)
 
-        # typing: QuantumComputer's inner QAM is generic, so we set the expected type here
-        return cast(Response, self._qc.qam.execute(executable))
+        return cast(
+            QuantumExecutable,
+            self._cached(lambda: ("executable", shots, ensure_native_quil, native_program.out()), to_executable),
+        )
+
+    def _check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise _JobCancelled()
+
+    def _cached(self, key_parts: Callable[[], Tuple[Any, ...]], compute: Callable[[], Any]) -> Any:
+        """
+        Look up a compilation result in the executable cache, then the disk cache, computing and storing it on a miss.
+        The last key part is the program text, whose length is used as the in-memory entry size. Values in the
+        in-memory cache are copied on the way in and out, as callers may mutate them.
+        """
+        if self._executable_cache is None and self._disk_cache is None:
+            return compute()
+
+        *parts, text = key_parts()
+        key = ExecutableCache.key(self._configuration.backend_name, *parts, text)
+
+        value = self._executable_cache.get(key) if self._executable_cache is not None else None
+        if value is not None:
+            return value.copy()
+
+        fingerprint = self._compiler_fingerprint.get() if self._disk_cache is not None else ""
+        value = self._disk_cache.get(key, fingerprint) if self._disk_cache is not None else None
+        if value is None:
+            value = compute()
+            if self._disk_cache is not None:
+                self._disk_cache.put(key, fingerprint, value)
+
+        if self._executable_cache is not None:
+            self._executable_cache.put(key, value.copy(), len(text))
+        return value
 
     @staticmethod
     def _handle_barriers(qasm: str, num_circuit_qubits: int) -> str:
@@ -124,75 +533,138 @@ class RigettiQCSJob(JobV1):
         """
         Wait until the job is complete, then return a result.
 
+        If the job was cancelled, the result only covers the experiments which completed, and is unsuccessful.
+
         Raises:
-            JobError: If there was a problem running the Job or retrieving the result
+            Exception: The first error raised while compiling, executing, or retrieving the result of an experiment.
         """
         if self._result is not None:
             return self._result
 
-        now = datetime.now(tzutc())
-
-        results = []
-        success = True
-        for r in self._get_experiment_results():
-            results.append(r)
-            success &= r.success
+        wait(self._experiment_futures)
+        results = [future.result() for future in self._experiment_futures if not future.cancelled()]
+        num_cancelled = len(self._experiment_futures) - len(results)
+        status = None
+        if num_cancelled > 0:
+            status = f"Cancelled; {num_cancelled} of {len(self._experiment_futures)} experiments did not run"
 
         self._result = Result(
             backend_name=self._configuration.backend_name,
             backend_version=self._configuration.backend_version,
             qobj_id="",
             job_id=self.job_id(),
-            success=success,
+            success=num_cancelled == 0 and all(r.success for r in results),
             results=results,
-            date=now,
+            date=datetime.now(tzutc()),
+            status=status,
         )
-
-        self._status = JobStatus.DONE if success else JobStatus.ERROR
         return self._result
 
-    def _get_experiment_results(self) -> Iterator[ExperimentResult]:
-        shots = self._options["shots"]
-
-        for circuit_idx, response in enumerate(self._responses):
-            states = self._qc.qam.get_result(response).readout_data["ro"]
-            memory = list(map(_to_binary_str, np.array(states)))
-            success = True
-            status = "Completed successfully"
-
-            circuit = self._circuits[circuit_idx]
-            yield ExperimentResult(
-                header=QobjExperimentHeader(name=circuit.name),
-                shots=shots,
-                success=success,
-                status=status,
-                data=ExperimentResultData(counts=Counter(memory), memory=memory),
-            )
+    async def result_async(self) -> Result:
+        """
+        Wait until the job is complete without blocking the event loop, then return a result.
 
-    def cancel(self) -> None:
+        Raises:
+            Exception: The first error raised while compiling, executing, or retrieving the result of an experiment.
         """
+        if self._result is None and self._experiment_futures:
+            await asyncio.wait([asyncio.wrap_future(future) for future in self._experiment_futures])
+        return self.result()
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[Tuple[int, ExperimentResult]]:
+        """
+        Yield the index and result of each experiment as soon as it is available, in order of completion rather than
+        submission. Experiments which were cancelled are skipped.
+
+        Args:
+            timeout: Maximum time to wait for all experiments, in seconds. If not provided, wait indefinitely.
+
         Raises:
-            NotImplementedError: There is currently no way to cancel this job.
+            Exception: The error raised while compiling, executing, or retrieving the result of an experiment, when
+                that experiment is reached.
+            concurrent.futures.TimeoutError: If ``timeout`` elapses before every experiment has completed.
         """
-        raise NotImplementedError("Cancelling jobs is not supported")
+        indices = {future: idx for idx, future in enumerate(self._experiment_futures)}
+        for future in as_completed(indices, timeout=timeout):
+            if not future.cancelled():
+                yield indices[future], future.result()
+
+    def _get_experiment_result(self, experiment_idx: int, execution: _Execution) -> ExperimentResult:
+        readout = execution.get_readout(self._qc.qam)
+        readout_slice = self._readout_slices.get(experiment_idx // self._experiments_per_circuit())
+        if readout_slice is not None:
+            readout = PackedReadout(readout.unpack()[:, readout_slice])
+        self._readouts[experiment_idx] = readout
+        success = True
+        status = "Completed successfully"
 
-    def status(self) -> JobStatus:
-        """Get the current status of this Job
+        return LazyExperimentResult(
+            header=QobjExperimentHeader(name=self._experiment_name(experiment_idx)),
+            shots=self._options["shots"],
+            success=success,
+            status=status,
+            data=ExperimentResultData(
+                counts=readout.counts(),
+                memory=LazyMemory(readout) if self._options.get("memory", True) else None,
+            ),
+        )
 
-        If this job was RUNNING when you called it, this function will block until the job is complete.
+    def readout_array(self, experiment: int = 0, *, packed: bool = False) -> "np.ndarray[Any, Any]":
         """
+        Wait until the job is complete, then return the raw readout of an experiment.
 
-        if self._status == JobStatus.RUNNING:
-            # Wait for results _now_ to finish running, otherwise consuming code might wait forever.
-            self.result()
+        Args:
+            experiment: Index of the experiment.
+            packed: If ``True``, return the readout with 8 bits per byte, as stored by this job (see
+                :func:`numpy.packbits`, with ``bitorder="little"``).
 
-        return self._status
+        Returns:
+            An array of shape (shots, bits), or (shots, ceil(bits / 8)) if ``packed``.
+        """
+        self.result()
+        readout = self._readouts[experiment]
+        return readout.data if packed else readout.unpack()
+
+    def _experiment_name(self, experiment_idx: int) -> str:
+        bindings = self._options.get("parameter_binds")
+        if not bindings:
+            return str(self._circuits[experiment_idx].name)
+
+        circuit_idx, binding_idx = divmod(experiment_idx, len(bindings))
+        return f"{self._circuits[circuit_idx].name}-{binding_idx}"
+
+    def cancel(self) -> None:
+        """
+        Cancel the job without waiting for it to stop.
+
+        Circuits which have not started compiling are skipped, and circuits which are compiling stop before their next
+        compilation step or execution. Experiments already submitted for execution run to completion, as pyQuil
+        provides no way to cancel them, and their results are kept. Once every experiment has finished or been
+        cancelled, the job's status becomes CANCELLED and :func:`result` returns a partial result. Cancelling a job
+        more than once has no further effect.
+        """
+        with self._lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+            cancelled_packs = list(self._pending_packs)
+            self._pending_packs.clear()
+        # NOTE: Packs already handed to the shared executor cancel themselves once they run
+        for pack_idx in cancelled_packs:
+            self._cancel_pack(pack_idx)
 
+    def status(self) -> JobStatus:
+        """Get the current status of this Job, without waiting for it to complete.
 
-def _to_binary_str(state: List[int]) -> str:
-    # NOTE: According to https://arxiv.org/pdf/1809.03452.pdf, this should be a hex string
-    # but it results in missing leading zeros in the displayed output, and binary strings
-    # seem to work too. Hex string could be accomplished with:
-    #     hex(int(binary_str, 2))
-    binary_str = "".join(map(str, state[::-1]))
-    return binary_str
+        The job is QUEUED until its first circuit has been submitted for execution, then RUNNING until the result of
+        every experiment has been retrieved. See :func:`experiment_statuses` for the status of each experiment.
+        """
+        return self._status
+
+    def experiment_statuses(self) -> List[JobStatus]:
+        """
+        Get the current status of each experiment (i.e. each circuit, or each circuit and parameter binding), without
+        waiting for them to complete.
+        """
+        with self._lock:
+            return list(self._experiment_statuses)
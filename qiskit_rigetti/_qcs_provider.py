@@ -13,14 +13,16 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
-from typing import Any, Optional, List, Dict, cast
+from typing import Any, Optional, List, Dict
 
-import httpx
 from pyquil.api import EngagementManager
-from qcs_api_client.client import build_sync_client, QCSClientConfiguration
+from qcs_api_client.client import QCSClientConfiguration
 from qiskit.providers import ProviderV1
 from qiskit.providers.models import QasmBackendConfiguration
 
+from ._device_catalog import DeviceCatalog
+from ._executable_cache import DiskExecutableCache
+from ._qc_pool import QuantumComputerPool
 from ._qcs_backend import RigettiQCSBackend
 
 
@@ -36,6 +38,9 @@ class RigettiQCSProvider(ProviderV1):
         execution_timeout: float = 10.0,
         client_configuration: Optional[QCSClientConfiguration] = None,
         engagement_manager: Optional[EngagementManager] = None,
+        disk_cache: Optional[DiskExecutableCache] = None,
+        device_catalog: Optional[DeviceCatalog] = None,
+        qc_idle_timeout: float = 300.0,
     ) -> None:
         """
         Args:
@@ -43,15 +48,27 @@ class RigettiQCSProvider(ProviderV1):
             compiler_timeout: Time limit for compiler requests, in seconds.
             client_configuration: QCS client configuration. If one is not provided, a default will be loaded.
             engagement_manager: QPU engagement manager. If one is not provided, a default one will be created.
+            disk_cache: Persistent cache of compiled executables to share between backends (and processes).
+            device_catalog: Catalog of available quantum processors. If one is not provided, the catalog shared by all
+                providers in this process with the same QCS profile and credentials is used.
+            qc_idle_timeout: Time for which a quantum computer no longer used by any of this provider's backends is kept
+                for reuse, in seconds.
         """
         super().__init__()
-        self._backends: List[RigettiQCSBackend] = []
+        self._backends: Dict[str, RigettiQCSBackend] = {}
         self._compiler_timeout = compiler_timeout
         self._execution_timeout = execution_timeout
         self._client_configuration = client_configuration or QCSClientConfiguration.load()
         self._engagement_manager = engagement_manager or EngagementManager(
             client_configuration=self._client_configuration
         )
+        self._disk_cache = disk_cache
+        self._device_catalog = device_catalog or DeviceCatalog.shared(self._client_configuration)
+        self._qc_pool = QuantumComputerPool(
+            client_configuration=self._client_configuration,
+            engagement_manager=self._engagement_manager,
+            idle_timeout=qc_idle_timeout,
+        )
 
     def backends(self, name: Optional[str] = None, **__: Any) -> List[RigettiQCSBackend]:
         """
@@ -64,23 +81,26 @@ class RigettiQCSProvider(ProviderV1):
         Returns:
             List[RigettiQCSBackend]: The list of matching backends.
         """
-        if not self._backends:
-            for qpu, data in self._get_quantum_processors().items():
-                configuration = _configuration(qpu, num_qubits=data["num_qubits"], local=False, simulator=False)
-                self._backends.append(
-                    RigettiQCSBackend(
-                        compiler_timeout=self._compiler_timeout,
-                        execution_timeout=self._execution_timeout,
-                        client_configuration=self._client_configuration,
-                        engagement_manager=self._engagement_manager,
-                        backend_configuration=configuration,
-                        provider=self,
-                    )
-                )
+        quantum_processors = self._device_catalog.get()
+        for qpu, data in quantum_processors.items():
+            if qpu in self._backends:
+                continue
+            configuration = _configuration(qpu, num_qubits=data["num_qubits"], local=False, simulator=False)
+            self._backends[qpu] = RigettiQCSBackend(
+                compiler_timeout=self._compiler_timeout,
+                execution_timeout=self._execution_timeout,
+                client_configuration=self._client_configuration,
+                engagement_manager=self._engagement_manager,
+                backend_configuration=configuration,
+                provider=self,
+                disk_cache=self._disk_cache,
+                qc_pool=self._qc_pool,
+            )
 
+        backends = [self._backends[qpu] for qpu in quantum_processors]
         if name is None:
-            return self._backends
-        return [b for b in self._backends if b.name() == name]
+            return backends
+        return [b for b in backends if b.name() == name]
 
     def get_simulator(self, *, num_qubits: int, noisy: bool = False) -> RigettiQCSBackend:
         """
@@ -104,14 +124,10 @@ class RigettiQCSProvider(ProviderV1):
             engagement_manager=self._engagement_manager,
             backend_configuration=configuration,
             provider=self,
+            disk_cache=self._disk_cache,
+            qc_pool=self._qc_pool,
         )
 
-    def _get_quantum_processors(self) -> Dict[str, Any]:
-        with build_sync_client(configuration=self._client_configuration) as qcs_client:  # type: httpx.Client
-            return cast(
-                Dict[str, Any], qcs_client.get("https://forest-server.qcs.rigetti.com/devices").json()["devices"]
-            )
-
 
 def _configuration(name: str, num_qubits: int, local: bool, simulator: bool) -> QasmBackendConfiguration:
     return QasmBackendConfiguration(
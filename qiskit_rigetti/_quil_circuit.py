@@ -13,10 +13,14 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
-from typing import Any
+from numbers import Number
+from typing import Any, List, Sequence, Tuple, Union
 
+import numpy as np
 from qiskit import QuantumCircuit
-from qiskit.circuit import InstructionSet
+from qiskit.circuit import CircuitInstruction, Gate, InstructionSet, Qubit
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.parameterexpression import ParameterExpression, ParameterValueType
 
 from .gates import (
     CanonicalGate,
@@ -28,37 +32,132 @@ from .gates import (
 )
 
 
+_Angles = Union[ParameterValueType, Sequence[ParameterValueType], "np.ndarray[Any, Any]"]
+"""Angles for a layer of gates: one per pair of qubits, or one for all of them."""
+
+_Pairs = Union[Sequence[Sequence[Any]], "np.ndarray[Any, Any]"]
+"""Pairs of qubits for a layer of gates, as qubits or anything else :func:`QuantumCircuit.append` accepts."""
+
+
 class QuilCircuit(QuantumCircuit):
     """
     A :class:`qiskit.circuit.QuantumCircuit` extension with added support for standard Quil gates:
 
     https://github.com/rigetti/quilc/blob/master/src/quil/stdgates.quil
+
+    Each gate also has a layer method (e.g. :func:`xy_layer`) which applies it to many pairs of qubits at once, for
+    building large circuits such as QAOA mixers. Angles may be given per pair, or once for all pairs.
     """
 
-    def xy(self, theta: float, qubit1: Any, qubit2: Any) -> InstructionSet:
+    def xy(self, theta: ParameterValueType, qubit1: Any, qubit2: Any) -> InstructionSet:
         """Apply :class:`qiskit_rigetti.gates.xy.XYGate`."""
         return self.append(XYGate(theta), [qubit1, qubit2], [])
 
-    def piswap(self, theta: float, qubit1: Any, qubit2: Any) -> InstructionSet:
+    def piswap(self, theta: ParameterValueType, qubit1: Any, qubit2: Any) -> InstructionSet:
         """Apply :class:`qiskit_rigetti.gates.xy.XYGate`."""
         return self.xy(theta, qubit1, qubit2)
 
-    def pswap(self, theta: float, qubit1: Any, qubit2: Any) -> InstructionSet:
+    def pswap(self, theta: ParameterValueType, qubit1: Any, qubit2: Any) -> InstructionSet:
         """Apply :class:`qiskit_rigetti.gates.pswap.PSwapGate`."""
         return self.append(PSwapGate(theta), [qubit1, qubit2], [])
 
-    def cphase00(self, theta: float, control_qubit: Any, target_qubit: Any) -> InstructionSet:
+    def cphase00(self, theta: ParameterValueType, control_qubit: Any, target_qubit: Any) -> InstructionSet:
         """Apply :class:`qiskit_rigetti.gates.cphase.CPhase00`."""
         return self.append(CPhase00Gate(theta), [control_qubit, target_qubit], [])
 
-    def cphase01(self, theta: float, control_qubit: Any, target_qubit: Any) -> InstructionSet:
+    def cphase01(self, theta: ParameterValueType, control_qubit: Any, target_qubit: Any) -> InstructionSet:
         """Apply :class:`qiskit_rigetti.gates.cphase.CPhase01`."""
         return self.append(CPhase01Gate(theta), [control_qubit, target_qubit], [])
 
-    def cphase10(self, theta: float, control_qubit: Any, target_qubit: Any) -> InstructionSet:
+    def cphase10(self, theta: ParameterValueType, control_qubit: Any, target_qubit: Any) -> InstructionSet:
         """Apply :class:`qiskit_rigetti.gates.cphase.CPhase10`."""
         return self.append(CPhase10Gate(theta), [control_qubit, target_qubit], [])
 
-    def can(self, alpha: float, beta: float, gamma: float, qubit1: Any, qubit2: Any) -> InstructionSet:
+    def can(
+        self, alpha: ParameterValueType, beta: ParameterValueType, gamma: ParameterValueType, qubit1: Any, qubit2: Any
+    ) -> InstructionSet:
         """Apply :class:`qiskit_rigetti.gates.can.CanonicalGate`."""
         return self.append(CanonicalGate(alpha, beta, gamma), [qubit1, qubit2], [])
+
+    def xy_layer(self, thetas: _Angles, pairs: _Pairs) -> InstructionSet:
+        """Apply :class:`qiskit_rigetti.gates.xy.XYGate` to each pair of qubits."""
+        return self._append_layer(XYGate, pairs, thetas)
+
+    def pswap_layer(self, thetas: _Angles, pairs: _Pairs) -> InstructionSet:
+        """Apply :class:`qiskit_rigetti.gates.pswap.PSwapGate` to each pair of qubits."""
+        return self._append_layer(PSwapGate, pairs, thetas)
+
+    def cphase00_layer(self, thetas: _Angles, pairs: _Pairs) -> InstructionSet:
+        """Apply :class:`qiskit_rigetti.gates.cphase.CPhase00` to each pair of (control, target) qubits."""
+        return self._append_layer(CPhase00Gate, pairs, thetas)
+
+    def cphase01_layer(self, thetas: _Angles, pairs: _Pairs) -> InstructionSet:
+        """Apply :class:`qiskit_rigetti.gates.cphase.CPhase01` to each pair of (control, target) qubits."""
+        return self._append_layer(CPhase01Gate, pairs, thetas)
+
+    def cphase10_layer(self, thetas: _Angles, pairs: _Pairs) -> InstructionSet:
+        """Apply :class:`qiskit_rigetti.gates.cphase.CPhase10` to each pair of (control, target) qubits."""
+        return self._append_layer(CPhase10Gate, pairs, thetas)
+
+    def can_layer(self, alphas: _Angles, betas: _Angles, gammas: _Angles, pairs: _Pairs) -> InstructionSet:
+        """Apply :class:`qiskit_rigetti.gates.can.CanonicalGate` to each pair of qubits."""
+        return self._append_layer(CanonicalGate, pairs, alphas, betas, gammas)
+
+    def _append_layer(self, gate_class: Any, pairs: _Pairs, *angles: _Angles) -> InstructionSet:
+        """
+        Append one two-qubit gate per pair of qubits. Unlike :func:`append`, arguments are validated for the whole layer
+        before any gate is appended, so an invalid layer leaves the circuit unchanged, and gates are not broadcast.
+        """
+        qargs = self._layer_qubits(pairs)
+        params = zip(*(_layer_angles(a, len(qargs)) for a in angles))
+        gates: List[Gate] = [gate_class(*p) for p in params]
+
+        # NOTE: Like append, add to the innermost control-flow block when building one
+        if self._control_flow_scopes:
+            appender = self._control_flow_scopes[-1].append
+            requester = self._control_flow_scopes[-1].request_classical_resource
+        else:
+            appender = self._append
+            requester = self._resolve_classical_resource
+
+        instructions = InstructionSet(resource_requester=requester)
+        for gate, qarg in zip(gates, qargs):
+            instruction = CircuitInstruction(gate, qarg, ())
+            appender(instruction)
+            instructions.add(instruction)
+        return instructions
+
+    def _layer_qubits(self, pairs: _Pairs) -> List[Tuple[Qubit, Qubit]]:
+        array = np.asarray(pairs) if not isinstance(pairs, np.ndarray) else pairs
+        if (
+            np.issubdtype(array.dtype, np.integer)
+            and array.ndim == 2
+            and array.shape[1] == 2
+            and array.size > 0
+            and array.min() >= 0
+            and array.max() < self.num_qubits
+        ):
+            # Fast path for qubit indices
+            if np.any(array[:, 0] == array[:, 1]):
+                raise CircuitError("duplicate qubit arguments")
+            qubits = self.qubits
+            return [(qubits[a], qubits[b]) for a, b in array.tolist()]
+
+        qargs = []
+        for pair in pairs:
+            qarg = [qubit for specifier in pair for qubit in self.qbit_argument_conversion(specifier)]
+            if len(qarg) != 2:
+                raise CircuitError(f"Each pair must specify two qubits, but {pair} specifies {len(qarg)}")
+            if qarg[0] == qarg[1]:
+                raise CircuitError("duplicate qubit arguments")
+            qargs.append((qarg[0], qarg[1]))
+        return qargs
+
+
+def _layer_angles(angles: _Angles, num_pairs: int) -> List[ParameterValueType]:
+    if isinstance(angles, (Number, ParameterExpression)):
+        return [angles] * num_pairs
+    values = angles.tolist() if isinstance(angles, np.ndarray) else list(angles)
+    if len(values) != num_pairs:
+        raise CircuitError(f"Expected one angle per pair of qubits ({num_pairs}), but got {len(values)}")
+    return values
@@ -0,0 +1,244 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import re
+import warnings
+from math import pi
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
+
+import numpy as np
+
+from pyquil import Program
+from pyquil.gates import (
+    CCNOT,
+    CNOT,
+    CPHASE,
+    CPHASE00,
+    CPHASE01,
+    CPHASE10,
+    CSWAP,
+    CZ,
+    H,
+    I,
+    ISWAP,
+    MEASURE,
+    PHASE,
+    PSWAP,
+    RESET,
+    RX,
+    RY,
+    RZ,
+    S,
+    SWAP,
+    T,
+    XY,
+    Y,
+    Z,
+)
+from pyquil.quilatom import MemoryReference, ParameterDesignator, unpack_qubit
+from pyquil.quilbase import DefGate, Gate
+from qiskit import QuantumCircuit
+from qiskit.circuit import Clbit, Instruction, Parameter, ParameterExpression, ParameterVector, Qubit
+from qiskit.extensions import UnitaryGate
+
+PARAMETER_REGION = "qiskit_params"
+"""Name of the Quil memory region holding the values of a circuit's unbound parameters."""
+
+_GateTranslator = Callable[[Sequence[ParameterDesignator], Sequence[int]], List[Gate]]
+
+_GATES: Dict[str, _GateTranslator] = {
+    "id": lambda _, q: [I(q[0])],
+    "x": lambda _, q: [RX(pi, q[0])],
+    "y": lambda _, q: [Y(q[0])],
+    "z": lambda _, q: [Z(q[0])],
+    "h": lambda _, q: [H(q[0])],
+    "s": lambda _, q: [S(q[0])],
+    "sdg": lambda _, q: [S(q[0]).dagger()],
+    "t": lambda _, q: [T(q[0])],
+    "tdg": lambda _, q: [T(q[0]).dagger()],
+    "sx": lambda _, q: [RX(pi / 2, q[0])],
+    "sxdg": lambda _, q: [RX(-pi / 2, q[0])],
+    "rx": lambda p, q: [RX(p[0], q[0])],
+    "ry": lambda p, q: [RY(p[0], q[0])],
+    "rz": lambda p, q: [RZ(p[0], q[0])],
+    "p": lambda p, q: [PHASE(p[0], q[0])],
+    "u1": lambda p, q: [PHASE(p[0], q[0])],
+    "u2": lambda p, q: [RZ(p[1], q[0]), RY(pi / 2, q[0]), RZ(p[0], q[0])],
+    "u3": lambda p, q: [RZ(p[2], q[0]), RY(p[0], q[0]), RZ(p[1], q[0])],
+    "u": lambda p, q: [RZ(p[2], q[0]), RY(p[0], q[0]), RZ(p[1], q[0])],
+    "cx": lambda _, q: [CNOT(q[0], q[1])],
+    "cy": lambda _, q: [Y(q[1]).controlled(q[0])],
+    "cz": lambda _, q: [CZ(q[0], q[1])],
+    "ch": lambda _, q: [H(q[1]).controlled(q[0])],
+    "cp": lambda p, q: [CPHASE(p[0], q[0], q[1])],
+    "cu1": lambda p, q: [CPHASE(p[0], q[0], q[1])],
+    "crx": lambda p, q: [RX(p[0], q[1]).controlled(q[0])],
+    "cry": lambda p, q: [RY(p[0], q[1]).controlled(q[0])],
+    "crz": lambda p, q: [RZ(p[0], q[1]).controlled(q[0])],
+    "xx_plus_yy": lambda p, q: [RZ(p[1], q[0]), XY(-p[0], q[0], q[1]), RZ(-p[1], q[0])],
+    "swap": lambda _, q: [SWAP(q[0], q[1])],
+    "iswap": lambda _, q: [ISWAP(q[0], q[1])],
+    "ccx": lambda _, q: [CCNOT(q[0], q[1], q[2])],
+    "cswap": lambda _, q: [CSWAP(q[0], q[1], q[2])],
+    # NOTE: qiskit_rigetti.gates matrices are Quil's, whose qubits Qiskit orders least significant first
+    "xy": lambda p, q: [XY(p[0], q[1], q[0])],
+    "pswap": lambda p, q: [PSWAP(p[0], q[1], q[0])],
+    "cphase00": lambda p, q: [CPHASE00(p[0], q[1], q[0])],
+    "cphase01": lambda p, q: [CPHASE01(p[0], q[1], q[0])],
+    "cphase10": lambda p, q: [CPHASE10(p[0], q[1], q[0])],
+    "can": lambda p, q: [Gate("CAN", list(p), [unpack_qubit(q[1]), unpack_qubit(q[0])])],
+}
+"""
+Translations from Qiskit gate names to equivalent Quil gates. Single-qubit translations may differ from the Qiskit
+definition by a global phase. Gates in Rigetti ISAs are translated to their native form (e.g. ``x`` to ``RX(pi)``), so
+that circuits transpiled to a backend's target translate to native Quil.
+"""
+
+_DIRECTIVES = {"barrier", "measure", "reset"}
+
+
+def is_translatable(circuit: QuantumCircuit) -> bool:
+    """
+    Whether or not every instruction in the circuit can be translated with :func:`circuit_to_quil`.
+    """
+    return all(_is_translatable(instruction) for instruction, _, _ in circuit.data)
+
+
+def _is_translatable(instruction: Instruction) -> bool:
+    if instruction.condition is not None:
+        return False
+    if instruction.name in _GATES or instruction.name in _DIRECTIVES or isinstance(instruction, UnitaryGate):
+        return True
+    return instruction.definition is not None and is_translatable(instruction.definition)
+
+
+def circuit_to_quil(
+    circuit: QuantumCircuit, *, qubit_ids: Optional[Sequence[int]] = None
+) -> Tuple[Program, List[ParameterExpression]]:
+    """
+    Translate a circuit to a Quil program without going through OpenQASM.
+
+    Classical registers are declared as ``BIT`` regions of the same name. Gate arguments which depend on unbound
+    parameters are read from the ``REAL`` region :data:`PARAMETER_REGION`, with one slot per distinct expression.
+    Standard gates (including those in :mod:`qiskit_rigetti.gates`) are translated to Quil gates, unitary gates to
+    ``DEFGATE`` definitions of their matrices, and other gates via their definitions. Barriers are dropped.
+
+    Args:
+        circuit: Circuit to translate.
+        qubit_ids: Quil qubit for each of the circuit's qubits, e.g. to place a transpiled circuit on the physical
+            qubits of a device. Defaults to the circuit's qubit indices.
+
+    Returns:
+        The program and, for each slot of :data:`PARAMETER_REGION`, the expression whose value belongs in it.
+
+    Raises:
+        ValueError: If the circuit contains an instruction that cannot be translated.
+    """
+    qubit_indices = {bit: i if qubit_ids is None else qubit_ids[i] for i, bit in enumerate(circuit.qubits)}
+    clbit_refs = {bit: MemoryReference(reg.name, i) for reg in circuit.cregs for i, bit in enumerate(reg)}
+    expressions: Dict[ParameterExpression, int] = {}
+    defgates: Dict[Tuple[str, bytes], DefGate] = {}
+
+    def param(value: Any) -> ParameterDesignator:
+        if not isinstance(value, ParameterExpression):
+            return float(value)
+        if not value.parameters:
+            return float(value)
+        if value not in expressions:
+            expressions[value] = len(expressions)
+        return MemoryReference(PARAMETER_REGION, expressions[value])
+
+    def defgate(gate: UnitaryGate) -> DefGate:
+        matrix = np.asarray(gate.to_matrix(), dtype=complex)
+        key = (gate.name, matrix.tobytes())
+        if key not in defgates:
+            name = re.sub(r"[^A-Za-z0-9_]", "_", gate.label or gate.name).upper()
+            defgates[key] = DefGate(f"{name}_{len(defgates)}", matrix)
+        return defgates[key]
+
+    body = Program()
+
+    def translate(
+        data: Sequence[Tuple[Instruction, List[Qubit], List[Clbit]]],
+        qubit_map: Mapping[Qubit, int],
+        clbit_map: Mapping[Clbit, MemoryReference],
+    ) -> None:
+        nonlocal body
+        for instruction, qargs, cargs in data:
+            name = instruction.name
+            qubits = [qubit_map[q] for q in qargs]
+
+            if instruction.condition is not None:
+                raise ValueError(f"Conditional instructions cannot be translated to Quil: {name}")
+
+            if name == "barrier":
+                warnings.warn("barriers are currently omitted during execution on a RigettiQCSBackend")
+            elif name == "measure":
+                body += MEASURE(qubits[0], clbit_map[cargs[0]])
+            elif name == "reset":
+                body += RESET(qubits[0])
+            elif name in _GATES:
+                body += _GATES[name]([param(p) for p in instruction.params], qubits)
+            elif isinstance(instruction, UnitaryGate):
+                # NOTE: Qiskit orders a matrix's qubits least significant first, and Quil most significant first
+                body += cast(Gate, defgate(instruction).get_constructor()(*reversed(qubits)))
+            elif instruction.definition is not None:
+                definition = instruction.definition
+                translate(
+                    definition.data,
+                    dict(zip(definition.qubits, qubits)),
+                    {bit: clbit_map[carg] for bit, carg in zip(definition.clbits, cargs)},
+                )
+            else:
+                raise ValueError(f"Instruction cannot be translated to Quil: {name}")
+
+    translate(circuit.data, qubit_indices, clbit_refs)
+
+    program = Program()
+    for reg in circuit.cregs:
+        program.declare(reg.name, "BIT", reg.size)
+    if expressions:
+        program.declare(PARAMETER_REGION, "REAL", len(expressions))
+    program += list(defgates.values())
+    program += body
+
+    return program, list(expressions)
+
+
+def bind_expressions(
+    expressions: Sequence[ParameterExpression],
+    binding: Mapping[Union[Parameter, ParameterVector], Any],
+) -> List[float]:
+    """
+    Evaluate the expressions returned by :func:`circuit_to_quil` for a single parameter binding.
+
+    Raises:
+        ValueError: If the binding is missing a value for one of the expressions' parameters.
+    """
+    values: Dict[Parameter, Any] = {}
+    for parameter, value in binding.items():
+        if isinstance(parameter, ParameterVector):
+            values.update(zip(parameter, value))
+        else:
+            values[parameter] = value
+
+    result = []
+    for expression in expressions:
+        missing = expression.parameters - values.keys()
+        if missing:
+            names = sorted(p.name for p in missing)
+            raise ValueError(f"Parameter binding is missing values for {', '.join(names)}")
+        result.append(float(expression.bind({p: values[p] for p in expression.parameters})))
+    return result
@@ -0,0 +1,147 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, cast, overload
+
+import numpy as np
+from qiskit.result.models import ExperimentResult
+
+
+class PackedReadout:
+    """
+    Readout data for a single experiment, stored with 8 shots' bits per byte rather than one Python object per bit.
+    """
+
+    def __init__(self, states: "np.ndarray[Any, Any]") -> None:
+        """
+        Args:
+            states: Readout array of shape (shots, bits), holding 0 or 1 for each bit of each shot.
+        """
+        self.num_shots, self.num_bits = states.shape
+        self.data: "np.ndarray[Any, Any]" = np.packbits(states.astype(np.uint8), axis=1, bitorder="little")
+        """Packed readout of shape (shots, ceil(bits / 8)), with bit 0 in the low bit of the first byte."""
+
+    @classmethod
+    def concatenate(cls, readouts: Sequence["PackedReadout"], *, num_shots: Optional[int] = None) -> "PackedReadout":
+        """
+        Join readouts of the same bits (e.g. from chunks of one execution) shot-wise, without unpacking them.
+
+        Args:
+            readouts: Readouts to join, in order.
+            num_shots: If provided, only the first ``num_shots`` shots are kept.
+        """
+        readout = cls.__new__(cls)
+        readout.data = np.concatenate([r.data for r in readouts])[:num_shots]
+        readout.num_shots = readout.data.shape[0]
+        readout.num_bits = readouts[0].num_bits
+        return readout
+
+    def unpack(self, rows: Optional["np.ndarray[Any, Any]"] = None) -> "np.ndarray[Any, Any]":
+        """
+        Unpack to an array of shape (shots, bits), optionally only for the given shot indices.
+        """
+        data = self.data if rows is None else self.data[rows]
+        return np.unpackbits(data, axis=1, count=self.num_bits, bitorder="little")
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count the occurrences of each shot's binary string, only building strings for distinct outcomes.
+        """
+        if self.num_bits <= 64:
+            # View each shot's bytes as a single integer key
+            keys = np.zeros((self.num_shots, 8), dtype=np.uint8)
+            keys[:, : self.data.shape[1]] = self.data
+            _, first_idx, counts = np.unique(keys.view("<u8").ravel(), return_index=True, return_counts=True)
+        else:
+            _, first_idx, counts = np.unique(self.data, axis=0, return_index=True, return_counts=True)
+
+        return dict(zip(to_binary_strs(self.unpack(first_idx)), cast(List[int], counts.tolist())))
+
+    def memory(self) -> List[str]:
+        """
+        Build the binary string of every shot.
+        """
+        return to_binary_strs(self.unpack())
+
+
+class LazyMemory(Sequence[str]):
+    """
+    Per-shot binary strings of a :class:`PackedReadout`, built only once they are first accessed.
+    """
+
+    def __init__(self, readout: PackedReadout) -> None:
+        self._readout = readout
+        self._memory: Optional[List[str]] = None
+
+    def _materialize(self) -> List[str]:
+        if self._memory is None:
+            self._memory = self._readout.memory()
+        return self._memory
+
+    @overload
+    def __getitem__(self, idx: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[str, List[str]]:
+        return self._materialize()[idx]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return self._readout.num_shots
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyMemory):
+            other = other._materialize()
+        return self._materialize() == other
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
+class LazyExperimentResult(ExperimentResult):
+    """
+    Experiment result whose data's memory may be a :class:`LazyMemory`. The memory stays lazy in the experiment's data
+    (e.g. for :func:`qiskit.result.Result.get_counts`), and is only materialized to a plain list when the experiment
+    result itself is converted to a dictionary (e.g. for serialization by :func:`qiskit.result.Result.to_dict`).
+    """
+
+    def to_dict(self) -> Dict[str, Any]:
+        out_dict: Dict[str, Any] = super().to_dict()
+        if isinstance(out_dict["data"].get("memory"), LazyMemory):
+            out_dict["data"]["memory"] = list(out_dict["data"]["memory"])
+        return out_dict
+
+
+def to_binary_strs(states: "np.ndarray[Any, Any]") -> List[str]:
+    """
+    Convert a (shots x bits) readout array to one binary string per shot, with bit 0 rightmost.
+    """
+    # NOTE: According to https://arxiv.org/pdf/1809.03452.pdf, this should be a hex string
+    # but it results in missing leading zeros in the displayed output, and binary strings
+    # seem to work too. Hex string could be accomplished with:
+    #     hex(int(binary_str, 2))
+    num_shots, num_bits = states.shape
+    if num_bits == 0:
+        return [""] * num_shots
+
+    # Reverse bit order and shift to ASCII digits, then reinterpret each row as a fixed-width byte string
+    chars = np.ascontiguousarray(states[:, ::-1], dtype=np.uint8) + np.uint8(ord("0"))
+    return cast(List[str], chars.view(f"S{num_bits}").ravel().astype(f"U{num_bits}").tolist())
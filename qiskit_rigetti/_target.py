@@ -0,0 +1,125 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+from math import isclose, pi
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyquil.external.rpcq import CompilerISA, GateInfo, MeasureInfo
+from qiskit.circuit import Gate, Instruction, Measure, Parameter
+from qiskit.circuit.library import CPhaseGate, CZGate, IGate, RZGate, SXdgGate, SXGate, XGate, XXPlusYYGate
+from qiskit.transpiler import InstructionProperties, Target
+
+_THETA = Parameter("θ")
+_BETA = Parameter("β")
+
+# Qiskit equivalents of the fixed-angle RX gates in Rigetti ISAs, up to global phase
+_RX_GATES: List[Tuple[float, Gate]] = [
+    (0.0, IGate()),
+    (pi / 2, SXGate()),
+    (-pi / 2, SXdgGate()),
+    (pi, XGate()),
+    (-pi, XGate()),
+]
+
+# Qiskit equivalents of the parametric gates in Rigetti ISAs. XY(θ) is XX+YY(-θ, 0), which the translator emits as XY.
+_PARAMETRIC_GATES: Dict[str, Gate] = {
+    "RZ": RZGate(_THETA),
+    "CPHASE": CPhaseGate(_THETA),
+    "XY": XXPlusYYGate(_THETA, _BETA),
+}
+
+_FIXED_GATES: Dict[str, Gate] = {
+    "CZ": CZGate(),
+}
+
+
+def physical_qubits(isa: CompilerISA) -> List[int]:
+    """
+    IDs of the qubits in a quantum processor's ISA which can be used by transpiled circuits, in order: live qubits
+    with at least one live edge, or every live qubit if there are no live edges.
+    """
+    live_qubits = {int(q) for q, qubit in isa.qubits.items() if not qubit.dead}
+    connected_qubits = {
+        q for edge in isa.edges.values() if not edge.dead and live_qubits.issuperset(edge.ids) for q in edge.ids
+    }
+    return sorted(connected_qubits or live_qubits)
+
+
+def target_from_isa(isa: CompilerISA, *, description: Optional[str] = None) -> Target:
+    """
+    Build a transpiler target from a quantum processor's ISA, with its connectivity, native gates, and the duration
+    and error of each gate (and readout) where the ISA reports them.
+
+    Qubit IDs are often not contiguous (and the transpiler requires a connected device), so the target's qubits are
+    the :func:`physical_qubits` of the ISA, numbered in order. Gates are given as their Qiskit equivalents (e.g.
+    ``RX(pi/2)`` as ``sx``), and gates with no Qiskit equivalent are omitted.
+    """
+    indices = {qubit_id: idx for idx, qubit_id in enumerate(physical_qubits(isa))}
+    target = Target(description=description, num_qubits=len(indices))
+
+    instructions: Dict[str, Tuple[Instruction, Dict[Tuple[int, ...], Optional[InstructionProperties]]]] = {}
+
+    def add(instruction: Instruction, qubits: Tuple[int, ...], info: Any) -> None:
+        _, properties = instructions.setdefault(instruction.name, (instruction, {}))
+        properties[qubits] = _properties(info)
+
+    for q, qubit in isa.qubits.items():
+        if int(q) not in indices:
+            continue
+        for info in qubit.gates:
+            if isinstance(info, MeasureInfo):
+                if info.target is not None:
+                    add(Measure(), (indices[int(q)],), info)
+            elif isinstance(info, GateInfo):
+                for gate in _gates(info):
+                    add(gate, (indices[int(q)],), info)
+
+    for edge in isa.edges.values():
+        if edge.dead or not all(q in indices for q in edge.ids):
+            continue
+        first, second = (indices[q] for q in edge.ids)
+        for info in edge.gates:
+            if isinstance(info, GateInfo):
+                for gate in _gates(info):
+                    # NOTE: Rigetti two-qubit gates are symmetric, so each edge supports them in both directions
+                    add(gate, (first, second), info)
+                    add(gate, (second, first), info)
+
+    for instruction, properties in instructions.values():
+        target.add_instruction(instruction, properties)
+    return target
+
+
+def _gates(info: GateInfo) -> List[Gate]:
+    if info.operator == "RX" and len(info.parameters) == 1 and isinstance(info.parameters[0], (int, float)):
+        angle = float(info.parameters[0])
+        return [gate for gate_angle, gate in _RX_GATES if isclose(angle, gate_angle, abs_tol=1e-9)]
+    if info.operator in _PARAMETRIC_GATES:
+        return [_PARAMETRIC_GATES[info.operator]]
+    if info.operator in _FIXED_GATES:
+        return [_FIXED_GATES[info.operator]]
+    return []
+
+
+def _properties(info: Any) -> Optional[InstructionProperties]:
+    duration: Optional[float] = info.duration
+    fidelity: Optional[float] = info.fidelity
+    if duration is None and fidelity is None:
+        return None
+    return InstructionProperties(
+        # ISA durations are in nanoseconds
+        duration=duration * 1e-9 if duration is not None else None,
+        error=1 - fidelity if fidelity is not None else None,
+    )
@@ -15,11 +15,31 @@
 ##############################################################################
 __all__ = ["CanonicalGate"]
 
+from typing import Any, Optional
+
 import numpy as np
-from qiskit.extensions import UnitaryGate
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit.circuit.parameterexpression import ParameterValueType
+
+from ._matrix_gate import MatrixGate, cached_matrix
+
 
+def _can(alpha: float, beta: float, gamma: float) -> "np.ndarray[Any, Any]":
+    plus_minus = np.exp(1j * (alpha + beta - gamma) / 2)
+    minus_plus = np.exp(1j * (alpha - beta + gamma) / 2)
+    plus_plus = np.exp(1j * (alpha + beta + gamma) / (-2))
+    minus = np.exp(1j * (beta + gamma - alpha) / 2)
+    # fmt: off
+    return np.array([[plus_minus + minus_plus, 0,                      0,                      minus_plus - plus_minus],  # noqa: E241, E501
+                     [0,                       plus_plus + minus,      plus_plus - minus,      0                      ],  # noqa: E241, E202, E501
+                     [0,                       plus_plus - minus,      plus_plus + minus,      0                      ],  # noqa: E241, E202, E501
+                     [minus_plus - plus_minus, 0,                      0,                      plus_minus + minus_plus]]) / 2  # noqa: E241, E501
+    # fmt: on
 
-class CanonicalGate(UnitaryGate):
+
+class CanonicalGate(MatrixGate):
     """
     Class for representing a canonical gate
 
@@ -32,19 +52,42 @@ class CanonicalGate(UnitaryGate):
 
     """  # noqa: E501
 
-    def __init__(self, alpha: float, beta: float, gamma: float):
+    _matrix = cached_matrix(_can)
+
+    def __init__(
+        self,
+        alpha: ParameterValueType,
+        beta: ParameterValueType,
+        gamma: ParameterValueType,
+        label: Optional[str] = None,
+    ):
         """
         Args:
             alpha: X-axis phase angle
             beta: Y-axis phase angle
             gamma: Z-axis phase angle
+            label: Optional label for the gate
         """
-        # fmt: off
-        super().__init__(
-            np.array([[(np.exp(1j * (alpha + beta - gamma) / 2) + np.exp(1j * (alpha - beta + gamma) / 2)) / 2, 0,                                                                                          0,                                                                                          (np.exp(1j * (alpha - beta + gamma) / 2) - np.exp(1j * (alpha + beta - gamma) / 2)) / 2],    # noqa: E501, E241, E202
-                      [0,                                                                                       (np.exp(1j * (alpha + beta + gamma) / (-2)) + np.exp(1j * (beta + gamma - alpha) / 2)) / 2, (np.exp(1j * (alpha + beta + gamma) / (-2)) - np.exp(1j * (beta + gamma - alpha) / 2)) / 2, 0                                                                                      ],    # noqa: E501, E241, E202
-                      [0,                                                                                       (np.exp(1j * (alpha + beta + gamma) / (-2)) - np.exp(1j * (beta + gamma - alpha) / 2)) / 2, (np.exp(1j * (alpha + beta + gamma) / (-2)) + np.exp(1j * (beta + gamma - alpha) / 2)) / 2, 0                                                                                      ],    # noqa: E501, E241, E202
-                      [(np.exp(1j * (alpha - beta + gamma) / 2) - np.exp(1j * (alpha + beta - gamma) / 2)) / 2, 0,                                                                                          0,                                                                                          (np.exp(1j * (alpha + beta - gamma) / 2) + np.exp(1j * (alpha - beta + gamma) / 2)) / 2]]),  # noqa: E501, E241, E202
-            "can"
-        )
-        # fmt: on
+        super().__init__("can", 2, [alpha, beta, gamma], label=label)
+
+    def _define(self) -> None:
+        self.definition = _definition(*self.params)
+
+    def inverse(self) -> "CanonicalGate":
+        return CanonicalGate(*(-p for p in self.params))
+
+
+def _definition(alpha: ParameterValueType, beta: ParameterValueType, gamma: ParameterValueType) -> QuantumCircuit:
+    q = QuantumRegister(2, "q")
+    definition = QuantumCircuit(q, name="can")
+    # NOTE: The rotations commute. Their angles follow from the matrix above, which is quilc's definition of CAN.
+    definition.rxx(beta, q[0], q[1])
+    definition.ryy(gamma, q[0], q[1])
+    definition.rzz(-alpha, q[0], q[1])
+    return definition
+
+
+_alpha = Parameter("alpha")
+_beta = Parameter("beta")
+_gamma = Parameter("gamma")
+SessionEquivalenceLibrary.add_equivalence(CanonicalGate(_alpha, _beta, _gamma), _definition(_alpha, _beta, _gamma))
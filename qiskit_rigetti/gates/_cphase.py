@@ -19,11 +19,19 @@ __all__ = [
     "CPhase10Gate",
 ]
 
+from math import pi
+from typing import Optional, Sequence
+
 from pyquil.simulation.matrices import CPHASE00, CPHASE01, CPHASE10
-from qiskit.extensions import UnitaryGate
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit.circuit.parameterexpression import ParameterValueType
+
+from ._matrix_gate import MatrixGate, cached_matrix
 
 
-class CPhase00Gate(UnitaryGate):
+class CPhase00Gate(MatrixGate):
     """
     Class for representing a CPhase00 gate, a variant of CPhase that affects state ``|00>``
 
@@ -36,15 +44,24 @@ class CPhase00Gate(UnitaryGate):
 
     """
 
-    def __init__(self, theta: float):
+    _matrix = cached_matrix(CPHASE00)
+
+    def __init__(self, theta: ParameterValueType, label: Optional[str] = None):
         """
         Args:
             theta: Phase angle
+            label: Optional label for the gate
         """
-        super().__init__(CPHASE00(theta), "cphase00")
+        super().__init__("cphase00", 2, [theta], label=label)
+
+    def _define(self) -> None:
+        self.definition = _definition(self.name, self.params[0], [0, 1])
+
+    def inverse(self) -> "CPhase00Gate":
+        return CPhase00Gate(-self.params[0])
 
 
-class CPhase01Gate(UnitaryGate):
+class CPhase01Gate(MatrixGate):
     """
     Class for representing a CPhase01 gate, a variant of CPhase that affects state ``|01>``
 
@@ -56,15 +73,24 @@ class CPhase01Gate(UnitaryGate):
                            [0, 0,            0, 1]]
     """
 
-    def __init__(self, theta: float):
+    _matrix = cached_matrix(CPHASE01)
+
+    def __init__(self, theta: ParameterValueType, label: Optional[str] = None):
         """
         Args:
             theta: Phase angle
+            label: Optional label for the gate
         """
-        super().__init__(CPHASE01(theta), "cphase01")
+        super().__init__("cphase01", 2, [theta], label=label)
+
+    def _define(self) -> None:
+        self.definition = _definition(self.name, self.params[0], [1])
+
+    def inverse(self) -> "CPhase01Gate":
+        return CPhase01Gate(-self.params[0])
 
 
-class CPhase10Gate(UnitaryGate):
+class CPhase10Gate(MatrixGate):
     """
     Class for representing a CPhase10 gate, a variant of CPhase that affects state ``|10>``
 
@@ -76,9 +102,67 @@ class CPhase10Gate(UnitaryGate):
                            [0, 0, 0,            1]]
     """
 
-    def __init__(self, theta: float):
+    _matrix = cached_matrix(CPHASE10)
+
+    def __init__(self, theta: ParameterValueType, label: Optional[str] = None):
         """
         Args:
             theta: Phase angle
+            label: Optional label for the gate
         """
-        super().__init__(CPHASE10(theta), "cphase10")
+        super().__init__("cphase10", 2, [theta], label=label)
+
+    def _define(self) -> None:
+        self.definition = _definition(self.name, self.params[0], [0])
+
+    def inverse(self) -> "CPhase10Gate":
+        return CPhase10Gate(-self.params[0])
+
+
+def _definition(name: str, theta: ParameterValueType, flipped: Sequence[int]) -> QuantumCircuit:
+    """
+    CPhase conjugated by X on the ``flipped`` qubits, so that the phase is applied to the state they are 0 in.
+    """
+    q = QuantumRegister(2, "q")
+    definition = QuantumCircuit(q, name=name)
+    for i in flipped:
+        definition.x(q[i])
+    definition.cp(theta, q[0], q[1])
+    for i in flipped:
+        definition.x(q[i])
+    return definition
+
+
+def _native_definition(name: str, theta: ParameterValueType, flipped: Sequence[int]) -> QuantumCircuit:
+    """
+    As :func:`_definition`, in terms of the CZ, RZ and RX gates native to Rigetti quantum processors. CPhase is
+    equivalent to ``RZ(theta/2)`` on each qubit after ``RZZ(-theta/2)``, which is two CZs around an RX on the target,
+    conjugated by ``RY(pi/2)``.
+    """
+    q = QuantumRegister(2, "q")
+    # NOTE: RX(pi) is -i * X, so each qubit flipped and unflipped with RX(pi) adds a phase of -1
+    definition = QuantumCircuit(q, name=name, global_phase=theta / 4 + pi * len(flipped))
+    for i in flipped:
+        definition.rx(pi, q[i])
+    # RY(pi/2)
+    definition.rz(-pi / 2, q[1])
+    definition.rx(pi / 2, q[1])
+    definition.rz(pi / 2, q[1])
+    definition.cz(q[0], q[1])
+    definition.rx(-theta / 2, q[1])
+    definition.cz(q[0], q[1])
+    # RY(-pi/2)
+    definition.rz(-pi / 2, q[1])
+    definition.rx(-pi / 2, q[1])
+    definition.rz(pi / 2, q[1])
+    definition.rz(theta / 2, q[0])
+    definition.rz(theta / 2, q[1])
+    for i in flipped:
+        definition.rx(pi, q[i])
+    return definition
+
+
+_theta = Parameter("theta")
+for _gate, _flipped in [(CPhase00Gate(_theta), [0, 1]), (CPhase01Gate(_theta), [1]), (CPhase10Gate(_theta), [0])]:
+    SessionEquivalenceLibrary.add_equivalence(_gate, _definition(_gate.name, _theta, _flipped))
+    SessionEquivalenceLibrary.add_equivalence(_gate, _native_definition(_gate.name, _theta, _flipped))
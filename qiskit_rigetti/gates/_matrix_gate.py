@@ -0,0 +1,79 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+from qiskit.circuit import Gate
+from qiskit.circuit.parameterexpression import ParameterValueType
+
+MatrixFunction = Callable[..., "np.ndarray[Any, Any]"]
+
+MATRIX_CACHE_SIZE = 1024
+"""Number of matrices kept per gate class, keyed by angles, so that gates with repeated angles share one matrix."""
+
+
+def cached_matrix(fn: MatrixFunction) -> MatrixFunction:
+    """
+    Wrap a function from angles to a gate matrix with a shared cache. Cached matrices are read-only, as they are
+    returned to every gate with the same angles.
+    """
+
+    @lru_cache(maxsize=MATRIX_CACHE_SIZE)
+    def wrapper(*angles: float) -> "np.ndarray[Any, Any]":
+        matrix = np.asarray(fn(*angles), dtype=complex)
+        matrix.setflags(write=False)
+        return matrix
+
+    return wrapper
+
+
+class MatrixGate(Gate):
+    """
+    Base class for parameterized gates whose matrix is only computed when it is needed, e.g. by
+    :func:`qiskit.circuit.Gate.to_matrix` or a simulator, rather than when the gate is created. Angles may be
+    :class:`qiskit.circuit.Parameter` expressions, in which case the matrix is available once they are bound.
+
+    Subclasses provide ``_matrix``, a :func:`cached_matrix` function of the gate's angles, and an exact ``_define``
+    decomposition into standard gates.
+    """
+
+    _matrix: MatrixFunction
+
+    def __init__(
+        self, name: str, num_qubits: int, params: Sequence[ParameterValueType], label: Optional[str] = None
+    ) -> None:
+        super().__init__(name, num_qubits, list(params), label=label)
+
+    def __array__(self, dtype: Any = None) -> "np.ndarray[Any, Any]":
+        # NOTE: float() raises a TypeError for expressions with unbound parameters
+        matrix = type(self)._matrix(*(float(p) for p in self.params))
+        return matrix if dtype is None else np.asarray(matrix, dtype=dtype)
+
+    def __eq__(self, other: Any) -> bool:
+        # NOTE: Instruction.__eq__ also compares definitions, which would synthesize them for every comparison
+        return (
+            type(self) is type(other)
+            and len(self.params) == len(other.params)
+            and all(_angles_equal(a, b) for a, b in zip(self.params, other.params))
+        )
+
+
+def _angles_equal(a: ParameterValueType, b: ParameterValueType) -> bool:
+    try:
+        return bool(np.isclose(float(a), float(b), atol=1e-10, rtol=0))
+    except TypeError:
+        return bool(a == b)
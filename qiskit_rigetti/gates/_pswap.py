@@ -15,11 +15,18 @@
 ##############################################################################
 __all__ = ["PSwapGate"]
 
+from typing import Optional
+
 from pyquil.simulation.matrices import PSWAP
-from qiskit.extensions import UnitaryGate
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit.circuit.parameterexpression import ParameterValueType
+
+from ._matrix_gate import MatrixGate, cached_matrix
 
 
-class PSwapGate(UnitaryGate):
+class PSwapGate(MatrixGate):
     """
     Class for representing a parametric Swap gate
 
@@ -31,9 +38,33 @@ class PSwapGate(UnitaryGate):
                         [0, 0,              0,              1]]
     """
 
-    def __init__(self, theta: float):
+    _matrix = cached_matrix(PSWAP)
+
+    def __init__(self, theta: ParameterValueType, label: Optional[str] = None):
         """
         Args:
             theta: Phase angle
+            label: Optional label for the gate
         """
-        super().__init__(PSWAP(theta), "pswap")
+        super().__init__("pswap", 2, [theta], label=label)
+
+    def _define(self) -> None:
+        self.definition = _definition(self.params[0])
+
+    def inverse(self) -> "PSwapGate":
+        return PSwapGate(-self.params[0])
+
+
+def _definition(theta: ParameterValueType) -> QuantumCircuit:
+    q = QuantumRegister(2, "q")
+    definition = QuantumCircuit(q, name="pswap")
+    # diag(1, exp(i * theta), exp(i * theta), 1), then swap
+    definition.p(theta, q[0])
+    definition.p(theta, q[1])
+    definition.cp(-2 * theta, q[0], q[1])
+    definition.swap(q[0], q[1])
+    return definition
+
+
+_theta = Parameter("theta")
+SessionEquivalenceLibrary.add_equivalence(PSwapGate(_theta), _definition(_theta))
@@ -15,11 +15,19 @@
 ##############################################################################
 __all__ = ["XYGate"]
 
+from typing import Optional
+
 from pyquil.simulation.matrices import XY
-from qiskit.extensions import UnitaryGate
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit.circuit.library import XXPlusYYGate
+from qiskit.circuit.parameterexpression import ParameterValueType
+
+from ._matrix_gate import MatrixGate, cached_matrix
 
 
-class XYGate(UnitaryGate):
+class XYGate(MatrixGate):
     """
     Class for representing an XY gate (parametric iSwap gate)
 
@@ -33,9 +41,29 @@ class XYGate(UnitaryGate):
     See https://arxiv.org/pdf/1912.04424.pdf for technical details.
     """
 
-    def __init__(self, theta: float):
+    _matrix = cached_matrix(XY)
+
+    def __init__(self, theta: ParameterValueType, label: Optional[str] = None):
         """
         Args:
             theta: Phase angle
+            label: Optional label for the gate
         """
-        super().__init__(XY(theta), "xy")
+        super().__init__("xy", 2, [theta], label=label)
+
+    def _define(self) -> None:
+        self.definition = _definition(self.params[0])
+
+    def inverse(self) -> "XYGate":
+        return XYGate(-self.params[0])
+
+
+def _definition(theta: ParameterValueType) -> QuantumCircuit:
+    q = QuantumRegister(2, "q")
+    definition = QuantumCircuit(q, name="xy")
+    definition.append(XXPlusYYGate(-theta), [q[0], q[1]])
+    return definition
+
+
+_theta = Parameter("theta")
+SessionEquivalenceLibrary.add_equivalence(XYGate(_theta), _definition(_theta))
@@ -1,10 +1,89 @@
-from typing import Callable
+from abc import ABC, abstractmethod
+from typing import Callable, List, Sequence, Union
+
+from pyquil import Program
+from pyquil.quilbase import Pragma
 
 PreCompilationHook = Callable[[str], str]
 """Represents a function that can transform a QASM program string just before compilation."""
 
 
-def set_rewiring(rewiring: str) -> PreCompilationHook:
+class ProgramHook(ABC):
+    """
+    Base class for structured pre-compilation hooks, which modify a Quil program in place just before compilation
+    rather than transforming its text. A chain of program hooks is applied to the same program in a single pass.
+
+    Subclasses implement :func:`apply`, and may implement :func:`apply_qasm` to also support circuits which are
+    compiled by way of OpenQASM (e.g. alongside string hooks, or when a circuit cannot be translated to Quil). Running
+    such a circuit with a hook which does not implement :func:`apply_qasm` fails.
+    """
+
+    @abstractmethod
+    def apply(self, program: Program) -> None:
+        """
+        Modify the program in place, e.g. by inserting pragmas or rewriting instructions.
+        """
+
+    def apply_qasm(self, qasm: str) -> str:
+        """
+        Transform an OpenQASM program string, for circuits which are compiled by way of OpenQASM.
+
+        Raises:
+            NotImplementedError: If this hook only supports Quil programs.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot be applied to OpenQASM programs")
+
+
+class QasmHookAdapter(ProgramHook):
+    """
+    Adapts a :data:`PreCompilationHook` (a function over OpenQASM strings) to a :class:`ProgramHook`. Circuits whose
+    hooks include one of these are compiled by way of OpenQASM, as there is no Quil program for it to transform.
+    """
+
+    def __init__(self, fn: PreCompilationHook) -> None:
+        """
+        Args:
+            fn: String hook to adapt.
+        """
+        self.fn = fn
+
+    def apply(self, program: Program) -> None:
+        raise NotImplementedError("String pre-compilation hooks can only be applied to OpenQASM programs")
+
+    def apply_qasm(self, qasm: str) -> str:
+        return self.fn(qasm)
+
+
+def supports_qasm(hook: ProgramHook) -> bool:
+    """
+    Whether or not a program hook implements :func:`ProgramHook.apply_qasm`, and so can be applied to circuits which are
+    compiled by way of OpenQASM.
+    """
+    return type(hook).apply_qasm is not ProgramHook.apply_qasm
+
+
+def as_program_hooks(hooks: Sequence[Union[PreCompilationHook, ProgramHook]]) -> List[ProgramHook]:
+    """
+    Adapt any string hooks among the given pre-compilation hooks with :class:`QasmHookAdapter`.
+    """
+    return [hook if isinstance(hook, ProgramHook) else QasmHookAdapter(hook) for hook in hooks]
+
+
+class _SetRewiring(ProgramHook):
+    def __init__(self, rewiring: str) -> None:
+        self.rewiring = rewiring
+
+    def apply(self, program: Program) -> None:
+        program.prepend_instructions([Pragma("INITIAL_REWIRING", freeform_string=self.rewiring)])
+
+    def apply_qasm(self, qasm: str) -> str:
+        return qasm.replace("OPENQASM 2.0;", f'OPENQASM 2.0;\n#pragma INITIAL_REWIRING "{self.rewiring}";')
+
+    # NOTE: Calling the hook directly keeps working as it did when this was a string hook
+    __call__ = apply_qasm
+
+
+def set_rewiring(rewiring: str) -> ProgramHook:
     """
     Create a hook which will apply rewiring before compilation.
 
@@ -14,7 +93,8 @@ def set_rewiring(rewiring: str) -> PreCompilationHook:
         rewiring: Rewiring directive to apply.
 
     Returns:
-        PreCompilationHook: A hook to apply rewiring.
+        ProgramHook: A hook to apply rewiring. It may also be called with an OpenQASM string, like a
+        :data:`PreCompilationHook`.
 
     Examples:
         Applying rewiring to a program::
@@ -29,8 +109,4 @@ def set_rewiring(rewiring: str) -> PreCompilationHook:
             >>> _ = circuit.measure([0, 1], [0, 1])
             >>> job = execute(circuit, backend, shots=10, before_compile=[set_rewiring("NAIVE")])
     """
-
-    def fn(qasm: str) -> str:
-        return qasm.replace("OPENQASM 2.0;", f'OPENQASM 2.0;\n#pragma INITIAL_REWIRING "{rewiring}";')
-
-    return fn
+    return _SetRewiring(rewiring)
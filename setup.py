@@ -52,7 +52,7 @@ setup(
         'importlib-metadata; python_version < "3.8"',
         "numpy==1.*,>=1.20.1",
         "pyquil==3.*,>=3.0.0",
-        "qiskit==0.*,>=0.27.0",
+        "qiskit<1.0,>=0.37.0",
     ],
     extras_require={
         "dev": [
@@ -0,0 +1,43 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+
+
+def test_main(tmp_path, capsys):
+    output = tmp_path / "benchmarks.json"
+    args = ["--quick", "--repeat", "1", "--min-time", "0", "--output", str(output)]
+
+    main(args + ["--suite", "submission", "--suite", "results"])
+    baseline = json.loads(output.read_text())
+    assert set(baseline["metadata"]) >= {"date", "python", "versions"}
+    assert {r["name"] for r in baseline["results"]} >= {"backend.run", "job.result"}
+    assert all(r["median"] > 0 for r in baseline["results"])
+
+    baseline_path = tmp_path / "baseline.json"
+    output.rename(baseline_path)
+    main(args + ["--suite", "results", "--baseline", str(baseline_path)])
+    assert "job.result" in capsys.readouterr().out
+
+
+def test_main__help(capsys):
+    with pytest.raises(SystemExit):
+        main(["--help"])
+
+    assert "Run the offline benchmarks" in capsys.readouterr().out
@@ -0,0 +1,100 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest_httpx import HTTPXMock
+from qcs_api_client.client import QCSClientConfiguration
+from qcs_api_client.client._configuration.secrets import QCSClientConfigurationSecretsCredentials, TokenPayload
+
+from qiskit_rigetti import DeviceCatalog, RigettiQCSProvider
+from qiskit_rigetti._device_catalog import DEVICES_URL
+
+
+def test_get(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=DEVICES_URL, json={"devices": {"Device-1": {"num_qubits": 1}}})
+    catalog = DeviceCatalog()
+
+    assert catalog.get() == {"Device-1": {"num_qubits": 1}}
+    assert catalog.get() == {"Device-1": {"num_qubits": 1}}
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_get__stale(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=DEVICES_URL, json={"devices": {"Device-1": {"num_qubits": 1}}})
+    httpx_mock.add_response(url=DEVICES_URL, json={"devices": {"Device-2": {"num_qubits": 2}}})
+    catalog = DeviceCatalog(ttl=0)
+
+    assert catalog.get() == {"Device-1": {"num_qubits": 1}}
+    assert catalog.get() == {"Device-1": {"num_qubits": 1}}, "stale catalog not returned while refreshing"
+
+    deadline = time.monotonic() + 5
+    while catalog._refreshing:
+        assert time.monotonic() < deadline, "catalog not refreshed in the background"
+        time.sleep(0.01)
+    assert catalog._entry[1] == {"Device-2": {"num_qubits": 2}}
+
+
+def test_get__persisted(httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_response(url=DEVICES_URL, json={"devices": {"Device-1": {"num_qubits": 1}}})
+    path = str(tmp_path / "catalog" / "devices.json")
+
+    DeviceCatalog(path=path).get()
+    catalog = DeviceCatalog(path=path)  # e.g. after a restart
+
+    assert catalog.get() == {"Device-1": {"num_qubits": 1}}
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_save__concurrent(tmp_path):
+    path = tmp_path / "devices.json"
+    catalog = DeviceCatalog(path=str(path))
+
+    def save(idx: int) -> None:
+        for _ in range(20):
+            catalog._save((time.time(), {f"Device-{idx}": {"num_qubits": idx}}))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(save, range(8)))
+
+    assert len(json.loads(path.read_text())["devices"]) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["devices.json"], "temporary files left behind"
+
+
+def test_shared_across_providers(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=DEVICES_URL, json={"devices": {"Device-1": {"num_qubits": 1}}})
+    catalog = DeviceCatalog()
+
+    RigettiQCSProvider(device_catalog=catalog).backends()
+    backends = RigettiQCSProvider(device_catalog=catalog).backends()
+
+    assert [b.name() for b in backends] == ["Device-1"]
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_shared():
+    configuration = QCSClientConfiguration.load()
+    other_credentials = configuration.copy(deep=True)
+    other_credentials.secrets.credentials[
+        configuration.profile.credentials_name
+    ] = QCSClientConfigurationSecretsCredentials(token_payload=TokenPayload(refresh_token="other"))
+
+    catalog = DeviceCatalog.shared(configuration)
+
+    assert DeviceCatalog.shared(QCSClientConfiguration.load()) is catalog
+    assert DeviceCatalog.shared(other_credentials) is not catalog
@@ -0,0 +1,164 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import networkx as nx
+from pyquil.quantum_processor import NxQuantumProcessor
+from pytest_mock import MockerFixture
+
+from qiskit_rigetti import ExecutableCache, DiskExecutableCache
+from qiskit_rigetti._executable_cache import CompilerFingerprint
+
+
+def test_get__miss():
+    cache = ExecutableCache()
+
+    assert cache.get("key") is None
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+
+def test_get__hit():
+    cache = ExecutableCache()
+    cache.put("key", "value", size=5)
+
+    assert cache.get("key") == "value"
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_put__max_entries():
+    cache = ExecutableCache(max_entries=2)
+    cache.put("a", "1", size=1)
+    cache.put("b", "2", size=1)
+    cache.get("a")  # "b" becomes least recently used
+    cache.put("c", "3", size=1)
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_put__max_size():
+    cache = ExecutableCache(max_size=10)
+    cache.put("a", "1", size=6)
+    cache.put("b", "2", size=6)
+
+    assert len(cache) == 1
+    assert cache.size == 6
+    assert cache.evictions == 1
+    assert cache.get("a") is None
+
+
+def test_put__larger_than_max_size():
+    cache = ExecutableCache(max_size=10)
+    cache.put("a", "1", size=11)
+
+    assert len(cache) == 0
+    assert cache.evictions == 0
+
+
+def test_put__replace():
+    cache = ExecutableCache()
+    cache.put("a", "1", size=6)
+    cache.put("a", "2", size=4)
+
+    assert len(cache) == 1
+    assert cache.size == 4
+    assert cache.get("a") == "2"
+
+
+def test_clear():
+    cache = ExecutableCache()
+    cache.put("a", "1", size=1)
+    cache.get("a")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.get("a") is None
+    assert cache.hits == 1
+
+
+def test_key():
+    assert ExecutableCache.key("qasm", "3q-qvm", 100) == ExecutableCache.key("qasm", "3q-qvm", 100)
+    assert ExecutableCache.key("qasm", "3q-qvm", 100) != ExecutableCache.key("qasm", "3q-qvm", 1000)
+    assert ExecutableCache.key("ab", "c") != ExecutableCache.key("a", "bc")
+
+
+def test_disk_cache__get(tmp_path):
+    cache = DiskExecutableCache(str(tmp_path / "cache.db"))
+    cache.put("key", "fingerprint", {"value": 42})
+
+    assert cache.get("key", "fingerprint") == {"value": 42}
+    assert cache.get("other", "fingerprint") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_disk_cache__fingerprint_mismatch(tmp_path):
+    cache = DiskExecutableCache(str(tmp_path / "cache.db"))
+    cache.put("key", "fingerprint", "value")
+
+    assert cache.get("key", "new-fingerprint") is None
+    assert len(cache) == 0, "stale entry not removed"
+
+
+def test_disk_cache__shared(tmp_path):
+    path = str(tmp_path / "nested" / "cache.db")
+    DiskExecutableCache(path).put("key", "fingerprint", "value")
+
+    assert DiskExecutableCache(path).get("key", "fingerprint") == "value"
+
+
+def test_disk_cache__max_size(tmp_path):
+    value = "x" * 100
+    cache = DiskExecutableCache(str(tmp_path / "cache.db"), max_size=250)
+    cache.put("a", "fingerprint", value)
+    cache.put("b", "fingerprint", value)
+    cache.get("a", "fingerprint")  # "b" becomes least recently used
+    cache.put("c", "fingerprint", value)
+
+    assert len(cache) == 2
+    assert cache.size <= 250
+    assert cache.evictions == 1
+    assert cache.get("b", "fingerprint") is None
+
+
+def test_disk_cache__clear(tmp_path):
+    cache = DiskExecutableCache(str(tmp_path / "cache.db"))
+    cache.put("key", "fingerprint", "value")
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_compiler_fingerprint(mocker: MockerFixture):
+    qc = mocker.Mock()
+    qc.quantum_processor = NxQuantumProcessor(nx.from_edgelist([(0, 1)]))
+    qc.compiler.get_version_info.return_value = {"quilc": "1.23.0"}
+    fingerprint = CompilerFingerprint(qc)
+
+    qc.compiler.get_version_info.assert_not_called()
+    value = fingerprint.get()
+
+    assert fingerprint.get() == value
+    qc.compiler.get_version_info.assert_called_once()
+
+    qc.compiler.get_version_info.return_value = {"quilc": "1.24.0"}
+    assert CompilerFingerprint(qc).get() != value
@@ -15,7 +15,12 @@
 ##############################################################################
 import numpy as np
 from numpy.testing import assert_allclose
+from qiskit import transpile
+from qiskit.circuit import Parameter
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit.quantum_info import Operator
 
+from qiskit_rigetti import QuilCircuit
 from qiskit_rigetti.gates import (
     CanonicalGate,
     CPhase00Gate,
@@ -81,3 +86,67 @@ def test_canonical_gate():
 
     )
     # fmt: on
+
+
+def test_gates__parameters():
+    theta = Parameter("theta")
+    circuit = QuilCircuit(2)
+    circuit.xy(theta, 0, 1)
+    circuit.can(0.1, theta, 2 * theta, 0, 1)
+
+    bound = circuit.bind_parameters({theta: 3.14})
+
+    expected = QuilCircuit(2)
+    expected.xy(3.14, 0, 1)
+    expected.can(0.1, 3.14, 6.28, 0, 1)
+    assert Operator(bound).equiv(Operator(expected))
+
+
+def test_gates__shared_matrix():
+    assert XYGate(3.14).to_matrix() is XYGate(3.14).to_matrix()
+    assert not XYGate(3.14).to_matrix().flags.writeable
+
+
+def test_gates__inverse():
+    for gate in make_gates():
+        assert_allclose(gate.inverse().to_matrix() @ gate.to_matrix(), np.eye(4), atol=1e-12)
+
+
+def test_gates__definitions():
+    for gate in make_gates():
+        assert_allclose(Operator(gate.definition).data, gate.to_matrix(), atol=1e-12)
+
+
+def test_gates__equivalences():
+    for gate in make_gates():
+        equivalences = SessionEquivalenceLibrary.get_entry(gate)
+        assert len(equivalences) > 0
+        for equivalence in equivalences:
+            bound = equivalence.assign_parameters(dict(zip(equivalence.parameters, gate.params)))
+            assert_allclose(Operator(bound).data, gate.to_matrix(), atol=1e-12)
+
+
+def test_gates__transpile():
+    circuit = QuilCircuit(3)
+    circuit.xy(0.1, 0, 1)
+    circuit.cphase00(0.2, 1, 2)
+    circuit.cphase01(0.3, 2, 0)
+    circuit.cphase10(0.4, 0, 2)
+    circuit.pswap(0.5, 1, 0)
+    circuit.can(0.6, 0.7, 0.8, 2, 1)
+
+    transpiled = transpile(circuit, basis_gates=["rx", "rz", "cz"], optimization_level=0)
+
+    assert set(transpiled.count_ops()) <= {"rx", "rz", "cz"}
+    assert Operator(transpiled).equiv(Operator(circuit))
+
+
+def make_gates():
+    return [
+        CanonicalGate(3.14, 42.0, 1.62),
+        CPhase00Gate(3.14),
+        CPhase01Gate(3.14),
+        CPhase10Gate(3.14),
+        PSwapGate(3.14),
+        XYGate(3.14),
+    ]
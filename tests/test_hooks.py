@@ -1,6 +1,13 @@
+import pytest
 from pyquil import Program
 
-from qiskit_rigetti.hooks.pre_compilation import set_rewiring
+from qiskit_rigetti.hooks.pre_compilation import (
+    ProgramHook,
+    QasmHookAdapter,
+    as_program_hooks,
+    set_rewiring,
+    supports_qasm,
+)
 from qiskit_rigetti.hooks.pre_execution import enable_active_reset
 
 
@@ -24,6 +31,46 @@ def test_set_rewiring():
     )
 
 
+def test_set_rewiring__program():
+    hook = set_rewiring("NAIVE")
+    program = Program("DECLARE ro BIT[2]", "H 0")
+
+    hook.apply(program)
+
+    assert program == Program(
+        'PRAGMA INITIAL_REWIRING "NAIVE"',
+        "DECLARE ro BIT[2]",
+        "H 0",
+    )
+
+
+def test_as_program_hooks():
+    def string_hook(qasm: str) -> str:
+        return qasm.replace("h q[0];", "x q[0];")
+
+    rewiring = set_rewiring("NAIVE")
+    hooks = as_program_hooks([rewiring, string_hook])
+
+    assert hooks[0] is rewiring
+    assert isinstance(hooks[1], QasmHookAdapter)
+    assert hooks[1].apply_qasm("h q[0];") == "x q[0];"
+    with pytest.raises(NotImplementedError):
+        hooks[1].apply(Program())
+
+
+def test_program_hook():
+    class QuilOnlyHook(ProgramHook):
+        def apply(self, program: Program) -> None:
+            program.prepend_instructions(["RESET"])
+
+    with pytest.raises(TypeError):
+        ProgramHook()
+
+    assert not supports_qasm(QuilOnlyHook())
+    assert supports_qasm(set_rewiring("NAIVE"))
+    assert supports_qasm(QasmHookAdapter(lambda qasm: qasm))
+
+
 def test_enable_active_reset():
     hook = enable_active_reset
     quil = Program(
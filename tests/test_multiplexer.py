@@ -0,0 +1,44 @@
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+from qiskit_rigetti._multiplexer import can_multiplex, combine_circuits, pack_circuits
+
+
+def test_can_multiplex():
+    assert can_multiplex(make_circuit(2))
+    assert not can_multiplex(QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "c")))
+    assert not can_multiplex(
+        QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"), ClassicalRegister(1, "other"))
+    )
+
+
+def test_pack_circuits():
+    circuits = [
+        make_circuit(2),
+        make_circuit(3),
+        make_circuit(6),
+        QuantumCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "c")),
+        make_circuit(1),
+        make_circuit(4),
+    ]
+
+    assert pack_circuits(circuits, max_qubits=5) == [[0, 1], [2], [3], [4, 5]]
+
+
+def test_combine_circuits():
+    first = make_circuit(1)
+    first.x(0)
+    second = make_circuit(2)
+    second.cx(0, 1)
+
+    combined, readout_slices = combine_circuits([first, second])
+
+    assert combined.num_qubits == 3
+    assert [(reg.name, reg.size) for reg in combined.cregs] == [("ro", 3)]
+    assert readout_slices == [slice(0, 1), slice(1, 3)]
+    assert [
+        (instruction.name, [combined.find_bit(q).index for q in qargs]) for instruction, qargs, _ in combined.data
+    ] == [("x", [0]), ("cx", [1, 2])]
+
+
+def make_circuit(num_qubits: int) -> QuantumCircuit:
+    return QuantumCircuit(QuantumRegister(num_qubits, "q"), ClassicalRegister(num_qubits, "ro"))
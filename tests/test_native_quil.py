@@ -0,0 +1,68 @@
+import networkx as nx
+import numpy as np
+from pyquil import Program
+from pyquil.quantum_processor import NxQuantumProcessor
+from pytest_mock import MockerFixture
+
+from qiskit_rigetti import NativeQuilChecker
+
+
+def make_checker(mocker: MockerFixture) -> NativeQuilChecker:
+    qc = mocker.Mock()
+    qc.to_compiler_isa.return_value = NxQuantumProcessor(nx.from_edgelist([(0, 1), (1, 2)])).to_compiler_isa()
+    return NativeQuilChecker(qc)
+
+
+def test_is_native(mocker: MockerFixture):
+    checker = make_checker(mocker)
+
+    assert checker.is_native(
+        Program(
+            "RESET",
+            "DECLARE ro BIT[2]",
+            "DECLARE theta REAL[1]",
+            "RX(pi/2) 0",
+            "RZ(0.123) 1",
+            "RZ(theta[0]) 1",
+            "CZ 1 0",
+            "XY(0.5) 1 2",
+            "MEASURE 0 ro[0]",
+            "MEASURE 1 ro[1]",
+        )
+    )
+    assert checker.checks == 1
+    assert checker.native == 1
+
+
+def test_is_native__not_native(mocker: MockerFixture):
+    checker = make_checker(mocker)
+
+    assert not checker.is_native(Program("H 0"))
+    assert not checker.is_native(Program("RX(0.1) 0"))
+    assert not checker.is_native(Program("CZ 0 2"))
+    assert not checker.is_native(Program("RZ(0.1) 3"))
+    assert not checker.is_native(Program("DAGGER RZ(0.1) 0"))
+    assert not checker.is_native(Program("DEFGATE U:\n    0, 1\n    1, 0", "U 0"))
+    assert not checker.is_native(Program("DECLARE ro BIT[1]", "MEASURE 5 ro[0]"))
+    assert checker.checks == 7
+    assert checker.native == 0
+
+
+def test_can_skip_compilation(mocker: MockerFixture):
+    checker = make_checker(mocker)
+
+    assert checker.can_skip_compilation(Program("CZ 1 0"))
+    assert not checker.can_skip_compilation(Program("H 0"))
+    assert checker.compilation_checks == 2
+    assert checker.skipped_compilations == 1
+    assert checker.checks == 0, "counted as a check for recompilation"
+    assert checker.native == 0
+
+
+def test_is_native__isa_read_once(mocker: MockerFixture):
+    checker = make_checker(mocker)
+
+    checker.is_native(Program(f"RZ({np.pi}) 0"))
+    checker.is_native(Program("RX(pi) 0"))
+
+    checker._qc.to_compiler_isa.assert_called_once()
@@ -0,0 +1,83 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import gc
+
+import pytest
+from pytest_mock import MockerFixture
+
+from qiskit_rigetti import RigettiQCSProvider
+from qiskit_rigetti._qc_pool import QuantumComputerPool
+
+
+def test_acquire(mocker: MockerFixture):
+    get_qc = mocker.patch("qiskit_rigetti._qc_pool.get_qc", side_effect=lambda *_, **__: mocker.Mock())
+    pool = make_pool(mocker)
+
+    qc1 = pool.acquire("2q-qvm", compiler_timeout=10.0, execution_timeout=10.0)
+    qc2 = pool.acquire("2q-qvm", compiler_timeout=10.0, execution_timeout=10.0)
+    qc3 = pool.acquire("2q-noisy-qvm", compiler_timeout=10.0, execution_timeout=10.0)
+    qc4 = pool.acquire("2q-qvm", compiler_timeout=5.0, execution_timeout=10.0)
+
+    assert qc1 is qc2
+    assert len({id(qc1), id(qc3), id(qc4)}) == 3
+    assert get_qc.call_count == 3
+    assert len(pool) == 3
+
+
+def test_release__idle_eviction(mocker: MockerFixture):
+    mocker.patch("qiskit_rigetti._qc_pool.get_qc", side_effect=lambda *_, **__: mocker.Mock())
+    pool = make_pool(mocker, idle_timeout=0.0)
+
+    qc = pool.acquire("2q-qvm", compiler_timeout=10.0, execution_timeout=10.0)
+    pool.acquire("2q-qvm", compiler_timeout=10.0, execution_timeout=10.0)
+    pool.release("2q-qvm", compiler_timeout=10.0, execution_timeout=10.0)
+    assert len(pool) == 1, "quantum computer evicted while still referenced"
+
+    pool.release("2q-qvm", compiler_timeout=10.0, execution_timeout=10.0)
+    assert len(pool) == 0
+    assert pool.acquire("2q-qvm", compiler_timeout=10.0, execution_timeout=10.0) is not qc
+
+
+def test_acquire__unsuccessful(mocker: MockerFixture):
+    mocker.patch("qiskit_rigetti._qc_pool.get_qc", side_effect=ValueError("unknown quantum processor"))
+    pool = make_pool(mocker, idle_timeout=0.0)
+
+    with pytest.raises(ValueError, match="unknown quantum processor"):
+        pool.acquire("Nonexistent", compiler_timeout=10.0, execution_timeout=10.0)
+    assert len(pool) == 0
+
+
+def test_provider__shared_between_simulators(mocker: MockerFixture):
+    get_qc = mocker.patch("qiskit_rigetti._qc_pool.get_qc", side_effect=lambda *_, **__: mocker.Mock())
+    provider = RigettiQCSProvider(qc_idle_timeout=0.0)
+
+    backend1 = provider.get_simulator(num_qubits=2)
+    backend2 = provider.get_simulator(num_qubits=2)
+
+    assert backend1._get_qc() is backend2._get_qc()
+    assert get_qc.call_count == 1
+
+    del backend1, backend2
+    gc.collect()
+    assert len(provider._qc_pool) == 0, "quantum computer not released with its backends"
+
+
+def make_pool(mocker: MockerFixture, idle_timeout: float = 300.0) -> QuantumComputerPool:
+    return QuantumComputerPool(
+        client_configuration=mocker.Mock(),
+        engagement_manager=mocker.Mock(),
+        idle_timeout=idle_timeout,
+    )
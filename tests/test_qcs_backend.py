@@ -13,12 +13,25 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+import asyncio
+import gc
+from types import SimpleNamespace
+
+
+import networkx as nx
 import pytest
+from pyquil import Program
+from pyquil.quantum_processor import NxQuantumProcessor
+from pytest_mock import MockerFixture
 from qiskit import execute, QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.providers import JobStatus
 from qiskit.circuit import Parameter
+from qiskit.circuit.library import XGate
 
 from qiskit_rigetti import RigettiQCSProvider, RigettiQCSBackend
+from qiskit_rigetti import _qcs_backend as qcs_backend
+from qiskit_rigetti._qcs_backend import _PreparedCircuits, _prepare_circuit
+from qiskit_rigetti.hooks.pre_compilation import ProgramHook
 
 
 def test_run(backend: RigettiQCSBackend):
@@ -57,6 +70,21 @@ def test_run__multiple_circuits(backend: RigettiQCSBackend):
     assert result.get_counts(1).keys() == {"000"}
 
 
+def test_run_async(backend: RigettiQCSBackend):
+    circuits = [make_circuit(num_qubits=2) for _ in range(5)]
+
+    async def run_all():
+        jobs = await asyncio.gather(*[backend.run_async(circuit, shots=10) for circuit in circuits])
+        return await asyncio.gather(*[job.result_async() for job in jobs])
+
+    results = asyncio.run(run_all())
+
+    assert len(results) == 5
+    for circuit, result in zip(circuits, results):
+        assert result.results[0].header.name == circuit.name
+        assert result.get_counts().keys() == {"00"}
+
+
 def test_run__parametric_circuits(backend: RigettiQCSBackend):
     t = Parameter("t")
 
@@ -102,6 +130,35 @@ def test_run__parametric_circuits(backend: RigettiQCSBackend):
     assert result.get_counts(3).keys() == {"0", "1"}
 
 
+def test_run__parametric_circuits__bound_per_binding(backend: RigettiQCSBackend, mocker: MockerFixture):
+    qc = mocker.Mock()
+    qc.to_compiler_isa.return_value = NxQuantumProcessor(nx.from_edgelist([(0, 1)])).to_compiler_isa()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0]]})
+    mocker.patch.object(RigettiQCSBackend, "_get_qc", return_value=qc)
+    t = Parameter("t")
+    circuit = QuantumCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "ro"), name="circuit")
+    circuit.rx(t, 0)
+    circuit.measure([0], [0])
+
+    # NOTE: Compiling by way of OpenQASM binds a copy of the circuit per binding
+    job = backend.run(circuit, shots=1, use_qasm=True, use_cache=False, parameter_binds=[{t: 1.0}, {t: 2.0}])
+
+    assert [r.header.name for r in job.result().results] == ["circuit-0", "circuit-1"]
+    assert qc.compiler.quil_to_native_quil.call_count == 2
+
+
+def test_run__executable_cache(backend: RigettiQCSBackend):
+    circuit = make_circuit()
+
+    execute(circuit, backend, shots=10).result()
+    execute(circuit, backend, shots=10).result()
+    execute(circuit, backend, shots=10, use_cache=False).result()
+
+    assert backend.executable_cache.misses == 2
+    assert backend.executable_cache.hits == 2
+    assert len(backend.executable_cache) == 2
+
+
 def test_run__readout_register_not_named_ro(backend: RigettiQCSBackend):
     circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "not_ro"))
     circuit.measure([0, 1], [0, 1])
@@ -159,6 +216,151 @@ def test_run__no_measurments(backend: RigettiQCSBackend):
         execute(circuit, backend, shots=10)
 
 
+def test_target(backend: RigettiQCSBackend, mocker: MockerFixture):
+    qc = mocker.Mock()
+    qc.to_compiler_isa.return_value = NxQuantumProcessor(nx.from_edgelist([(10, 11), (11, 13)])).to_compiler_isa()
+    mocker.patch.object(RigettiQCSBackend, "_get_qc", return_value=qc)
+
+    target = backend.target
+
+    assert backend.target is target
+    qc.to_compiler_isa.assert_called_once()
+    assert target.num_qubits == 3
+    configuration = backend.configuration()
+    assert configuration.n_qubits == 3
+    assert set(configuration.basis_gates) == {"id", "x", "sx", "sxdg", "rz", "cz", "xx_plus_yy"}
+    assert sorted(configuration.coupling_map) == [[0, 1], [1, 0], [1, 2], [2, 1]]
+
+
+def test_run__compile_skip(backend: RigettiQCSBackend, mocker: MockerFixture):
+    qc = mocker.Mock()
+    qc.to_compiler_isa.return_value = NxQuantumProcessor(nx.from_edgelist([(10, 11), (11, 13)])).to_compiler_isa()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0, 0]]})
+    mocker.patch.object(RigettiQCSBackend, "_get_qc", return_value=qc)
+    circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"))
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.x(1)
+    circuit.measure([0, 1], [0, 1])
+
+    job = execute(circuit, backend, shots=1, compile="skip")
+    job.result()
+
+    qc.compiler.quil_to_native_quil.assert_not_called()
+    program: Program = qc.compiler.native_quil_to_executable.call_args[0][0]
+    assert program.get_qubits() <= {10, 11, 13}
+    assert backend.native_quil_checker.skipped_compilations == 1
+    assert backend.native_quil_checker.native == 0, "counted as a skipped recompilation"
+
+
+def test_run__physical_qubits(backend: RigettiQCSBackend, mocker: MockerFixture):
+    qc = mocker.Mock()
+    qc.to_compiler_isa.return_value = NxQuantumProcessor(nx.from_edgelist([(10, 11), (11, 13)])).to_compiler_isa()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0, 0]]})
+    mocker.patch.object(RigettiQCSBackend, "_get_qc", return_value=qc)
+    circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"))
+    circuit.cz(0, 1)
+    circuit.measure([0, 1], [0, 1])
+
+    # NOTE: e.g. transpiled against another backend for the same device, so this one has not built its target
+    backend.run(circuit, shots=1, compile="skip").result()
+
+    program: Program = qc.compiler.native_quil_to_executable.call_args[0][0]
+    assert program.get_qubits() == {10, 11}
+    assert backend._target is None
+
+
+def test_run__compile_invalid(backend: RigettiQCSBackend):
+    with pytest.raises(ValueError, match="compile must be one of 'always', 'auto', 'skip'"):
+        backend.run(make_circuit(), shots=10, compile="never")
+
+
+def test_run__program_hook_without_qasm(backend: RigettiQCSBackend):
+    class QuilOnlyHook(ProgramHook):
+        def apply(self, program: Program) -> None:
+            pass
+
+    circuit = make_circuit()
+    circuit.x(0).c_if(circuit.cregs[0], 1)
+
+    with pytest.raises(ValueError, match=f"circuit {circuit.name} must be compiled by way of OpenQASM .* QuilOnlyHook"):
+        backend.run(circuit, shots=10, before_compile=[QuilOnlyHook()])
+
+
+def test_prepare_circuit__ro():
+    circuit = make_circuit()
+
+    assert _prepare_circuit(circuit) is circuit
+
+
+def test_prepare_circuit__renamed():
+    readout_reg = ClassicalRegister(2, "not_ro")
+    circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "c"), readout_reg)
+    circuit.h(0)
+    circuit.measure([0, 1], [readout_reg[0], readout_reg[1]])
+    qasm_before = circuit.qasm()
+
+    prepared = _prepare_circuit(circuit)
+
+    assert circuit.qasm() == qasm_before, "should not modify original circuit"
+    assert [reg.name for reg in prepared.cregs] == ["c", "ro"]
+    assert prepared.qasm() == qasm_before.replace("not_ro", "ro")
+
+
+def test_prepared_circuits():
+    prepared_circuits = _PreparedCircuits()
+    circuit = make_circuit()
+    other = QuantumCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "not_ro"))
+    other.measure(0, 0)
+
+    assert prepared_circuits.prepare(circuit) is circuit
+    assert prepared_circuits.prepare(other) is prepared_circuits.prepare(other)
+    assert len(prepared_circuits) == 1, "should only memoize renamed circuits"
+
+    with pytest.raises(RuntimeError, match="Circuit has no measurements"):
+        prepared_circuits.prepare(QuantumCircuit(1, 1))
+
+    del circuit, other
+    gc.collect()
+    assert len(prepared_circuits) == 0
+
+
+def test_prepared_circuits__changed(mocker: MockerFixture):
+    prepared_circuits = _PreparedCircuits()
+    rename_readout_spy = mocker.spy(qcs_backend, "_rename_readout")
+    circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "not_ro"), name="circuit")
+    circuit.measure([0, 1], [0, 1])
+
+    prepared_circuits.prepare(circuit)
+    prepared_circuits.prepare(circuit)
+    assert rename_readout_spy.call_count == 1
+
+    circuit.name = "renamed"
+    assert prepared_circuits.prepare(circuit).name == "renamed"
+
+    circuit.x(0)
+    assert [instruction.operation.name for instruction in prepared_circuits.prepare(circuit).data][-1] == "x"
+
+    circuit.add_register(ClassicalRegister(1, "c"))
+    circuit.measure(0, 2)
+    with pytest.raises(RuntimeError, match="Multiple readout registers are unsupported on QCSBackend; found c, not_ro"):
+        prepared_circuits.prepare(circuit)
+
+
+def test_prepared_circuits__ro(mocker: MockerFixture):
+    prepared_circuits = _PreparedCircuits()
+    readout_register_spy = mocker.spy(qcs_backend, "_readout_register")
+    circuit = make_circuit()
+
+    prepared_circuits.prepare(circuit)
+    circuit.data[-1] = circuit.data[-1].replace(operation=XGate(), clbits=())
+    circuit.data[0] = circuit.data[0].replace(operation=XGate(), clbits=())
+
+    with pytest.raises(RuntimeError, match="Circuit has no measurements"):
+        prepared_circuits.prepare(circuit)
+    assert readout_register_spy.call_count == 2
+
+
 @pytest.fixture
 def backend():
     return RigettiQCSProvider().get_simulator(num_qubits=3)
@@ -13,23 +13,47 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
-from typing import Optional, Any
-
+import asyncio
+import threading
+import time
+from concurrent.futures import wait
+from threading import Event
+from types import SimpleNamespace
+from typing import Optional, Any, Callable, List, Union
+
+import networkx as nx
+import numpy as np
 import pytest
 from pyquil import get_qc, Program
 from pyquil.api import QuantumComputer
+from pyquil.quantum_processor import NxQuantumProcessor
 from pytest_mock import MockerFixture
-from qiskit import QuantumRegister, ClassicalRegister
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Parameter
+from qiskit.exceptions import QiskitError
 from qiskit.providers import JobStatus
 
-from qiskit_rigetti import RigettiQCSJob, RigettiQCSProvider, RigettiQCSBackend, QuilCircuit
+from qiskit_rigetti import (
+    RigettiQCSJob,
+    RigettiQCSProvider,
+    RigettiQCSBackend,
+    QuilCircuit,
+    ExecutableCache,
+    DiskExecutableCache,
+    NativeQuilChecker,
+)
+from qiskit_rigetti import _qcs_job as qcs_job
+from qiskit_rigetti.hooks.pre_compilation import set_rewiring
 from qiskit_rigetti.hooks.pre_execution import enable_active_reset
 
 
 def test_init__start_circuit_unsuccessful(backend: RigettiQCSBackend):
     circuit = make_circuit(num_qubits=backend.configuration().num_qubits + 1)  # Use too many qubits
+    job = make_job(backend, circuit)
+
     with pytest.raises(Exception):
-        make_job(backend, circuit)
+        job.result()
+    assert job.status() == JobStatus.ERROR
 
 
 def test_init__before_compile_hook(backend: RigettiQCSBackend, mocker: MockerFixture):
@@ -71,6 +95,18 @@ def test_init__before_compile_hook(backend: RigettiQCSBackend, mocker: MockerFix
     assert qasm == new_qasm
 
 
+def test_init__before_compile_program_hook(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuit = make_circuit(num_qubits=2)
+    qc = get_qc(backend.configuration().backend_name)
+    quil_to_native_quil_spy = mocker.spy(qc.compiler, "quil_to_native_quil")
+
+    make_job(backend, circuit, qc, before_compile=[set_rewiring("NAIVE")])
+
+    program: Program = quil_to_native_quil_spy.call_args[0][0]
+    assert program.out().startswith('PRAGMA INITIAL_REWIRING "NAIVE"\n')
+    assert "OPENQASM" not in program.out()
+
+
 def test_init__before_execute_hook(backend: RigettiQCSBackend, mocker: MockerFixture):
     circuit = make_circuit(num_qubits=2)
     qc = get_qc(backend.configuration().backend_name)
@@ -105,11 +141,35 @@ def test_init__ensure_native_quil__true(backend: RigettiQCSBackend, mocker: Mock
     qc = get_qc(backend.configuration().backend_name)
     quil_to_native_quil_spy = mocker.spy(qc.compiler, "quil_to_native_quil")
 
-    make_job(backend, circuit, qc, before_execute=[enable_active_reset], ensure_native_quil=True)
+    def before_execute_hook(quil: Program) -> Program:
+        return quil + Program("H 0")
+
+    make_job(backend, circuit, qc, before_execute=[before_execute_hook], ensure_native_quil=True)
 
     assert quil_to_native_quil_spy.call_count == 2, "compile not performed correct number of times"
 
 
+def test_init__ensure_native_quil__skipped_if_native(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuit = make_circuit(num_qubits=2)
+    qc = get_qc(backend.configuration().backend_name)
+    quil_to_native_quil_spy = mocker.spy(qc.compiler, "quil_to_native_quil")
+    native_checker = NativeQuilChecker(qc)
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=[circuit],
+        options={"shots": 1000, "before_execute": [enable_active_reset], "ensure_native_quil": True},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+        native_checker=native_checker,
+    )
+    wait(job._submissions)
+
+    assert quil_to_native_quil_spy.call_count == 1, "compile not performed correct number of times"
+    assert native_checker.native == 1
+
+
 def test_init__ensure_native_quil__ignored_if_no_pre_execution_hooks(backend: RigettiQCSBackend, mocker: MockerFixture):
     circuit = make_circuit(num_qubits=2)
     qc = get_qc(backend.configuration().backend_name)
@@ -163,19 +223,230 @@ def test_init__circuit_with_barrier(backend: RigettiQCSBackend, mocker: MockerFi
     )
 
     with pytest.warns(UserWarning, match="barriers are currently omitted during execution on a RigettiQCSBackend"):
-        make_job(backend, circuit, qc)
+        make_job(backend, circuit, qc, use_qasm=True)
 
     program: Program = quil_to_native_quil_spy.call_args[0][0]
     qasm = program.out(calibrations=False).rstrip()
     assert qasm == expected_qasm
 
 
-def test_result(job: RigettiQCSJob):
-    assert job._status == JobStatus.RUNNING
-    assert job.status() == JobStatus.DONE, "Checking status did not wait for completion"
-    assert job._status == JobStatus.DONE
+def test_init__translated_to_quil(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuit = QuilCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"))
+    circuit.h(0)
+    circuit.barrier()
+    circuit.xy(np.pi, 0, 1)
+    circuit.measure([0, 1], [0, 1])
+    qc = get_qc(backend.configuration().backend_name)
+    quil_to_native_quil_spy = mocker.spy(qc.compiler, "quil_to_native_quil")
+
+    with pytest.warns(UserWarning, match="barriers are currently omitted during execution on a RigettiQCSBackend"):
+        job = make_job(backend, circuit, qc)
+
+    program: Program = quil_to_native_quil_spy.call_args[0][0]
+    assert program.defined_gates == []
+    assert "XY(pi) 1 0\n" in program.out()
+    assert "OPENQASM" not in program.out()
+    assert job.result().get_counts().keys() == {"00", "10"}
+
+
+def test_init__physical_qubits(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuit = make_circuit(num_qubits=2)
+    qc = mocker.Mock()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0, 0]]})
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=[circuit],
+        options={"shots": 1},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+        physical_qubits=[10, 11, 13],
+    )
+    job.result()
+
+    program: Program = qc.compiler.quil_to_native_quil.call_args[0][0]
+    assert program.get_qubits() == {10, 11}
+
+
+def test_init__max_workers(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuits = [make_circuit(num_qubits=2) for _ in range(4)]
+    # finish in reverse submission order
+    delays = {id(circuit): 0.01 * (len(circuits) - i) for i, circuit in enumerate(circuits)}
+    indices = {id(circuit): i for i, circuit in enumerate(circuits)}
+
+    def start_circuit(_: RigettiQCSJob, circuit: QuilCircuit) -> List[int]:
+        time.sleep(delays[id(circuit)])
+        return [indices[id(circuit)]]
+
+    mocker.patch.object(RigettiQCSJob, "_start_circuit", start_circuit)
+    qc = mocker.Mock()
+    qc.qam.get_result.side_effect = lambda idx: SimpleNamespace(readout_data={"ro": [[idx & 1, idx >> 1]]})
+
+    job = make_job(backend, circuits, qc, max_workers=4)
+
+    assert job.result().get_counts() == [{"00": 1}, {"01": 1}, {"10": 1}, {"11": 1}]
+
+
+def test_init__multiplex(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuits = []
+    for num_qubits in (1, 2, 3, 2):
+        circuit = QuilCircuit(QuantumRegister(num_qubits, "q"), ClassicalRegister(num_qubits, "ro"))
+        circuit.x(num_qubits - 1)
+        circuit.measure(range(num_qubits), range(num_qubits))
+        circuits.append(circuit)
+    started: List[QuantumCircuit] = []
+
+    def start_circuit(_: RigettiQCSJob, circuit: QuantumCircuit) -> List[int]:
+        started.append(circuit)
+        return [len(started) - 1]
+
+    def get_result(idx: int) -> SimpleNamespace:
+        # Simulate the X gates and measurements of the started circuit, for a single shot
+        circuit = started[idx]
+        flipped = set()
+        readout = [0] * circuit.num_clbits
+        for instruction, qargs, cargs in circuit.data:
+            if instruction.name == "x":
+                flipped.add(circuit.find_bit(qargs[0]).index)
+            elif instruction.name == "measure":
+                readout[circuit.find_bit(cargs[0]).index] = int(circuit.find_bit(qargs[0]).index in flipped)
+        return SimpleNamespace(readout_data={"ro": [readout]})
+
+    mocker.patch.object(RigettiQCSJob, "_start_circuit", start_circuit)
+    qc = mocker.Mock()
+    qc.qam.get_result.side_effect = get_result
+
+    job = make_job(backend, circuits, qc, multiplex=3)
+
+    assert sorted(c.num_qubits for c in started) == [2, 3, 3]
+    assert job.result().get_counts() == [{"1": 1}, {"10": 1}, {"100": 1}, {"10": 1}]
+    assert qc.qam.get_result.call_count == 3
+
+
+def test_init__shot_chunks(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuit = make_circuit(num_qubits=2)
+    qc = mocker.Mock()
+    qc.qam.execute.side_effect = range(3)
+    # Each chunk measures a different outcome, so chunks can be told apart in the merged counts
+    qc.qam.get_result.side_effect = lambda idx: SimpleNamespace(
+        readout_data={"ro": np.tile([idx & 1, idx >> 1], (8334, 1))}
+    )
+
+    job = make_job(backend, circuit, qc, shots=25000)
+
+    assert backend.configuration().max_shots == 10000
+    assert qc.compiler.quil_to_native_quil.call_args[0][0].num_shots == 8334
+    assert qc.compiler.native_quil_to_executable.call_count == 1, "executable not shared by chunks"
+    assert qc.qam.execute.call_count == 3
+    assert job.result().get_counts() == {"00": 8334, "01": 8334, "10": 8332}
+    assert job.readout_array().shape == (25000, 2)
+
+
+def test_init__compile_auto(backend: RigettiQCSBackend, mocker: MockerFixture):
+    native_circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"))
+    native_circuit.sx(0)
+    native_circuit.cz(0, 1)
+    native_circuit.measure([0, 1], [0, 1])
+    other_circuit = make_circuit(num_qubits=2)
+    qc = mocker.Mock()
+    qc.to_compiler_isa.return_value = NxQuantumProcessor(nx.from_edgelist([(10, 11)])).to_compiler_isa()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0, 0]]})
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=[native_circuit, other_circuit],
+        options={"shots": 1, "compile": "auto"},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+        physical_qubits=[10, 11],
+    )
+    job.result()
+
+    assert qc.compiler.quil_to_native_quil.call_count == 1, "native circuit compiled"
+    assert "H 10" in qc.compiler.quil_to_native_quil.call_args[0][0].out()
+    assert qc.compiler.native_quil_to_executable.call_count == 2
+
+
+def test_init__compile_skip__not_native(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuit = make_circuit(num_qubits=2)
+    qc = mocker.Mock()
+    qc.to_compiler_isa.return_value = NxQuantumProcessor(nx.from_edgelist([(10, 11)])).to_compiler_isa()
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=[circuit],
+        options={"shots": 1, "compile": "skip"},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+        physical_qubits=[10, 11],
+    )
+
+    with pytest.raises(ValueError, match="circuit is not native Quil"):
+        job.result()
+    qc.compiler.quil_to_native_quil.assert_not_called()
+
+
+def test_init__parameter_binds(backend: RigettiQCSBackend, mocker: MockerFixture):
+    t = Parameter("t")
+    circuit = QuilCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "ro"))
+    circuit.rx(t, 0)
+    circuit.measure([0], [0])
+    qc = get_qc(backend.configuration().backend_name)
+    quil_to_native_quil_spy = mocker.spy(qc.compiler, "quil_to_native_quil")
+    execute_spy = mocker.spy(qc.qam, "execute")
+
+    job = make_job(backend, circuit, qc, parameter_binds=[{t: 0.0}, {t: np.pi}])
+
+    assert quil_to_native_quil_spy.call_count == 1, "compile not performed correct number of times"
+    assert execute_spy.call_count == 2, "execute not performed correct number of times"
+
+    result = job.result()
+    assert len(result.results) == 2
+    assert result.results[0].header.name == f"{circuit.name}-0"
+    assert result.get_counts(0) == {"0": 1000}
+    assert result.results[1].header.name == f"{circuit.name}-1"
+    assert result.get_counts(1) == {"1": 1000}
+
+
+def test_init__executable_cache(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuit = make_circuit(num_qubits=2)
+    qc = get_qc(backend.configuration().backend_name)
+    quil_to_native_quil_spy = mocker.spy(qc.compiler, "quil_to_native_quil")
+    native_quil_to_executable_spy = mocker.spy(qc.compiler, "native_quil_to_executable")
+    cache = ExecutableCache()
+
+    make_job(backend, circuit, qc, executable_cache=cache)
+    make_job(backend, circuit, qc, executable_cache=cache, before_execute=[enable_active_reset])
+    job = make_job(backend, circuit, qc, executable_cache=cache, before_execute=[enable_active_reset])
+
+    assert quil_to_native_quil_spy.call_count == 1, "compile not performed correct number of times"
+    assert native_quil_to_executable_spy.call_count == 2, "executable not built correct number of times"
+    assert cache.hits == 3
+    assert cache.misses == 3
+    assert job.result().get_counts().keys() == {"00", "01"}
+
+
+def test_init__disk_cache(backend: RigettiQCSBackend, mocker: MockerFixture, tmp_path):
+    circuit = make_circuit(num_qubits=2)
+    qc = get_qc(backend.configuration().backend_name)
+    quil_to_native_quil_spy = mocker.spy(qc.compiler, "quil_to_native_quil")
+    path = str(tmp_path / "cache.db")
+
+    make_job(backend, circuit, qc, disk_cache=DiskExecutableCache(path))
+    disk_cache = DiskExecutableCache(path)  # e.g. after a restart
+    job = make_job(backend, circuit, qc, disk_cache=disk_cache)
+
+    assert quil_to_native_quil_spy.call_count == 1, "compile not performed correct number of times"
+    assert disk_cache.hits == 2
+    assert job.result().get_counts().keys() == {"00", "01"}
+
 
+def test_result(job: RigettiQCSJob):
     result = job.result()
+    assert job.status() == JobStatus.DONE
 
     assert result.date == job.result().date, "Result not cached"
 
@@ -193,9 +464,271 @@ def test_result(job: RigettiQCSJob):
     assert result_0.data.counts.keys() == {"00", "01"}
 
 
-def test_cancel(job: RigettiQCSJob):
-    with pytest.raises(NotImplementedError, match="Cancelling jobs is not supported"):
-        job.cancel()
+def test_status(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuits = [make_circuit(num_qubits=2) for _ in range(2)]
+    submitted = {id(circuit): Event() for circuit in circuits}
+    retrieved = {idx: Event() for idx in range(len(circuits))}
+    indices = {id(circuit): i for i, circuit in enumerate(circuits)}
+
+    def start_circuit(_: RigettiQCSJob, circuit: QuilCircuit) -> List[int]:
+        submitted[id(circuit)].wait()
+        return [indices[id(circuit)]]
+
+    def get_result(idx: int) -> SimpleNamespace:
+        retrieved[idx].wait()
+        return SimpleNamespace(readout_data={"ro": [[0, 0]]})
+
+    mocker.patch.object(RigettiQCSJob, "_start_circuit", start_circuit)
+    qc = mocker.Mock()
+    qc.qam.get_result.side_effect = get_result
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=circuits,
+        options={"shots": 1},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+    )
+    assert job.status() == JobStatus.QUEUED
+    assert job.experiment_statuses() == [JobStatus.QUEUED, JobStatus.QUEUED]
+
+    submitted[id(circuits[1])].set()
+    wait_for(lambda: job.experiment_statuses() == [JobStatus.QUEUED, JobStatus.RUNNING])
+    assert job.status() == JobStatus.RUNNING
+
+    submitted[id(circuits[0])].set()
+    retrieved[1].set()
+    wait_for(lambda: job.experiment_statuses() == [JobStatus.RUNNING, JobStatus.DONE])
+    assert job.status() == JobStatus.RUNNING
+
+    retrieved[0].set()
+    assert job.result().get_counts() == [{"00": 1}, {"00": 1}]
+    assert job.status() == JobStatus.DONE
+    assert job.experiment_statuses() == [JobStatus.DONE, JobStatus.DONE]
+
+
+def test_as_completed(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuits = [make_circuit(num_qubits=2) for _ in range(3)]
+    indices = {id(circuit): i for i, circuit in enumerate(circuits)}
+    release_first = Event()
+
+    def get_result(idx: int) -> SimpleNamespace:
+        if idx == 0:
+            assert release_first.wait(5), "Slow experiment held back later ones"
+        return SimpleNamespace(readout_data={"ro": [[idx & 1, idx >> 1]]})
+
+    mocker.patch.object(RigettiQCSJob, "_start_circuit", lambda _, circuit: [indices[id(circuit)]])
+    qc = mocker.Mock()
+    qc.qam.get_result.side_effect = get_result
+
+    job = make_job(backend, circuits, qc)
+
+    completed = []
+    for idx, experiment_result in job.as_completed(timeout=10):
+        completed.append(idx)
+        assert experiment_result.data.counts == {format(idx, "02b"): 1}
+        if len(completed) == 2:
+            release_first.set()
+
+    assert sorted(completed[:2]) == [1, 2]
+    assert completed[2] == 0
+
+
+def test_status__many_jobs_in_flight(backend: RigettiQCSBackend, mocker: MockerFixture):
+    retrieved = Event()
+
+    def get_result(_: int) -> SimpleNamespace:
+        retrieved.wait()
+        return SimpleNamespace(readout_data={"ro": [[0, 0]]})
+
+    mocker.patch.object(RigettiQCSJob, "_start_circuit", lambda _, circuit: [0])
+    qc = mocker.Mock()
+    qc.qam.get_result.side_effect = get_result
+    num_threads = threading.active_count()
+
+    jobs = [make_job(backend, [make_circuit(num_qubits=2) for _ in range(4)], qc) for _ in range(100)]
+
+    # Submission and retrieval threads are shared by all jobs
+    wait_for(
+        lambda: threading.active_count() <= num_threads + qcs_job._ASYNC_MAX_WORKERS + qcs_job._RETRIEVAL_MAX_WORKERS
+    )
+    assert all(job.status() == JobStatus.RUNNING for job in jobs)
+
+    retrieved.set()
+    for job in jobs:
+        assert job.result().get_counts() == [{"00": 1}] * 4
+
+
+def test_init__many_jobs_in_flight(backend: RigettiQCSBackend, mocker: MockerFixture):
+    released = Event()
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, maximum
+
+    def start_circuit(_: RigettiQCSJob, circuit: QuilCircuit) -> List[int]:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        released.wait()
+        with lock:
+            in_flight[0] -= 1
+        return [0]
+
+    mocker.patch.object(RigettiQCSJob, "_start_circuit", start_circuit)
+    qc = mocker.Mock()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0, 0]]})
+    num_threads = threading.active_count()
+
+    jobs = [
+        RigettiQCSJob(
+            job_id="some_job",
+            circuits=[make_circuit(num_qubits=2) for _ in range(4)],
+            options={"shots": 1},
+            qc=qc,
+            backend=backend,
+            configuration=backend.configuration(),
+        )
+        for _ in range(100)
+    ]
+
+    wait_for(lambda: in_flight[0] == qcs_job._ASYNC_MAX_WORKERS)
+    assert threading.active_count() <= num_threads + qcs_job._ASYNC_MAX_WORKERS
+    assert all(job.status() == JobStatus.QUEUED for job in jobs)
+
+    released.set()
+    for job in jobs:
+        assert job.result().get_counts() == [{"00": 1}] * 4
+    assert in_flight[1] == qcs_job._ASYNC_MAX_WORKERS
+
+
+def test_result_async(job: RigettiQCSJob):
+    result = asyncio.run(job.result_async())
+
+    assert result is job.result(), "Result not cached"
+    assert job.status() == JobStatus.DONE
+    assert result.get_counts().keys() == {"00", "01"}
+
+
+def test_result__counts_only(backend: RigettiQCSBackend):
+    job = make_job(backend, make_circuit(num_qubits=2), memory=False)
+
+    result = job.result()
+
+    assert not hasattr(result.results[0].data, "memory")
+    assert sum(result.get_counts().values()) == 1000
+    assert result.get_counts().keys() == {"00", "01"}
+    with pytest.raises(QiskitError, match="No memory for experiment"):
+        result.get_memory()
+
+
+def test_readout_array(job: RigettiQCSJob):
+    readout = job.readout_array(0)
+
+    assert readout.shape == (1000, 2)
+    assert set(np.unique(readout[:, 1])) == {0}
+    assert job.readout_array(0, packed=True).shape == (1000, 1)
+    assert job.result().get_memory() == ["".join(map(str, shot[::-1])) for shot in readout]
+
+
+def test_cancel(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuits = [make_circuit(num_qubits=2) for _ in range(4)]
+    started = Event()
+    release = Event()
+
+    def start_circuit(_: RigettiQCSJob, circuit: QuilCircuit) -> List[int]:
+        started.set()
+        release.wait()
+        return [0]
+
+    start_circuit_spy = mocker.patch.object(RigettiQCSJob, "_start_circuit", side_effect=start_circuit, autospec=True)
+    qc = mocker.Mock()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0, 0]]})
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=circuits,
+        options={"shots": 1, "max_workers": 1},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+    )
+    started.wait()
+    job.cancel()
+    release.set()
+
+    result = job.result()
+    assert start_circuit_spy.call_count == 1, "unstarted circuits were not skipped"
+    assert job.status() == JobStatus.CANCELLED
+    assert job.experiment_statuses() == [JobStatus.DONE] + [JobStatus.CANCELLED] * 3
+    assert result.success is False
+    assert len(result.results) == 1
+    assert result.results[0].header.name == circuits[0].name
+    assert [idx for idx, _ in job.as_completed()] == [0]
+
+
+def test_cancel__twice(backend: RigettiQCSBackend, mocker: MockerFixture):
+    circuits = [make_circuit(num_qubits=2) for _ in range(3)]
+    started = Event()
+    release = Event()
+
+    def start_circuit(_: RigettiQCSJob, circuit: QuilCircuit) -> List[int]:
+        started.set()
+        release.wait()
+        return [0]
+
+    mocker.patch.object(RigettiQCSJob, "_start_circuit", side_effect=start_circuit, autospec=True)
+    qc = mocker.Mock()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0, 0]]})
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=circuits,
+        options={"shots": 1, "max_workers": 1},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+    )
+    started.wait()
+    job.cancel()
+    job.cancel()
+    release.set()
+
+    wait(job._experiment_futures, timeout=5)
+    assert job.experiment_statuses() == [JobStatus.DONE] + [JobStatus.CANCELLED] * 2
+    assert len(job.result().results) == 1
+
+
+def test_cancel__parameter_binds(backend: RigettiQCSBackend, mocker: MockerFixture):
+    t = Parameter("t")
+    circuit = QuilCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "ro"))
+    circuit.rx(t, 0)
+    circuit.measure([0], [0])
+    qc = mocker.Mock()
+    qc.qam.get_result.return_value = SimpleNamespace(readout_data={"ro": [[0]]})
+    executed = Event()
+    cancelled = Event()
+
+    def execute(_: Any) -> None:
+        executed.set()
+        cancelled.wait()
+
+    qc.qam.execute.side_effect = execute
+
+    job = RigettiQCSJob(
+        job_id="some_job",
+        circuits=[circuit],
+        options={"shots": 1, "parameter_binds": [{t: 0.0}, {t: 1.0}, {t: 2.0}]},
+        qc=qc,
+        backend=backend,
+        configuration=backend.configuration(),
+    )
+    executed.wait()
+    job.cancel()
+    cancelled.set()
+
+    assert qc.qam.execute.call_count == 1, "bindings were executed after cancellation"
+    assert job.result().get_counts() == {"0": 1}
+    assert job.experiment_statuses() == [JobStatus.DONE, JobStatus.CANCELLED, JobStatus.CANCELLED]
 
 
 def test_submit(job: RigettiQCSJob):
@@ -226,18 +759,31 @@ def make_circuit(*, num_qubits) -> QuilCircuit:
 
 def make_job(
     backend,
-    circuit,
+    circuits: Union[QuilCircuit, List[QuilCircuit]],
     qc: Optional[QuantumComputer] = None,
+    executable_cache: Optional[ExecutableCache] = None,
+    disk_cache: Optional[DiskExecutableCache] = None,
     **options: Any,
 ):
     qc = qc or get_qc(backend.configuration().backend_name)
     job = RigettiQCSJob(
         job_id="some_job",
-        circuits=[circuit],
+        circuits=circuits if isinstance(circuits, list) else [circuits],
         options={**{"shots": 1000}, **options},
         qc=qc,
         backend=backend,
         configuration=backend.configuration(),
+        executable_cache=executable_cache,
+        disk_cache=disk_cache,
     )
 
+    # Circuits are compiled and submitted in the background; wait for that so tests can inspect it
+    wait(job._submissions)
     return job
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for condition"
+        time.sleep(0.001)
@@ -13,8 +13,11 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 ##############################################################################
+import numpy as np
+import pytest
 from qiskit import QuantumRegister
-from qiskit.circuit import Qubit
+from qiskit.circuit import Parameter, Qubit
+from qiskit.circuit.exceptions import CircuitError
 
 from qiskit_rigetti.gates import (
     CanonicalGate,
@@ -116,3 +119,75 @@ def test_can():
         [Qubit(QuantumRegister(2, "q"), 0), Qubit(QuantumRegister(2, "q"), 1)],
         [],
     )
+
+
+def test_xy_layer():
+    circuit = QuilCircuit(4, 4)
+    expected = QuilCircuit(4, 4)
+
+    instructions = circuit.xy_layer([0.1, 0.2], [(0, 1), (2, 3)])
+    expected.xy(0.1, 0, 1)
+    expected.xy(0.2, 2, 3)
+
+    assert circuit.data == expected.data
+    assert [instruction.operation for instruction in instructions] == [XYGate(0.1), XYGate(0.2)]
+
+
+def test_xy_layer__c_if():
+    circuit = QuilCircuit(4, 4)
+
+    circuit.xy_layer(0.1, [(0, 1), (2, 3)]).c_if(0, 1)
+
+    assert [instruction.operation.condition for instruction in circuit.data] == [(circuit.clbits[0], 1)] * 2
+
+
+def test_layers():
+    theta = Parameter("theta")
+    pairs = np.array([[0, 1], [1, 2], [3, 2]])
+    circuit = QuilCircuit(4, 4)
+    expected = QuilCircuit(4, 4)
+
+    circuit.pswap_layer(theta, pairs)
+    circuit.cphase00_layer(np.array([0.1, 0.2, 0.3]), pairs)
+    circuit.cphase01_layer([0.4, 0.5, 0.6], [(circuit.qubits[0], 1), (1, 2), (3, 2)])
+    circuit.cphase10_layer(0.7, pairs)
+    circuit.can_layer([0.1, 0.2, 0.3], 0.4, theta, pairs)
+    for a, b in pairs.tolist():
+        expected.pswap(theta, a, b)
+    for (a, b), theta00 in zip(pairs.tolist(), [0.1, 0.2, 0.3]):
+        expected.cphase00(theta00, a, b)
+    for (a, b), theta01 in zip(pairs.tolist(), [0.4, 0.5, 0.6]):
+        expected.cphase01(theta01, a, b)
+    for a, b in pairs.tolist():
+        expected.cphase10(0.7, a, b)
+    for (a, b), alpha in zip(pairs.tolist(), [0.1, 0.2, 0.3]):
+        expected.can(alpha, 0.4, theta, a, b)
+
+    assert circuit.data == expected.data
+    assert circuit.parameters == {theta}
+    assert circuit.bind_parameters({theta: 0.5}).data == expected.bind_parameters({theta: 0.5}).data
+
+
+def test_layer__control_flow():
+    circuit = QuilCircuit(2, 1)
+
+    with circuit.for_loop(range(2)):
+        circuit.xy_layer(0.1, [(0, 1)])
+
+    (loop,) = circuit.data
+    assert loop.operation.name == "for_loop"
+    assert [instruction.operation for instruction in loop.operation.blocks[0].data] == [XYGate(0.1)]
+
+
+def test_layer__invalid():
+    circuit = QuilCircuit(3, 3)
+
+    with pytest.raises(CircuitError, match=r"Expected one angle per pair of qubits \(2\), but got 1"):
+        circuit.xy_layer([0.1], [(0, 1), (1, 2)])
+    with pytest.raises(CircuitError, match="duplicate qubit arguments"):
+        circuit.xy_layer(0.1, [(0, 1), (2, 2)])
+    with pytest.raises(CircuitError, match="Each pair must specify two qubits"):
+        circuit.xy_layer(0.1, [(0, 1, 2)])
+    with pytest.raises(CircuitError):
+        circuit.xy_layer(0.1, [(0, 3)])
+    assert len(circuit.data) == 0
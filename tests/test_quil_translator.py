@@ -0,0 +1,193 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import numpy as np
+import pytest
+from pyquil import Program
+from pyquil import quilbase
+from pyquil.quilatom import MemoryReference
+from pyquil.simulation.tools import lifted_gate, lifted_gate_matrix
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Gate, Parameter, ParameterVector
+from qiskit.circuit.library import QFT, XXPlusYYGate
+from qiskit.quantum_info import Operator
+
+from qiskit_rigetti import QuilCircuit
+from qiskit_rigetti.gates import CanonicalGate
+from qiskit_rigetti._quil_translator import (
+    PARAMETER_REGION,
+    bind_expressions,
+    circuit_to_quil,
+    is_translatable,
+)
+
+
+def test_circuit_to_quil():
+    circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"))
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.rz(0.5, 1)
+    circuit.measure([0, 1], [0, 1])
+
+    program, expressions = circuit_to_quil(circuit)
+
+    assert program == Program(
+        "DECLARE ro BIT[2]",
+        "H 0",
+        "CNOT 0 1",
+        "RZ(0.5) 1",
+        "MEASURE 0 ro[0]",
+        "MEASURE 1 ro[1]",
+    )
+    assert expressions == []
+
+
+def test_circuit_to_quil__parameters():
+    t = Parameter("t")
+    circuit = QuantumCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "ro"))
+    circuit.rx(t, 0)
+    circuit.rz(2 * t, 0)
+    circuit.ry(t, 0)
+    circuit.measure([0], [0])
+
+    program, expressions = circuit_to_quil(circuit)
+
+    assert program.declarations[PARAMETER_REGION].memory_size == 2
+    assert program.instructions[-4].params == [MemoryReference(PARAMETER_REGION, 0)]
+    assert program.instructions[-3].params == [MemoryReference(PARAMETER_REGION, 1)]
+    assert program.instructions[-2].params == [MemoryReference(PARAMETER_REGION, 0)]
+    assert expressions == [t, 2 * t]
+
+
+def test_circuit_to_quil__barrier():
+    circuit = QuantumCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "ro"))
+    circuit.barrier()
+    circuit.measure([0], [0])
+
+    with pytest.warns(UserWarning, match="barriers are currently omitted during execution on a RigettiQCSBackend"):
+        program, _ = circuit_to_quil(circuit)
+
+    assert program == Program("DECLARE ro BIT[1]", "MEASURE 0 ro[0]")
+
+
+def test_circuit_to_quil__rigetti_gates():
+    circuit = QuilCircuit(QuantumRegister(3, "q"), ClassicalRegister(3, "ro"))
+    circuit.h(0)
+    circuit.xy(0.3, 0, 1)
+    circuit.cphase01(0.7, 1, 2)
+    circuit.cphase10(0.2, 0, 2)
+    circuit.pswap(0.4, 2, 0)
+    circuit.can(0.1, 0.2, 0.3, 1, 0)
+    circuit.xy(0.3, 1, 2)
+
+    program, _ = circuit_to_quil(circuit)
+
+    assert program.defined_gates == []
+    assert [instruction.name for instruction in program.instructions[1:]] == [
+        "H",
+        "XY",
+        "CPHASE01",
+        "CPHASE10",
+        "PSWAP",
+        "CAN",
+        "XY",
+    ]
+    assert_equivalent(program, circuit)
+
+
+def test_circuit_to_quil__rigetti_gates__parameters():
+    t = Parameter("t")
+    circuit = QuilCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"))
+    circuit.xy(t, 0, 1)
+    circuit.can(0.1, 2 * t, 0.3, 0, 1)
+
+    program, expressions = circuit_to_quil(circuit)
+
+    assert program.defined_gates == []
+    assert program.instructions[-2].params == [MemoryReference(PARAMETER_REGION, 0)]
+    assert program.instructions[-1].params == [0.1, MemoryReference(PARAMETER_REGION, 1), 0.3]
+    assert expressions == [t, 2 * t]
+
+
+def test_circuit_to_quil__xx_plus_yy():
+    circuit = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "ro"))
+    circuit.append(XXPlusYYGate(0.7, 0.3), [1, 0])
+
+    program, _ = circuit_to_quil(circuit)
+
+    assert [instruction.name for instruction in program.instructions[1:]] == ["RZ", "XY", "RZ"]
+    assert_equivalent(program, circuit)
+
+
+def test_circuit_to_quil__definitions():
+    circuit = QuantumCircuit(QuantumRegister(3, "q"), ClassicalRegister(3, "ro"))
+    circuit.rccx(0, 1, 2)
+    circuit.append(QFT(3), [2, 0, 1])
+    circuit.mcx([0, 1], 2)
+
+    assert is_translatable(circuit)
+    program, _ = circuit_to_quil(circuit)
+
+    assert_equivalent(program, circuit)
+
+
+def test_circuit_to_quil__unsupported_instruction():
+    circuit = QuantumCircuit(QuantumRegister(1, "q"), ClassicalRegister(1, "ro"))
+    circuit.append(Gate("opaque", 1, []), [0])
+
+    assert not is_translatable(circuit)
+    with pytest.raises(ValueError, match="Instruction cannot be translated to Quil: "):
+        circuit_to_quil(circuit)
+
+
+def test_bind_expressions():
+    t = Parameter("t")
+    v = ParameterVector("v", 2)
+
+    assert bind_expressions([t, 2 * t, v[1]], {t: 1.5, v: [0.0, 3.0]}) == [1.5, 3.0, 3.0]
+
+
+def test_bind_expressions__missing_value():
+    t = Parameter("t")
+    u = Parameter("u")
+
+    with pytest.raises(ValueError, match="Parameter binding is missing values for u"):
+        bind_expressions([t + u], {t: 1.0})
+
+
+def assert_equivalent(program: Program, circuit: QuantumCircuit):
+    """Assert that the program's gates implement the circuit's unitary, up to global phase."""
+    num_qubits = circuit.num_qubits
+    defined_gates = {gate.name: np.asarray(gate.matrix, dtype=complex) for gate in program.defined_gates}
+
+    unitary = np.eye(2**num_qubits, dtype=complex)
+    for instruction in program.instructions:
+        if not isinstance(instruction, quilbase.Gate):
+            continue
+        if instruction.name in defined_gates:
+            qubits = [q.index for q in instruction.qubits]
+            unitary = lifted_gate_matrix(defined_gates[instruction.name], qubits, num_qubits) @ unitary
+        elif instruction.name == "CAN":
+            # NOTE: pyQuil cannot simulate CAN, whose matrix is that of CanonicalGate
+            qubits = [q.index for q in instruction.qubits]
+            matrix = CanonicalGate(*instruction.params).to_matrix()
+            unitary = lifted_gate_matrix(matrix, qubits, num_qubits) @ unitary
+        else:
+            unitary = lifted_gate(instruction, num_qubits) @ unitary
+
+    expected = Operator(circuit.remove_final_measurements(inplace=False)).data
+    idx = np.argmax(np.abs(expected))
+    phase = unitary.flat[idx] / expected.flat[idx]
+    np.testing.assert_allclose(unitary, expected * phase, atol=1e-8)
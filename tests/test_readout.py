@@ -0,0 +1,110 @@
+##############################################################################
+# Copyright 2021 Rigetti Computing
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+##############################################################################
+import json
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from qiskit.result import Result
+from qiskit.result.models import ExperimentResultData
+
+from qiskit_rigetti._readout import LazyExperimentResult, LazyMemory, PackedReadout, to_binary_strs
+
+SHAPES = [(0, 2), (1, 1), (5, 0), (1000, 3), (1000, 64), (100, 100)]
+
+
+def reference_binary_strs(states):
+    return ["".join(map(str, state[::-1])) for state in states]
+
+
+@pytest.mark.parametrize("num_shots,num_bits", SHAPES)
+def test_to_binary_strs(num_shots: int, num_bits: int):
+    states = np.random.default_rng(0).integers(0, 2, (num_shots, num_bits))
+
+    assert to_binary_strs(states) == reference_binary_strs(states)
+
+
+@pytest.mark.parametrize("num_shots,num_bits", SHAPES)
+def test_packed_readout(num_shots: int, num_bits: int):
+    states = np.random.default_rng(0).integers(0, 2, (num_shots, num_bits))
+
+    readout = PackedReadout(states)
+
+    assert readout.data.shape == (num_shots, (num_bits + 7) // 8)
+    assert readout.data.dtype == np.uint8
+    np.testing.assert_array_equal(readout.unpack(), states)
+    assert readout.memory() == reference_binary_strs(states)
+    assert readout.counts() == Counter(reference_binary_strs(states))
+
+
+def test_packed_readout__concatenate():
+    chunks = [np.random.default_rng(seed).integers(0, 2, (100, 10)) for seed in range(3)]
+
+    readout = PackedReadout.concatenate([PackedReadout(chunk) for chunk in chunks], num_shots=250)
+
+    assert readout.num_shots == 250
+    assert readout.num_bits == 10
+    np.testing.assert_array_equal(readout.unpack(), np.concatenate(chunks)[:250])
+
+
+def test_lazy_memory():
+    states = np.array([[0, 1], [1, 1], [0, 0]])
+    readout = PackedReadout(states)
+
+    memory = LazyMemory(readout)
+
+    assert len(memory) == 3
+    assert memory._memory is None, "memory materialized before access"
+    assert memory[0] == "10"
+    assert list(memory) == ["10", "11", "00"]
+    assert memory == ["10", "11", "00"]
+
+
+def test_lazy_experiment_result__json():
+    readout = PackedReadout(np.array([[0, 1], [1, 1]]))
+    data = ExperimentResultData(counts=readout.counts(), memory=LazyMemory(readout))
+    result = Result(
+        backend_name="backend",
+        backend_version="0.0.0",
+        qobj_id="",
+        job_id="job",
+        success=True,
+        results=[LazyExperimentResult(shots=2, success=True, data=data)],
+    )
+
+    restored = Result.from_dict(json.loads(json.dumps(result.to_dict())))
+
+    assert restored.get_memory(0) == ["10", "11"]
+    assert restored.get_counts(0) == {"10": 1, "11": 1}
+
+
+def test_lazy_experiment_result__get_counts():
+    readout = PackedReadout(np.array([[0, 1], [1, 1]]))
+    memory = LazyMemory(readout)
+    data = ExperimentResultData(counts=readout.counts(), memory=memory)
+    result = Result(
+        backend_name="backend",
+        backend_version="0.0.0",
+        qobj_id="",
+        job_id="job",
+        success=True,
+        results=[LazyExperimentResult(shots=2, success=True, data=data)],
+    )
+
+    assert result.get_counts(0) == {"10": 1, "11": 1}
+    assert result.data(0)["memory"] is memory
+    assert memory._memory is None, "memory materialized by get_counts"
@@ -0,0 +1,79 @@
+import copy
+
+import networkx as nx
+import pytest
+from pyquil.quantum_processor import NxQuantumProcessor
+from qiskit import QuantumCircuit, transpile
+
+from qiskit_rigetti._target import physical_qubits, target_from_isa
+
+
+def make_isa():
+    isa = NxQuantumProcessor(nx.from_edgelist([(0, 1), (1, 2), (2, 4)])).to_compiler_isa()
+    # NOTE: NxQuantumProcessor shares gate objects between qubits and edges; copy them so they can be changed apart
+    for qubit in isa.qubits.values():
+        qubit.gates = copy.deepcopy(qubit.gates)
+    for edge in isa.edges.values():
+        edge.gates = copy.deepcopy(edge.gates)
+    return isa
+
+
+def test_physical_qubits():
+    isa = make_isa()
+    isa.qubits["5"] = copy.deepcopy(isa.qubits["0"])
+    isa.qubits["5"].id = 5
+    isa.qubits["1"].dead = True
+
+    assert physical_qubits(isa) == [2, 4]
+
+
+def test_target_from_isa():
+    target = target_from_isa(make_isa(), description="test")
+
+    assert target.description == "test"
+    assert target.num_qubits == 4
+    assert set(target.operation_names) == {"id", "x", "sx", "sxdg", "rz", "measure", "cz", "xx_plus_yy"}
+    assert target.qargs_for_operation_name("cz") == {(0, 1), (1, 0), (1, 2), (2, 1), (2, 3), (3, 2)}
+    assert target.qargs_for_operation_name("sx") == {(0,), (1,), (2,), (3,)}
+
+
+def test_target_from_isa__dead():
+    isa = make_isa()
+    isa.qubits["0"].dead = True
+    isa.edges["1-2"].dead = True
+
+    target = target_from_isa(isa)
+
+    assert target.num_qubits == 2
+    assert target.qargs_for_operation_name("cz") == {(0, 1), (1, 0)}
+
+
+def test_target_from_isa__properties():
+    isa = make_isa()
+    rz = next(gate for gate in isa.qubits["0"].gates if gate.operator == "RZ")
+    rz.fidelity = 0.999
+    rz.duration = 20.0
+    cz = next(gate for gate in isa.edges["0-1"].gates if gate.operator == "CZ")
+    cz.fidelity = 0.95
+
+    target = target_from_isa(isa)
+
+    assert target["rz"][(0,)].error == pytest.approx(0.001)
+    assert target["rz"][(0,)].duration == pytest.approx(20e-9)
+    assert target["cz"][(0, 1)].error == pytest.approx(0.05)
+    assert target["cz"][(1, 2)] is None
+
+
+def test_target_from_isa__transpile():
+    target = target_from_isa(make_isa())
+    circuit = QuantumCircuit(3, 3)
+    circuit.h(0)
+    circuit.cx(0, 2)
+    circuit.measure(range(3), range(3))
+
+    transpiled = transpile(circuit, target=target, optimization_level=1)
+
+    assert set(transpiled.count_ops()) <= set(target.operation_names)
+    for instruction, qargs, _ in transpiled.data:
+        if len(qargs) == 2:
+            assert tuple(transpiled.find_bit(q).index for q in qargs) in target.qargs_for_operation_name("cz")